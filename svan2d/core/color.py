@@ -3,6 +3,7 @@
 import colorsys
 import math
 from enum import StrEnum
+from functools import lru_cache
 from typing import ClassVar
 
 # Type aliases
@@ -286,6 +287,11 @@ class Color:
 # Interpolation implementation (internal functions)
 # ============================================================================
 
+# Maximum number of memoized RGB -> LAB conversions; the least recently used
+# one is evicted first, so a palette larger than this only loses its rarest
+# colors instead of the whole cache
+_MAX_LAB_CACHE = 4096
+
 
 def _interpolate_rgb(start: Color, end: Color, t: float) -> ColorTuple:
     """Linear RGB interpolation - fast but can look muddy"""
@@ -346,9 +352,19 @@ def _interpolate_lab(start: Color, end: Color, t: float) -> ColorTuple:
 
 
 def _rgb_to_lab(color: Color) -> tuple[float, float, float]:
-    """Convert RGB (0-255) to LAB color space"""
+    """Convert RGB (0-255) to LAB color space
+
+    Results are memoized per (r, g, b): animated colors interpolate between
+    the same keystate colors every frame.
+    """
+    return _compute_lab(color.r, color.g, color.b)
+
+
+@lru_cache(maxsize=_MAX_LAB_CACHE)
+def _compute_lab(r: int, g: int, b: int) -> tuple[float, float, float]:
+    """RGB (0-255) to LAB conversion behind _rgb_to_lab"""
     # Normalize RGB to [0, 1]
-    r, g, b = color.r / 255, color.g / 255, color.b / 255
+    r, g, b = r / 255, g / 255, b / 255
 
     # Apply sRGB gamma correction
     r = ((r + 0.055) / 1.055) ** 2.4 if r > 0.04045 else r / 12.92
@@ -72,7 +72,11 @@ class Point2D:
 
     def lerp(self, p2: Point2D, t: float) -> Point2D:
         """Linear interpolation between two points (returns a NEW point)"""
-        return Point2D(x=_lerp(self.x, p2.x, t), y=_lerp(self.y, p2.y, t))
+        # Inlined _lerp with positional construction: this sits on every
+        # per-point morph and vertex interpolation path
+        x = self.x
+        y = self.y
+        return Point2D(x + (p2.x - x) * t, y + (p2.y - y) * t)
 
 
 Points2D = list[Point2D]
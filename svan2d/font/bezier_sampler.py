@@ -1,4 +1,9 @@
-"""Sample bezier curves to evenly-spaced vertices"""
+"""Sample bezier curves to evenly-spaced vertices
+
+Curves are evaluated in power-basis (polynomial) form: the control points
+are converted to coefficients once per curve, after which every sample is a
+short Horner evaluation instead of recomputing the Bernstein weights.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +12,33 @@ import math
 from svan2d.core.point2d import Point2D, Points2D
 
 
+def _quadratic_coefficients(
+    p0: Point2D, p1: Point2D, p2: Point2D
+) -> tuple[float, float, float, float]:
+    """Power-basis coefficients (ax, bx, ay, by) with B(t) = (a*t + b)*t + p0"""
+    return (
+        p0.x - 2 * p1.x + p2.x,
+        2 * (p1.x - p0.x),
+        p0.y - 2 * p1.y + p2.y,
+        2 * (p1.y - p0.y),
+    )
+
+
+def _cubic_coefficients(
+    p0: Point2D, p1: Point2D, p2: Point2D, p3: Point2D
+) -> tuple[float, float, float, float, float, float]:
+    """Power-basis coefficients (ax, bx, cx, ay, by, cy) with
+    B(t) = ((a*t + b)*t + c)*t + p0"""
+    return (
+        p3.x - p0.x + 3 * (p1.x - p2.x),
+        3 * (p0.x - 2 * p1.x + p2.x),
+        3 * (p1.x - p0.x),
+        p3.y - p0.y + 3 * (p1.y - p2.y),
+        3 * (p0.y - 2 * p1.y + p2.y),
+        3 * (p1.y - p0.y),
+    )
+
+
 def sample_quadratic_bezier(
     p0: Point2D, p1: Point2D, p2: Point2D, num_samples: int
 ) -> Points2D:
@@ -18,14 +50,12 @@ def sample_quadratic_bezier(
         p2: End point.
         num_samples: Number of samples (including start, excluding end).
     """
+    ax, bx, ay, by = _quadratic_coefficients(p0, p1, p2)
+    x0, y0 = p0.x, p0.y
     points = []
     for i in range(num_samples):
         t = i / num_samples
-        # B(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
-        mt = 1 - t
-        x = mt * mt * p0.x + 2 * mt * t * p1.x + t * t * p2.x
-        y = mt * mt * p0.y + 2 * mt * t * p1.y + t * t * p2.y
-        points.append(Point2D(x, y))
+        points.append(Point2D((ax * t + bx) * t + x0, (ay * t + by) * t + y0))
     return points
 
 
@@ -41,90 +71,79 @@ def sample_cubic_bezier(
         p3: End point.
         num_samples: Number of samples (including start, excluding end).
     """
+    ax, bx, cx, ay, by, cy = _cubic_coefficients(p0, p1, p2, p3)
+    x0, y0 = p0.x, p0.y
     points = []
     for i in range(num_samples):
         t = i / num_samples
-        # B(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
-        mt = 1 - t
-        mt2 = mt * mt
-        mt3 = mt2 * mt
-        t2 = t * t
-        t3 = t2 * t
-        x = mt3 * p0.x + 3 * mt2 * t * p1.x + 3 * mt * t2 * p2.x + t3 * p3.x
-        y = mt3 * p0.y + 3 * mt2 * t * p1.y + 3 * mt * t2 * p2.y + t3 * p3.y
-        points.append(Point2D(x, y))
+        points.append(
+            Point2D(
+                ((ax * t + bx) * t + cx) * t + x0,
+                ((ay * t + by) * t + cy) * t + y0,
+            )
+        )
     return points
 
 
-def estimate_quadratic_arc_length(p0: Point2D, p1: Point2D, p2: Point2D, num_segments: int = 20) -> float:
-    """Estimate arc length of a quadratic bezier by sampling."""
+def _quadratic_arc_lengths(
+    p0: Point2D, p1: Point2D, p2: Point2D, num_segments: int
+) -> list[float]:
+    """Cumulative chord lengths at t = i / num_segments for i in 0..num_segments"""
+    ax, bx, ay, by = _quadratic_coefficients(p0, p1, p2)
+    x0, y0 = p0.x, p0.y
+    px, py = x0, y0
+    arc_lengths = [0.0]
     length = 0.0
-    prev = p0
     for i in range(1, num_segments + 1):
         t = i / num_segments
-        mt = 1 - t
-        x = mt * mt * p0.x + 2 * mt * t * p1.x + t * t * p2.x
-        y = mt * mt * p0.y + 2 * mt * t * p1.y + t * t * p2.y
-        curr = Point2D(x, y)
-        length += math.sqrt((curr.x - prev.x) ** 2 + (curr.y - prev.y) ** 2)
-        prev = curr
-    return length
-
-
-def estimate_cubic_arc_length(p0: Point2D, p1: Point2D, p2: Point2D, p3: Point2D, num_segments: int = 20) -> float:
-    """Estimate arc length of a cubic bezier by sampling."""
+        x = (ax * t + bx) * t + x0
+        y = (ay * t + by) * t + y0
+        length += math.sqrt((x - px) ** 2 + (y - py) ** 2)
+        arc_lengths.append(length)
+        px, py = x, y
+    return arc_lengths
+
+
+def _cubic_arc_lengths(
+    p0: Point2D, p1: Point2D, p2: Point2D, p3: Point2D, num_segments: int
+) -> list[float]:
+    """Cumulative chord lengths at t = i / num_segments for i in 0..num_segments"""
+    ax, bx, cx, ay, by, cy = _cubic_coefficients(p0, p1, p2, p3)
+    x0, y0 = p0.x, p0.y
+    px, py = x0, y0
+    arc_lengths = [0.0]
     length = 0.0
-    prev = p0
     for i in range(1, num_segments + 1):
         t = i / num_segments
-        mt = 1 - t
-        mt2 = mt * mt
-        mt3 = mt2 * mt
-        t2 = t * t
-        t3 = t2 * t
-        x = mt3 * p0.x + 3 * mt2 * t * p1.x + 3 * mt * t2 * p2.x + t3 * p3.x
-        y = mt3 * p0.y + 3 * mt2 * t * p1.y + 3 * mt * t2 * p2.y + t3 * p3.y
-        curr = Point2D(x, y)
-        length += math.sqrt((curr.x - prev.x) ** 2 + (curr.y - prev.y) ** 2)
-        prev = curr
-    return length
+        x = ((ax * t + bx) * t + cx) * t + x0
+        y = ((ay * t + by) * t + cy) * t + y0
+        length += math.sqrt((x - px) ** 2 + (y - py) ** 2)
+        arc_lengths.append(length)
+        px, py = x, y
+    return arc_lengths
 
 
-def estimate_line_arc_length(p0: Point2D, p1: Point2D) -> float:
-    """Calculate arc length of a line segment."""
-    return math.sqrt((p1.x - p0.x) ** 2 + (p1.y - p0.y) ** 2)
+def estimate_quadratic_arc_length(p0: Point2D, p1: Point2D, p2: Point2D, num_segments: int = 20) -> float:
+    """Estimate arc length of a quadratic bezier by sampling."""
+    return _quadratic_arc_lengths(p0, p1, p2, num_segments)[-1]
 
 
-def sample_quadratic_arc_length(
-    p0: Point2D, p1: Point2D, p2: Point2D, num_samples: int
-) -> Points2D:
-    """Sample a quadratic bezier at equal arc-length intervals.
+def estimate_cubic_arc_length(p0: Point2D, p1: Point2D, p2: Point2D, p3: Point2D, num_segments: int = 20) -> float:
+    """Estimate arc length of a cubic bezier by sampling."""
+    return _cubic_arc_lengths(p0, p1, p2, p3, num_segments)[-1]
 
-    Uses adaptive sampling to find t values that produce evenly-spaced points.
-    """
-    if num_samples <= 1:
-        return [p0]
 
-    # Build arc-length lookup table
-    table_size = max(100, num_samples * 5)
-    arc_lengths = [0.0]
-    prev = p0
+def estimate_line_arc_length(p0: Point2D, p1: Point2D) -> float:
+    """Calculate arc length of a line segment."""
+    return math.sqrt((p1.x - p0.x) ** 2 + (p1.y - p0.y) ** 2)
 
-    for i in range(1, table_size + 1):
-        t = i / table_size
-        mt = 1 - t
-        x = mt * mt * p0.x + 2 * mt * t * p1.x + t * t * p2.x
-        y = mt * mt * p0.y + 2 * mt * t * p1.y + t * t * p2.y
-        curr = Point2D(x, y)
-        arc_lengths.append(arc_lengths[-1] + math.sqrt((curr.x - prev.x) ** 2 + (curr.y - prev.y) ** 2))
-        prev = curr
 
+def _arc_length_parameters(
+    arc_lengths: list[float], table_size: int, num_samples: int
+) -> list[float]:
+    """Map equal arc-length fractions to t values using a cumulative length table"""
     total_length = arc_lengths[-1]
-    if total_length < 1e-10:
-        return [p0] * num_samples
-
-    # Sample at equal arc-length intervals
-    points = []
+    ts = []
     for i in range(num_samples):
         target_length = (i / num_samples) * total_length
 
@@ -140,16 +159,36 @@ def sample_quadratic_arc_length(
         # Linear interpolation between table entries
         if high < len(arc_lengths) and arc_lengths[high] != arc_lengths[low]:
             frac = (target_length - arc_lengths[low]) / (arc_lengths[high] - arc_lengths[low])
-            t = (low + frac) / table_size
+            ts.append((low + frac) / table_size)
         else:
-            t = low / table_size
+            ts.append(low / table_size)
+    return ts
 
-        mt = 1 - t
-        x = mt * mt * p0.x + 2 * mt * t * p1.x + t * t * p2.x
-        y = mt * mt * p0.y + 2 * mt * t * p1.y + t * t * p2.y
-        points.append(Point2D(x, y))
 
-    return points
+def sample_quadratic_arc_length(
+    p0: Point2D, p1: Point2D, p2: Point2D, num_samples: int
+) -> Points2D:
+    """Sample a quadratic bezier at equal arc-length intervals.
+
+    Uses adaptive sampling to find t values that produce evenly-spaced points.
+    """
+    if num_samples <= 1:
+        return [p0]
+
+    # Build arc-length lookup table
+    table_size = max(100, num_samples * 5)
+    arc_lengths = _quadratic_arc_lengths(p0, p1, p2, table_size)
+
+    if arc_lengths[-1] < 1e-10:
+        return [p0] * num_samples
+
+    # Sample at equal arc-length intervals
+    ax, bx, ay, by = _quadratic_coefficients(p0, p1, p2)
+    x0, y0 = p0.x, p0.y
+    return [
+        Point2D((ax * t + bx) * t + x0, (ay * t + by) * t + y0)
+        for t in _arc_length_parameters(arc_lengths, table_size, num_samples)
+    ]
 
 
 def sample_cubic_arc_length(
@@ -164,57 +203,21 @@ def sample_cubic_arc_length(
 
     # Build arc-length lookup table
     table_size = max(100, num_samples * 5)
-    arc_lengths = [0.0]
-    prev = p0
-
-    for i in range(1, table_size + 1):
-        t = i / table_size
-        mt = 1 - t
-        mt2 = mt * mt
-        mt3 = mt2 * mt
-        t2 = t * t
-        t3 = t2 * t
-        x = mt3 * p0.x + 3 * mt2 * t * p1.x + 3 * mt * t2 * p2.x + t3 * p3.x
-        y = mt3 * p0.y + 3 * mt2 * t * p1.y + 3 * mt * t2 * p2.y + t3 * p3.y
-        curr = Point2D(x, y)
-        arc_lengths.append(arc_lengths[-1] + math.sqrt((curr.x - prev.x) ** 2 + (curr.y - prev.y) ** 2))
-        prev = curr
+    arc_lengths = _cubic_arc_lengths(p0, p1, p2, p3, table_size)
 
-    total_length = arc_lengths[-1]
-    if total_length < 1e-10:
+    if arc_lengths[-1] < 1e-10:
         return [p0] * num_samples
 
     # Sample at equal arc-length intervals
-    points = []
-    for i in range(num_samples):
-        target_length = (i / num_samples) * total_length
-
-        # Binary search for t
-        low, high = 0, table_size
-        while high - low > 1:
-            mid = (low + high) // 2
-            if arc_lengths[mid] < target_length:
-                low = mid
-            else:
-                high = mid
-
-        # Linear interpolation between table entries
-        if high < len(arc_lengths) and arc_lengths[high] != arc_lengths[low]:
-            frac = (target_length - arc_lengths[low]) / (arc_lengths[high] - arc_lengths[low])
-            t = (low + frac) / table_size
-        else:
-            t = low / table_size
-
-        mt = 1 - t
-        mt2 = mt * mt
-        mt3 = mt2 * mt
-        t2 = t * t
-        t3 = t2 * t
-        x = mt3 * p0.x + 3 * mt2 * t * p1.x + 3 * mt * t2 * p2.x + t3 * p3.x
-        y = mt3 * p0.y + 3 * mt2 * t * p1.y + 3 * mt * t2 * p2.y + t3 * p3.y
-        points.append(Point2D(x, y))
-
-    return points
+    ax, bx, cx, ay, by, cy = _cubic_coefficients(p0, p1, p2, p3)
+    x0, y0 = p0.x, p0.y
+    return [
+        Point2D(
+            ((ax * t + bx) * t + cx) * t + x0,
+            ((ay * t + by) * t + cy) * t + y0,
+        )
+        for t in _arc_length_parameters(arc_lengths, table_size, num_samples)
+    ]
 
 
 def resample_to_vertex_count(points: Points2D, target_count: int) -> Points2D:
@@ -53,6 +53,21 @@ def _contour_to_svg_path(
     if contour.is_empty():
         return ""
 
+    segments = contour.segments
+    if all(segment.type == "line" for segment in segments):
+        return _line_contour_to_svg_path(segments, scale, offset_x, offset_y, flip_y)
+    return _segment_contour_to_svg_path(segments, scale, offset_x, offset_y, flip_y)
+
+
+def _segment_contour_to_svg_path(
+    segments: list,
+    scale: float,
+    offset_x: float,
+    offset_y: float,
+    flip_y: bool,
+) -> str:
+    """Emit a contour segment by segment, for any mix of segment types."""
+
     def tx(x: float) -> float:
         return x * scale + offset_x
 
@@ -61,57 +76,102 @@ def _contour_to_svg_path(
             return -y * scale + offset_y
         return y * scale + offset_y
 
-    commands = []
+    commands: list[str] = []
+    append = commands.append
 
     # For the first segment, we need a starting point
     # The contour starts at the point BEFORE the first segment
     # We'll compute it from the last segment's endpoint (since contours are closed)
-    if contour.segments:
-        last_seg = contour.segments[-1]
-        start_point = last_seg.points[-1]
-        commands.append(f"M {tx(start_point.x):.3f} {ty(start_point.y):.3f}")
-
-    for segment in contour.segments:
-        if segment.type == "line":
-            end = segment.points[0]
-            commands.append(f"L {tx(end.x):.3f} {ty(end.y):.3f}")
-
-        elif segment.type == "qcurve":
-            if len(segment.points) == 1:
-                # Single point means it's the end point of a degenerate quadratic
-                end = segment.points[0]
-                commands.append(f"L {tx(end.x):.3f} {ty(end.y):.3f}")
-            elif len(segment.points) == 2:
-                ctrl, end = segment.points
-                commands.append(
-                    f"Q {tx(ctrl.x):.3f} {ty(ctrl.y):.3f} "
-                    f"{tx(end.x):.3f} {ty(end.y):.3f}"
-                )
-            else:
-                # Multiple control points - should have been split in extractor
-                # but handle gracefully
-                for i in range(0, len(segment.points) - 1, 2):
-                    ctrl = segment.points[i]
-                    end = segment.points[i + 1] if i + 1 < len(segment.points) else segment.points[-1]
-                    commands.append(
-                        f"Q {tx(ctrl.x):.3f} {ty(ctrl.y):.3f} "
-                        f"{tx(end.x):.3f} {ty(end.y):.3f}"
-                    )
-
-        elif segment.type == "curve":
-            if len(segment.points) == 3:
-                ctrl1, ctrl2, end = segment.points
-                commands.append(
-                    f"C {tx(ctrl1.x):.3f} {ty(ctrl1.y):.3f} "
-                    f"{tx(ctrl2.x):.3f} {ty(ctrl2.y):.3f} "
-                    f"{tx(end.x):.3f} {ty(end.y):.3f}"
-                )
-            else:
-                # Fallback for unexpected point count
-                end = segment.points[-1]
-                commands.append(f"L {tx(end.x):.3f} {ty(end.y):.3f}")
+    start_point = segments[-1].points[-1]
+    append(f"M {tx(start_point.x):.3f} {ty(start_point.y):.3f}")
+
+    # Dispatch on (type, point count) once per segment; the common shapes hit
+    # an exact key, anything else falls back to the per-type handler.
+    handlers = _SEGMENT_HANDLERS
+    fallbacks = _SEGMENT_FALLBACKS
+    for segment in segments:
+        seg_type = segment.type
+        pts = segment.points
+        handler = handlers.get((seg_type, len(pts))) or fallbacks.get(seg_type)
+        if handler is not None:
+            handler(pts, append, tx, ty)
 
     # Close the path
     commands.append("Z")
 
     return " ".join(commands)
+
+
+def _line_contour_to_svg_path(
+    segments: list,
+    scale: float,
+    offset_x: float,
+    offset_y: float,
+    flip_y: bool,
+) -> str:
+    """Emit an all-line contour (a polygon) with a single format operation."""
+    scale_y = -scale if flip_y else scale
+
+    start = segments[-1].points[-1]
+    coords = [start.x * scale + offset_x, start.y * scale_y + offset_y]
+    for segment in segments:
+        end = segment.points[0]
+        coords.append(end.x * scale + offset_x)
+        coords.append(end.y * scale_y + offset_y)
+
+    template = "M %.3f %.3f " + "L %.3f %.3f " * len(segments) + "Z"
+    return template % tuple(coords)
+
+
+# ============================================================================
+# Segment handlers: (points, append, tx, ty) -> None
+# ============================================================================
+
+
+def _emit_line(pts, append, tx, ty) -> None:
+    end = pts[0]
+    append(f"L {tx(end.x):.3f} {ty(end.y):.3f}")
+
+
+def _emit_line_to_last(pts, append, tx, ty) -> None:
+    end = pts[-1]
+    append(f"L {tx(end.x):.3f} {ty(end.y):.3f}")
+
+
+def _emit_quad(pts, append, tx, ty) -> None:
+    ctrl, end = pts
+    append(f"Q {tx(ctrl.x):.3f} {ty(ctrl.y):.3f} {tx(end.x):.3f} {ty(end.y):.3f}")
+
+
+def _emit_quad_multi(pts, append, tx, ty) -> None:
+    # Multiple control points - should have been split in extractor
+    # but handle gracefully
+    n = len(pts)
+    for i in range(0, n - 1, 2):
+        ctrl = pts[i]
+        end = pts[i + 1]
+        append(
+            f"Q {tx(ctrl.x):.3f} {ty(ctrl.y):.3f} {tx(end.x):.3f} {ty(end.y):.3f}"
+        )
+
+
+def _emit_cubic(pts, append, tx, ty) -> None:
+    ctrl1, ctrl2, end = pts
+    append(
+        f"C {tx(ctrl1.x):.3f} {ty(ctrl1.y):.3f} "
+        f"{tx(ctrl2.x):.3f} {ty(ctrl2.y):.3f} "
+        f"{tx(end.x):.3f} {ty(end.y):.3f}"
+    )
+
+
+_SEGMENT_HANDLERS = {
+    ("qcurve", 1): _emit_line,  # degenerate quadratic: just the end point
+    ("qcurve", 2): _emit_quad,
+    ("curve", 3): _emit_cubic,
+}
+
+_SEGMENT_FALLBACKS = {
+    "line": _emit_line,
+    "qcurve": _emit_quad_multi,
+    "curve": _emit_line_to_last,  # unexpected point count
+}
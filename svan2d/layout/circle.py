@@ -1,10 +1,9 @@
 """Circle layout state function"""
 
 import math
-from dataclasses import replace
 from collections.abc import Callable
 
-from svan2d.primitive.state.base import States
+from svan2d.primitive.state.base import States, replace_state
 from svan2d.core.point2d import Point2D
 
 from .enums import ElementAlignment
@@ -46,8 +45,6 @@ def circle(
     if not states:
         return []
 
-    result = []
-
     # Use custom angles if provided, otherwise calculate even distribution
     if angles is not None:
         if len(angles) < len(states):
@@ -64,42 +61,54 @@ def circle(
             for i in range(num_elements)
         ]
 
+    # Loop invariants hoisted out of the per-element body
+    cx = center.x
+    cy = center.y
+    cos = math.cos
+    sin = math.sin
+    radians = math.radians
+    preserve = alignment not in (ElementAlignment.LAYOUT, ElementAlignment.UPRIGHT)
+    layout_aligned = alignment == ElementAlignment.LAYOUT
+
     # Position each element at its calculated angle
+    result: States = []
+    append = result.append
     for i, state in enumerate(states):
         angle = rotation + element_angles[i]
 
         # Convert to radians for math functions
-        angle_rad = math.radians(angle)
+        angle_rad = radians(angle)
 
         # Calculate radius for this element
         r = radius_fn(i, radius) if radius_fn else radius
 
         # Cartesian coordinates: 0° = East, counter-clockwise positive
-        x = center.x + r * math.cos(angle_rad)
-        y = center.y + r * math.sin(angle_rad)
-
-        # Calculate additional rotation (function-based or static)
-        additional_rotation = (
-            element_rotation_offset_fn(angle)
-            if element_rotation_offset_fn
-            else element_rotation_offset
-        )
+        x = cx + r * cos(angle_rad)
+        y = cy + r * sin(angle_rad)
 
         # Calculate element rotation based on alignment mode
-        if alignment == ElementAlignment.PRESERVE:
+        if preserve:
             element_angle = state.rotation
-        elif alignment == ElementAlignment.LAYOUT:
-            # Bottom faces center: element_angle = - position_angle + 90
-            element_angle = angle - 90 + additional_rotation
-        elif alignment == ElementAlignment.UPRIGHT:
-            # Start from upright position + additional rotation
-            element_angle = additional_rotation
         else:
-            element_angle = state.rotation
-
-        # Create new state with circular position and rotation, preserving all other attributes
-        new_state = replace(state, pos=Point2D(x, y), rotation=element_angle)
-        result.append(new_state)
+            # Calculate additional rotation (function-based or static)
+            additional_rotation = (
+                element_rotation_offset_fn(angle)
+                if element_rotation_offset_fn
+                else element_rotation_offset
+            )
+            if layout_aligned:
+                # Bottom faces center: element_angle = - position_angle + 90
+                element_angle = angle - 90 + additional_rotation
+            else:
+                # UPRIGHT: start from upright position + additional rotation
+                element_angle = additional_rotation
+
+        # Create new state with circular position and rotation, preserving all
+        # other attributes; whether a class can skip __init__ when cloned is
+        # resolved once per class by replace_state, not per element
+        append(
+            replace_state(state, {"pos": Point2D(x, y), "rotation": element_angle})
+        )
 
     return result
 
@@ -2,10 +2,13 @@
 
 from .builders import (
     circle_as_beziers,
+    circle_as_beziers_array,
     cubic_curve,
     line,
     quadratic_curve,
     rectangle,
+    rectangle_array,
+    rectangles,
 )
 from .commands import (
     ClosePath,
@@ -32,5 +35,8 @@ __all__ = [
     'quadratic_curve',
     'cubic_curve',
     'rectangle',
+    'rectangles',
     'circle_as_beziers',
+    'rectangle_array',
+    'circle_as_beziers_array',
 ]
\ No newline at end of file
@@ -1,5 +1,8 @@
 """SVG path builder functions for common shapes"""
 
+from array import array
+from collections.abc import Sequence
+
 from svan2d.core.point2d import Point2D
 
 from .commands import (
@@ -49,36 +52,120 @@ def rectangle(pos: Point2D, width: float, height: float) -> SVGPath:
     )
 
 
+def rectangles(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    widths: Sequence[float],
+    heights: Sequence[float],
+) -> list[SVGPath]:
+    """Create many rectangle paths at once from flat coordinate columns
+
+    Equivalent to ``[rectangle(Point2D(x, y), w, h) for ...]`` but avoids the
+    per-shape function call and attribute lookups, which matters when
+    generating thousands of shapes. Any sequences of floats work, including
+    NumPy arrays.
+
+    Raises:
+        ValueError: If the input columns differ in length
+    """
+    n = len(xs)
+    if not (len(ys) == len(widths) == len(heights) == n):
+        raise ValueError(
+            f"Column lengths differ: xs={n}, ys={len(ys)}, "
+            f"widths={len(widths)}, heights={len(heights)}"
+        )
+
+    _Point2D = Point2D
+    _SVGPath = SVGPath
+    _MoveTo = MoveTo
+    _LineTo = LineTo
+    _ClosePath = ClosePath
+
+    result: list[SVGPath] = [None] * n  # type: ignore[list-item]
+    for i, (x, y, w, h) in enumerate(zip(xs, ys, widths, heights)):
+        x2 = x + w
+        y2 = y + h
+        result[i] = _SVGPath(
+            [
+                _MoveTo(_Point2D(x, y)),
+                _LineTo(_Point2D(x2, y)),
+                _LineTo(_Point2D(x2, y2)),
+                _LineTo(_Point2D(x, y2)),
+                _ClosePath(),
+            ]
+        )
+    return result
+
+
 def circle_as_beziers(center: Point2D, radius: float) -> SVGPath:
     """Create a circle path using cubic Bezier curves
 
     Uses the magic constant 0.551915024494 for circle approximation
     """
-    k = 0.551915024494  # Magic constant for circle with cubic beziers
+    c = _circle_bezier_coords(center.x, center.y, radius)
 
     return SVGPath(
         [
-            MoveTo(Point2D(center.x, center.y - radius)),  # Top
+            MoveTo(Point2D(c[0], c[1])),  # Top
             CubicBezier(
-                Point2D(center.x + k * radius, center.y - radius),
-                Point2D(center.x + radius, center.y - k * radius),
-                Point2D(center.x + radius, center.y),
+                Point2D(c[2], c[3]), Point2D(c[4], c[5]), Point2D(c[6], c[7])
             ),  # Right
             CubicBezier(
-                Point2D(center.x + radius, center.y + k * radius),
-                Point2D(center.x + k * radius, center.y + radius),
-                Point2D(center.x, center.y + radius),
+                Point2D(c[8], c[9]), Point2D(c[10], c[11]), Point2D(c[12], c[13])
             ),  # Bottom
             CubicBezier(
-                Point2D(center.x - k * radius, center.y + radius),
-                Point2D(center.x - radius, center.y + k * radius),
-                Point2D(center.x - radius, center.y),
+                Point2D(c[14], c[15]), Point2D(c[16], c[17]), Point2D(c[18], c[19])
             ),  # Left
             CubicBezier(
-                Point2D(center.x - radius, center.y - k * radius),
-                Point2D(center.x - k * radius, center.y - radius),
-                Point2D(center.x, center.y - radius),
+                Point2D(c[20], c[21]), Point2D(c[22], c[23]), Point2D(c[24], c[25])
             ),  # Back to top
             ClosePath(),
         ]
     )
+
+
+# ============================================================================
+# Packed coordinate builders
+# ============================================================================
+#
+# These return the geometry as a flat ``array('d')`` of interleaved x, y
+# values instead of Point2D/command objects. The buffer is contiguous, so
+# ``numpy.frombuffer(buf).reshape(-1, 2)`` views it without copying.
+
+
+def rectangle_array(pos: Point2D, width: float, height: float) -> array:
+    """Corner coordinates of a rectangle as a packed buffer
+
+    Returns:
+        ``array('d')`` of 8 floats: the 4 corners (x, y) in the same order
+        as ``rectangle()`` visits them
+    """
+    x = pos.x
+    y = pos.y
+    x2 = x + width
+    y2 = y + height
+    return array("d", (x, y, x2, y, x2, y2, x, y2))
+
+
+def circle_as_beziers_array(center: Point2D, radius: float) -> array:
+    """Anchor and control points of ``circle_as_beziers()`` as a packed buffer
+
+    Returns:
+        ``array('d')`` of 26 floats: 13 points (x, y), the start anchor
+        followed by (control1, control2, anchor) for each of the 4 cubics
+    """
+    return array("d", _circle_bezier_coords(center.x, center.y, radius))
+
+
+def _circle_bezier_coords(cx: float, cy: float, radius: float) -> tuple[float, ...]:
+    """Flat (x, y) coordinates of the 13 points of a 4-cubic circle"""
+    k = 0.551915024494  # Magic constant for circle with cubic beziers
+    kr = k * radius
+
+    return (
+        cx, cy - radius,  # Top
+        cx + kr, cy - radius, cx + radius, cy - kr, cx + radius, cy,  # Right
+        cx + radius, cy + kr, cx + kr, cy + radius, cx, cy + radius,  # Bottom
+        cx - kr, cy + radius, cx - radius, cy + kr, cx - radius, cy,  # Left
+        cx - radius, cy - kr, cx - kr, cy - radius, cx, cy - radius,  # Back to top
+    )  # fmt: skip
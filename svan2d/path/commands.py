@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from svan2d.core.point2d import Point2D
 
 
-@dataclass
+@dataclass(slots=True)
 class PathCommand(ABC):
     """Abstract base class for SVG path commands"""
 
@@ -33,16 +33,19 @@ class PathCommand(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveTo(PathCommand):
     """M or m command - Move to a point"""
 
     pos: Point2D
     absolute: bool = True
 
+    _FMT = "M {},{}".format
+    _FMT_REL = "m {},{}".format
+
     def to_string(self) -> str:
-        cmd = "M" if self.absolute else "m"
-        return f"{cmd} {self.pos.x},{self.pos.y}"
+        pos = self.pos
+        return (self._FMT if self.absolute else self._FMT_REL)(pos.x, pos.y)
 
     def to_absolute(self, current_pos: Point2D) -> MoveTo:
         if self.absolute:
@@ -63,16 +66,19 @@ class MoveTo(PathCommand):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LineTo(PathCommand):
     """L or l command - Draw a line to a point"""
 
     pos: Point2D
     absolute: bool = True
 
+    _FMT = "L {},{}".format
+    _FMT_REL = "l {},{}".format
+
     def to_string(self) -> str:
-        cmd = "L" if self.absolute else "l"
-        return f"{cmd} {self.pos.x},{self.pos.y}"
+        pos = self.pos
+        return (self._FMT if self.absolute else self._FMT_REL)(pos.x, pos.y)
 
     def to_absolute(self, current_pos: Point2D) -> LineTo:
         if self.absolute:
@@ -96,16 +102,18 @@ class LineTo(PathCommand):
 # --- Horizontal and Vertical Lines ---
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalLine(PathCommand):
     """H or h command - Draw a horizontal line to a new x coordinate"""
 
     x: float
     absolute: bool = True
 
+    _FMT = "H {}".format
+    _FMT_REL = "h {}".format
+
     def to_string(self) -> str:
-        cmd = "H" if self.absolute else "h"
-        return f"{cmd} {self.x}"
+        return (self._FMT if self.absolute else self._FMT_REL)(self.x)
 
     def to_absolute(self, current_pos: Point2D) -> LineTo:
         """Converts to a standard LineTo command with the current y-coordinate"""
@@ -126,16 +134,18 @@ class HorizontalLine(PathCommand):
         return HorizontalLine(x=self.x + (other.x - self.x) * t, absolute=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class VerticalLine(PathCommand):
     """V or v command - Draw a vertical line to a new y coordinate"""
 
     y: float
     absolute: bool = True
 
+    _FMT = "V {}".format
+    _FMT_REL = "v {}".format
+
     def to_string(self) -> str:
-        cmd = "V" if self.absolute else "v"
-        return f"{cmd} {self.y}"
+        return (self._FMT if self.absolute else self._FMT_REL)(self.y)
 
     def to_absolute(self, current_pos: Point2D) -> LineTo:
         """Converts to a standard LineTo command with the current x-coordinate"""
@@ -159,7 +169,7 @@ class VerticalLine(PathCommand):
 # --- Bezier Curves ---
 
 
-@dataclass
+@dataclass(slots=True)
 class QuadraticBezier(PathCommand):
     """Q or q command - Quadratic Bezier curve"""
 
@@ -167,9 +177,13 @@ class QuadraticBezier(PathCommand):
     pos: Point2D = Point2D(0, 0)
     absolute: bool = True
 
+    _FMT = "Q {},{} {},{}".format
+    _FMT_REL = "q {},{} {},{}".format
+
     def to_string(self) -> str:
-        cmd = "Q" if self.absolute else "q"
-        return f"{cmd} {self.center.x},{self.center.y} {self.pos.x},{self.pos.y}"
+        c = self.center
+        p = self.pos
+        return (self._FMT if self.absolute else self._FMT_REL)(c.x, c.y, p.x, p.y)
 
     def to_absolute(self, current_pos: Point2D) -> QuadraticBezier:
         if self.absolute:
@@ -195,7 +209,7 @@ class QuadraticBezier(PathCommand):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CubicBezier(PathCommand):
     """C or c command - Cubic Bezier curve"""
 
@@ -204,9 +218,16 @@ class CubicBezier(PathCommand):
     pos: Point2D
     absolute: bool = True
 
+    _FMT = "C {},{} {},{} {},{}".format
+    _FMT_REL = "c {},{} {},{} {},{}".format
+
     def to_string(self) -> str:
-        cmd = "C" if self.absolute else "c"
-        return f"{cmd} {self.center1.x},{self.center1.y} {self.center2.x},{self.center2.y} {self.pos.x},{self.pos.y}"
+        c1 = self.center1
+        c2 = self.center2
+        p = self.pos
+        return (self._FMT if self.absolute else self._FMT_REL)(
+            c1.x, c1.y, c2.x, c2.y, p.x, p.y
+        )
 
     def to_absolute(self, current_pos: Point2D) -> CubicBezier:
         if self.absolute:
@@ -239,16 +260,19 @@ class CubicBezier(PathCommand):
 # --- Smooth Bezier Curves ---
 
 
-@dataclass
+@dataclass(slots=True)
 class SmoothQuadraticBezier(PathCommand):
     """T or t command - Smooth Quadratic Bezier curve (T = QuadraticBezier with reflected control point)"""
 
     pos: Point2D
     absolute: bool = True
 
+    _FMT = "T {},{}".format
+    _FMT_REL = "t {},{}".format
+
     def to_string(self) -> str:
-        cmd = "T" if self.absolute else "t"
-        return f"{cmd} {self.pos.x},{self.pos.y}"
+        pos = self.pos
+        return (self._FMT if self.absolute else self._FMT_REL)(pos.x, pos.y)
 
     def to_absolute(self, current_pos: Point2D) -> SmoothQuadraticBezier:
         if self.absolute:
@@ -273,7 +297,7 @@ class SmoothQuadraticBezier(PathCommand):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SmoothCubicBezier(PathCommand):
     """S or s command - Smooth Cubic Bezier curve (S = CubicBezier with reflected control point 1)"""
 
@@ -281,9 +305,13 @@ class SmoothCubicBezier(PathCommand):
     pos: Point2D
     absolute: bool = True
 
+    _FMT = "S {},{} {},{}".format
+    _FMT_REL = "s {},{} {},{}".format
+
     def to_string(self) -> str:
-        cmd = "S" if self.absolute else "s"
-        return f"{cmd} {self.center.x},{self.center.y} {self.pos.x},{self.pos.y}"
+        c = self.center
+        p = self.pos
+        return (self._FMT if self.absolute else self._FMT_REL)(c.x, c.y, p.x, p.y)
 
     def to_absolute(self, current_pos: Point2D) -> SmoothCubicBezier:
         if self.absolute:
@@ -314,7 +342,7 @@ class SmoothCubicBezier(PathCommand):
 # --- Arc ---
 
 
-@dataclass
+@dataclass(slots=True)
 class Arc(PathCommand):
     """A or a command - Elliptical Arc curve"""
 
@@ -326,12 +354,20 @@ class Arc(PathCommand):
     pos: Point2D
     absolute: bool = True
 
+    _FMT = "A {},{} {} {},{} {},{}".format
+    _FMT_REL = "a {},{} {} {},{} {},{}".format
+
     def to_string(self) -> str:
-        cmd = "A" if self.absolute else "a"
+        p = self.pos
         # Flags (large_arc_flag, sweep_flag) are 0 or 1 integers
-        return (
-            f"{cmd} {self.rx},{self.ry} {self.x_axis_rotation} "
-            f"{self.large_arc_flag},{self.sweep_flag} {self.pos.x},{self.pos.y}"
+        return (self._FMT if self.absolute else self._FMT_REL)(
+            self.rx,
+            self.ry,
+            self.x_axis_rotation,
+            self.large_arc_flag,
+            self.sweep_flag,
+            p.x,
+            p.y,
         )
 
     def to_absolute(self, current_pos: Point2D) -> Arc:
@@ -359,26 +395,26 @@ class Arc(PathCommand):
         # Interpolate all numeric parameters. Flags (0/1) are usually kept constant
         # during simple interpolation, or one path dominates for the whole morph.
         # We will interpolate them here, and rely on rounding/clamping later if needed.
+        rx = self.rx
+        ry = self.ry
+        rot = self.x_axis_rotation
+        large = self.large_arc_flag
+        sweep = self.sweep_flag
         return Arc(
-            rx=self.rx + (other.rx - self.rx) * t,
-            ry=self.ry + (other.ry - self.ry) * t,
-            x_axis_rotation=self.x_axis_rotation
-            + (other.x_axis_rotation - self.x_axis_rotation) * t,
-            large_arc_flag=round(
-                self.large_arc_flag + (other.large_arc_flag - self.large_arc_flag) * t
-            ),
-            sweep_flag=round(
-                self.sweep_flag + (other.sweep_flag - self.sweep_flag) * t
-            ),
-            pos=self.pos.lerp(other.pos, t),
-            absolute=True,
+            rx + (other.rx - rx) * t,
+            ry + (other.ry - ry) * t,
+            rot + (other.x_axis_rotation - rot) * t,
+            round(large + (other.large_arc_flag - large) * t),
+            round(sweep + (other.sweep_flag - sweep) * t),
+            self.pos.lerp(other.pos, t),
+            True,
         )
 
 
 # --- Close Path ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosePath(PathCommand):
     """Z or z command - Close the path"""
 
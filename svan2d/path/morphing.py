@@ -14,7 +14,9 @@ not as geometric primitives. This makes interpolation trivial.
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TextIO
 
 from svan2d.core.point2d import Point2D
 from svan2d.path.commands import (
@@ -121,58 +123,85 @@ def convert_to_poly_bezier(path: SVGPath) -> PolyBezier:
     current_pos = Point2D(0, 0)
     start_pos = Point2D(0, 0)
 
-    for cmd in path.commands:
-        abs_cmd = cmd.to_absolute(current_pos)
+    # The (cached) absolute form already has H/V promoted to LineTo and
+    # unshort() expands S/T to C/Q, so this loop only sees absolute
+    # MoveTo/LineTo/CubicBezier/QuadraticBezier/ClosePath commands.
+    # Dispatch on the exact command type once per command instead of a
+    # chain of isinstance checks.
+    handlers = _POLY_BEZIER_HANDLERS
+    for abs_cmd in path.unshort().commands:
+        handler = handlers.get(type(abs_cmd))
+        if handler is not None:
+            current_pos, start_pos = handler(abs_cmd, current_pos, start_pos, data)
 
-        if isinstance(abs_cmd, MoveTo):
-            # Start a new subpath
-            current_pos = abs_cmd.pos
-            start_pos = current_pos
-
-            # If this is the first command, set the starting point
-            if len(data) == 0:
-                data.append(abs_cmd.pos)
-
-        elif isinstance(abs_cmd, LineTo):
-            # Convert line to flat cubic curve
-            # Control points are 1/3 and 2/3 along the line
-
-            c1 = current_pos.lerp(abs_cmd.pos, 1.0 / 3)
-            c2 = current_pos.lerp(abs_cmd.pos, 2.0 / 3)
+    return PolyBezier(data)
 
-            data.extend([c1, c2, abs_cmd.pos])
 
-            current_pos = abs_cmd.pos
+def _poly_move(
+    cmd: MoveTo, current_pos: Point2D, start_pos: Point2D, data: list[Point2D]
+) -> tuple[Point2D, Point2D]:
+    """Start a new subpath; the first MoveTo sets the poly-bezier start point"""
+    if not data:
+        data.append(cmd.pos)
+    return cmd.pos, cmd.pos
 
-        elif isinstance(abs_cmd, CubicBezier):
-            # Already a cubic curve - just add it
-            data.extend([abs_cmd.center1, abs_cmd.center2, abs_cmd.pos])
-            current_pos = abs_cmd.pos
 
-        elif isinstance(abs_cmd, QuadraticBezier):
-            # Convert quadratic to cubic using standard formula
-            # For quadratic P0, P1, P2:
-            # Cubic control points are P0 + 2/3*(P1-P0) and P2 + 2/3*(P1-P2)
-            p0 = current_pos
-            p1 = abs_cmd.center
-            p2 = abs_cmd.pos
+def _poly_line(
+    cmd: LineTo, current_pos: Point2D, start_pos: Point2D, data: list[Point2D]
+) -> tuple[Point2D, Point2D]:
+    """Convert line to flat cubic curve (control points at 1/3 and 2/3)"""
+    pos = cmd.pos
+    data.extend([current_pos.lerp(pos, 1.0 / 3), current_pos.lerp(pos, 2.0 / 3), pos])
+    return pos, start_pos
 
-            c1 = p0.lerp(p1, 2.0 / 3)
-            c2 = p2.lerp(p1, 2.0 / 3)
 
-            data.extend([c1, c2, p2])
-            current_pos = p2
+def _poly_cubic(
+    cmd: CubicBezier, current_pos: Point2D, start_pos: Point2D, data: list[Point2D]
+) -> tuple[Point2D, Point2D]:
+    """Already a cubic curve - just add it"""
+    data.extend([cmd.center1, cmd.center2, cmd.pos])
+    return cmd.pos, start_pos
 
-        elif isinstance(abs_cmd, ClosePath):
-            # Close with a line back to start
-            if current_pos.x != start_pos.x or current_pos.y != start_pos.y:
-                c1 = current_pos.lerp(start_pos, 1.0 / 3)
-                c2 = current_pos.lerp(start_pos, 2.0 / 3)
 
-                data.extend([c1, c2, start_pos])
-            current_pos = start_pos
+def _poly_quadratic(
+    cmd: QuadraticBezier,
+    current_pos: Point2D,
+    start_pos: Point2D,
+    data: list[Point2D],
+) -> tuple[Point2D, Point2D]:
+    """Elevate quadratic to cubic
 
-    return PolyBezier(data)
+    For quadratic P0, P1, P2 the cubic control points are
+    P0 + 2/3*(P1-P0) and P2 + 2/3*(P1-P2).
+    """
+    p1 = cmd.center
+    p2 = cmd.pos
+    data.extend([current_pos.lerp(p1, 2.0 / 3), p2.lerp(p1, 2.0 / 3), p2])
+    return p2, start_pos
+
+
+def _poly_close(
+    cmd: ClosePath, current_pos: Point2D, start_pos: Point2D, data: list[Point2D]
+) -> tuple[Point2D, Point2D]:
+    """Close with a line back to start"""
+    if current_pos.x != start_pos.x or current_pos.y != start_pos.y:
+        data.extend(
+            [
+                current_pos.lerp(start_pos, 1.0 / 3),
+                current_pos.lerp(start_pos, 2.0 / 3),
+                start_pos,
+            ]
+        )
+    return start_pos, start_pos
+
+
+_POLY_BEZIER_HANDLERS = {
+    MoveTo: _poly_move,
+    LineTo: _poly_line,
+    CubicBezier: _poly_cubic,
+    QuadraticBezier: _poly_quadratic,
+    ClosePath: _poly_close,
+}
 
 
 # ============================================================================
@@ -311,6 +340,100 @@ def interpolate_poly_beziers(
     return PolyBezier(result_data)
 
 
+# ============================================================================
+# Precomputed Morph Table
+# ============================================================================
+
+
+class PathMorphTable:
+    """
+    Flat, precomputed coordinate table for morphing between two paths
+
+    Conversion to poly-bezier, start normalization and padding only depend
+    on the two paths, not on t. The table does that work once and keeps the
+    result as flat coordinate columns ``[x0, y0, x1, y1, ...]``: the start
+    values and the per-coordinate delta to the end path. Each frame is then
+    a single ``start + delta * t`` pass over plain floats.
+
+    Points that only exist in the longer path (after padding) are kept as a
+    static tail, exactly as interpolate_poly_beziers() does.
+    """
+
+    def __init__(
+        self, path1: SVGPath, path2: SVGPath, origin: Point2D = Point2D(0, 0)
+    ):
+        poly1 = normalize_poly_bezier_start(convert_to_poly_bezier(path1), origin)
+        poly2 = normalize_poly_bezier_start(convert_to_poly_bezier(path2), origin)
+
+        max_length = max(len(poly1.data), len(poly2.data))
+        data1 = fill_poly_bezier_to_length(poly1, max_length).data
+        data2 = fill_poly_bezier_to_length(poly2, max_length).data
+
+        # The longer path is never padded, so it is exactly max_length long
+        shared = min(len(data1), len(data2))
+
+        start: list[float] = []
+        delta: list[float] = []
+        for p1, p2 in zip(data1[:shared], data2[:shared]):
+            start.append(p1.x)
+            start.append(p1.y)
+            delta.append(p2.x - p1.x)
+            delta.append(p2.y - p1.y)
+
+        longer = data1 if len(data1) > len(data2) else data2
+        self.start = start
+        self.delta = delta
+        self.tail: list[Point2D] = longer[shared:max_length]
+        self._tail_coords = [c for p in self.tail for c in (p.x, p.y)]
+        self._frame_format: Callable[..., str] | None = None
+
+    def __len__(self) -> int:
+        """Number of points in an interpolated frame"""
+        return len(self.start) // 2 + len(self.tail)
+
+    def interpolate_points(self, t: float) -> list[Point2D]:
+        """Interpolated poly-bezier points at t"""
+        coords = [a + d * t for a, d in zip(self.start, self.delta)]
+        it = iter(coords)
+        points = [Point2D(x, y) for x, y in zip(it, it)]
+        if self.tail:
+            points.extend(self.tail)
+        return points
+
+    def interpolate(self, t: float) -> SVGPath:
+        """Interpolated path at t"""
+        return PolyBezier(self.interpolate_points(t)).to_svg_path()
+
+    def render(self, t: float, out: TextIO) -> None:
+        """Write the path data string of the interpolated path at t to out
+
+        Produces the same text as ``interpolate(t).to_string()`` but without
+        building Point2D or command objects: the interpolated coordinates
+        are fed straight into one format template covering the whole path,
+        so each frame is a single lerp pass plus a single format call.
+        Meant for consumers that only need the SVG ``d`` attribute.
+        """
+        frame_format = self._frame_format
+        if frame_format is None:
+            frame_format = self._frame_format = self._build_frame_format()
+
+        coords = [a + d * t for a, d in zip(self.start, self.delta)]
+        coords.extend(self._tail_coords)
+        out.write(frame_format(*coords))
+
+    def _build_frame_format(self) -> Callable[..., str]:
+        """Format template for a whole frame: one MoveTo plus every curve
+
+        Each curve is 3 points (6 coordinates); an incomplete trailing group
+        gets no placeholders and is dropped, as in PolyBezier.to_svg_path().
+        """
+        num_points = len(self)
+        if num_points < 1:
+            return "".format
+        num_curves = (num_points - 1) // 3
+        return ("M {},{}" + " C {},{} {},{} {},{}" * num_curves).format
+
+
 # ============================================================================
 # Main Polymorph-Style Interface
 # ============================================================================
@@ -328,6 +451,11 @@ def polymorph_interpolate(
     3. Interpolate using matrix approach
     4. Convert back to SVGPath
 
+    One-off helper: every call builds a new PathMorphTable and so redoes
+    steps 1-2, which do not depend on t. Callers rendering many frames of
+    the same pair should build a PathMorphTable once and call its
+    interpolate() or render() per frame, as NativeMorpher does.
+
     Args:
         path1: First path
         path2: Second path
@@ -335,19 +463,7 @@ def polymorph_interpolate(
         origin: Origin point for normalization.
     """
 
-    # Step 1: Convert to poly-bezier format
-    poly1 = convert_to_poly_bezier(path1)
-    poly2 = convert_to_poly_bezier(path2)
-
-    # Step 2: Normalize starting points for better correspondence
-    normalized_poly1 = normalize_poly_bezier_start(poly1, origin)
-    normalized_poly2 = normalize_poly_bezier_start(poly2, origin)
-
-    # Step 3: Interpolate using matrix approach
-    result_poly = interpolate_poly_beziers(normalized_poly1, normalized_poly2, t)
-
-    # Step 4: Convert back to SVGPath
-    return result_poly.to_svg_path()
+    return PathMorphTable(path1, path2, origin).interpolate(t)
 
 
 # ============================================================================
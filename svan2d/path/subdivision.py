@@ -404,6 +404,10 @@ def subdivide_path_to_count(
 
     Strategy: Repeatedly subdivide the longest curve for even distribution.
 
+    The path is analyzed once; each split only measures the two new halves
+    instead of re-analyzing the whole path, so reaching the target costs
+    O(n) per split rather than a full length estimate of every curve.
+
     Args:
         commands: Original path commands.
         target_curve_count: Desired number of curve segments.
@@ -418,56 +422,50 @@ def subdivide_path_to_count(
     if current_count >= target_curve_count:
         return commands
 
-    # Work with a copy
-    result = list(commands)
+    # One [command, length, start_context] entry per command; length is None
+    # for commands that cannot be split (MoveTo, ClosePath, unsupported types)
+    segments: list[list] = [[cmd, None, None] for cmd in commands]
+    for curve in curves:
+        segments[curve.index][1] = curve.length
+        segments[curve.index][2] = curve.start_context
 
     # Keep subdividing until we reach target
     while current_count < target_curve_count:
-        # Re-analyze after each subdivision
-        curves = analyze_path_curves(result)
-
-        if not curves:
+        # Find longest curve (first one on ties)
+        longest_index = -1
+        longest_length = -1.0
+        for i, (_, length, _) in enumerate(segments):
+            if length is not None and length > longest_length:
+                longest_index = i
+                longest_length = length
+
+        if longest_index < 0:
             break
 
-        # Find longest curve
-        longest = max(curves, key=lambda c: c.length)
-
-        # Subdivide it
-        subdivided, new_context = subdivide_command(
-            longest.command, longest.start_context, t=0.5
-        )
-
-        # Replace in result
-        # Need to find actual position (might have shifted due to previous subdivisions)
-        # For now, we'll rebuild from scratch each time
-        result = _rebuild_with_subdivision(result, longest.index, subdivided)
-
-        # Re-analyze to get actual curve count
-        new_curves = analyze_path_curves(result)
-        actual_curve_count = len(new_curves)
-        current_count = actual_curve_count  # Use actual count, not increment
-
-    return result
-
+        cmd, _, context = segments[longest_index]
+        subdivided, _ = subdivide_command(cmd, context, t=0.5)
 
-def _rebuild_with_subdivision(
-    commands: list[PathCommand], command_index: int, new_commands: list[PathCommand]
-) -> list[PathCommand]:
-    """Rebuild command list with a subdivided curve
-
-    Args:
-        commands: Original commands.
-        command_index: Index of command to replace (in original list).
-        new_commands: Subdivision result (usually 2 commands).
-    """
-    # Replace the command at command_index with new_commands
-    result = []
-
-    for i, cmd in enumerate(commands):
-        if i == command_index:
-            # Replace with subdivided version
-            result.extend(new_commands)
-        else:
-            result.append(cmd)
+        if len(subdivided) != 2:
+            # Command type that does not split - stop considering it
+            segments[longest_index][1] = None
+            continue
 
+        first, second = subdivided
+        second_context = PathContext(
+            current_pos=first.pos, last_move_pos=context.last_move_pos
+        )
+        segments[longest_index : longest_index + 1] = [
+            [first, estimate_command_length(first, context), context],
+            [
+                second,
+                estimate_command_length(second, second_context),
+                second_context,
+            ],
+        ]
+        current_count += 1
+
+    result = [segment[0] for segment in segments]
+    # current_count is maintained incrementally; every split must have
+    # replaced one curve with exactly two
+    assert current_count == len(analyze_path_curves(result))
     return result
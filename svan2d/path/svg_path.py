@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
 
 from svan2d.core.point2d import Point2D
 
@@ -34,6 +35,12 @@ class SVGPath:
     commands: list[PathCommand]
     path_string: str | None = None
 
+    # (commands it was computed from, absolute commands), see
+    # _absolute_commands. Never handed out: to_absolute() returns a copy.
+    _absolute: tuple[tuple[PathCommand, ...], list[PathCommand]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @staticmethod
     def from_string(path_string: str) -> SVGPath:
         """
@@ -182,7 +189,39 @@ class SVGPath:
         return self.path_string
 
     def to_absolute(self) -> SVGPath:
-        """Convert all commands to absolute coordinates."""
+        """Convert all commands to absolute coordinates.
+
+        Horizontal and vertical lines are expanded to LineTo, so the absolute
+        form only contains M/L/Q/C/S/T/A/Z commands. Always returns a new
+        path; the conversion itself is cached (see _absolute_commands).
+        """
+        return SVGPath(list(self._absolute_commands()))
+
+    def _absolute_commands(self) -> list[PathCommand]:
+        """Absolute commands of this path, cached between calls.
+
+        The cache remembers the command objects it was computed from and is
+        rebuilt when commands is reassigned or its list changed in place.
+        The returned list is shared with the cache and must not be modified.
+        """
+        commands = self.commands
+        cached = self._absolute
+        if (
+            cached is not None
+            and len(cached[0]) == len(commands)
+            and all(map(operator.is_, cached[0], commands))
+        ):
+            return cached[1]
+
+        if all(
+            getattr(cmd, "absolute", True)
+            and not isinstance(cmd, (HorizontalLine, VerticalLine))
+            for cmd in commands
+        ):
+            absolute_commands = list(commands)
+            self._absolute = (tuple(commands), absolute_commands)
+            return absolute_commands
+
         absolute_commands = []
         current_pos = Point2D(0.0, 0.0)
 
@@ -190,7 +229,7 @@ class SVGPath:
         # and the last control point for S and T commands
         subpath_start_pos = Point2D(0.0, 0.0)
 
-        for cmd in self.commands:
+        for cmd in commands:
             abs_cmd = cmd.to_absolute(current_pos)
             absolute_commands.append(abs_cmd)
 
@@ -204,7 +243,78 @@ class SVGPath:
             else:
                 current_pos = abs_cmd.get_end_point(current_pos)
 
-        return SVGPath(absolute_commands)
+        self._absolute = (tuple(commands), absolute_commands)
+        return absolute_commands
+
+    def unshort(self) -> SVGPath:
+        """Return the absolute form with smooth curves expanded.
+
+        S and T commands become explicit CubicBezier and QuadraticBezier
+        commands by reflecting the previous command's control point about
+        the current point. This follows the SVG rule: without a preceding
+        C/S (for S) or Q/T (for T), the current point is the control point.
+        Consumers such as morphing then only need to handle the non-smooth
+        curve types.
+
+        Returns the absolute path itself when it has no smooth commands.
+        """
+        abs_path = self.to_absolute()
+        if not any(
+            isinstance(cmd, (SmoothCubicBezier, SmoothQuadraticBezier))
+            for cmd in abs_path.commands
+        ):
+            return abs_path
+
+        commands: list[PathCommand] = []
+        current_pos = Point2D(0.0, 0.0)
+        subpath_start = Point2D(0.0, 0.0)
+        # Last cubic / quadratic control point, None when the previous
+        # command was not of the matching curve family
+        cubic_ctrl: Point2D | None = None
+        quad_ctrl: Point2D | None = None
+
+        for cmd in abs_path.commands:
+            next_cubic_ctrl = None
+            next_quad_ctrl = None
+
+            if isinstance(cmd, SmoothCubicBezier):
+                c1 = (
+                    Point2D(
+                        2 * current_pos.x - cubic_ctrl.x,
+                        2 * current_pos.y - cubic_ctrl.y,
+                    )
+                    if cubic_ctrl is not None
+                    else current_pos
+                )
+                cmd = CubicBezier(c1, cmd.center, cmd.pos)
+            elif isinstance(cmd, SmoothQuadraticBezier):
+                ctrl = (
+                    Point2D(
+                        2 * current_pos.x - quad_ctrl.x,
+                        2 * current_pos.y - quad_ctrl.y,
+                    )
+                    if quad_ctrl is not None
+                    else current_pos
+                )
+                cmd = QuadraticBezier(ctrl, cmd.pos)
+
+            if isinstance(cmd, CubicBezier):
+                next_cubic_ctrl = cmd.center2
+            elif isinstance(cmd, QuadraticBezier):
+                next_quad_ctrl = cmd.center
+
+            if isinstance(cmd, ClosePath):
+                current_pos = subpath_start
+            else:
+                current_pos = cmd.get_end_point(current_pos)
+                if isinstance(cmd, MoveTo):
+                    subpath_start = current_pos
+
+            commands.append(cmd)
+            cubic_ctrl = next_cubic_ctrl
+            quad_ctrl = next_quad_ctrl
+
+        return SVGPath(commands)
 
     def length(self, num_samples: int = 100) -> float:
         """Calculate the total length of the path using adaptive sampling.
@@ -245,9 +355,7 @@ class SVGPath:
         prev_control = Point2D(0.0, 0.0)  # Track previous control point for smooth commands
 
         # Convert to absolute for easier length calculation
-        abs_path = self.to_absolute()
-
-        for cmd in abs_path.commands:
+        for cmd in self._absolute_commands():
             if isinstance(cmd, MoveTo):
                 current_pos = cmd.pos
                 subpath_start = cmd.pos
@@ -363,17 +471,10 @@ class SVGPath:
                     current_pos
                 )  # Reset for safety
 
-            elif isinstance(abs_cmd, (LineTo, HorizontalLine, VerticalLine)):
-                # Convert LineTo/H/V to CubicBezier (straight line)
-
-                # First, ensure we have a standard LineTo object
-                if isinstance(abs_cmd, (HorizontalLine, VerticalLine)):
-                    # Get the LineTo equivalent
-                    line_cmd = abs_cmd.to_absolute(current_pos)
-                else:
-                    line_cmd = abs_cmd
-
-                end_pos = line_cmd.pos
+            elif isinstance(abs_cmd, LineTo):
+                # Convert LineTo to CubicBezier (straight line). H/V commands
+                # arrive here already promoted to LineTo by to_absolute().
+                end_pos = abs_cmd.pos
 
                 # Control points at 1/3 and 2/3 along the line
                 c1 = current_pos.lerp(end_pos, 1.0 / 3)
@@ -537,6 +638,9 @@ class SVGPath:
     ) -> "SVGPath":
         """Interpolate between two paths with automatic normalization
 
+        Prepares the pair from scratch on every call; for many frames of the
+        same pair use svan2d.path.morphing.PathMorphTable instead.
+
         Args:
             path1: Starting path.
             path2: Ending path.
@@ -553,6 +657,8 @@ class SVGPath:
 
     def __eq__(self, other: object) -> bool:
         """Check equality of two paths"""
+        if other is self:
+            return True
         if not isinstance(other, SVGPath):
             return False
         return self.commands == other.commands
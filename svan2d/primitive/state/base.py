@@ -174,3 +174,29 @@ class State(ABC):
 
 
 States = list[State]
+
+
+# Per-class result of the replace_state safety check, computed on first use
+_FAST_REPLACE_SAFE: dict[type, bool] = {}
+
+
+def replace_state(state: State, values: dict[str, Any]) -> State:
+    """dataclasses.replace(state, **values) for frame-by-frame cloning.
+
+    State.__post_init__ only fills in defaults, which is a no-op on an
+    initialized state, so classes still using it are cloned by copying the
+    attribute dict without running __init__. Any other __post_init__, whether
+    defined on the class, inherited or mixed in, goes through replace().
+    """
+    cls = type(state)
+    safe = _FAST_REPLACE_SAFE.get(cls)
+    if safe is None:
+        safe = _FAST_REPLACE_SAFE[cls] = cls.__post_init__ is State.__post_init__
+    if not safe:
+        return replace(state, **values)
+    new_state = object.__new__(cls)
+    # A copied dict beats filling the new instance's dict key by key
+    attributes = state.__dict__.copy()
+    attributes.update(values)
+    object.__setattr__(new_state, "__dict__", attributes)
+    return new_state
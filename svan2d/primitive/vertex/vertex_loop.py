@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from typing import Iterator
 
 from svan2d.core.point2d import Point2D, Points2D
 
@@ -30,6 +31,34 @@ class VertexLoop:
         ]
         self._closed = closed
 
+    @classmethod
+    def constant(cls, point: Point2D, n: int, closed: bool = True) -> VertexLoop:
+        """Create a degenerate loop of n copies of a single point
+
+        Shares the one immutable point across all entries and skips the
+        per-vertex conversion done by __init__.
+        """
+        if n < 1:
+            raise ValueError("VertexLoop requires at least one vertex")
+        loop = cls.__new__(cls)
+        loop._vertices = [point] * n
+        loop._closed = closed
+        return loop
+
+    @classmethod
+    def from_points(cls, vertices: Points2D, closed: bool = True) -> VertexLoop:
+        """Wrap a list of Point2D without converting or copying it
+
+        For callers that build a fresh list of Point2D per loop (e.g. per
+        interpolated frame); the loop takes ownership of the list.
+        """
+        if not vertices:
+            raise ValueError("VertexLoop requires at least one vertex")
+        loop = cls.__new__(cls)
+        loop._vertices = vertices
+        loop._closed = closed
+        return loop
+
     @property
     def vertices(self) -> Points2D:
         """Get vertices as list of tuples"""
@@ -48,6 +77,10 @@ class VertexLoop:
         """Get vertex at index"""
         return self._vertices[index]
 
+    def __iter__(self) -> Iterator[Point2D]:
+        """Iterate over the vertices without copying them"""
+        return iter(self._vertices)
+
     def centroid(self) -> Point2D:
         """Calculate the centroid (geometric center) of the vertices
 
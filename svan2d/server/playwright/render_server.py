@@ -15,7 +15,7 @@ from typing import Literal
 
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import Response
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from playwright.async_api import async_playwright, Browser, Page, Playwright
 from svan2d.core.logger import get_logger
@@ -28,10 +28,12 @@ class RenderRequest(BaseModel):
 
     svg: str | None = None
     html: str | None = None
-    type: Literal["png", "pdf", "svg_fragment"]
+    type: Literal["png", "jpeg", "pdf", "svg_fragment"]
     width: int
     height: int
     assets: dict[str, str] | None = None
+    # JPEG quality, only used for type="jpeg"
+    quality: int = Field(default=85, ge=0, le=100)
 
 
 class BrowserPool:
@@ -137,9 +139,10 @@ class BrowserPool:
                         async with self._lock:
                             self._pages_created -= 1
                     else:
-                        # Clear page and routes for reuse
+                        # Clear routes for reuse. The DOM is left as is: every
+                        # render starts with set_content(), which replaces it,
+                        # so blanking it here would only cost an extra parse.
                         await page.unroute("**/*")
-                        await page.set_content("<html><body></body></html>")
                         await self._page_pool.put(page)
                 except Exception as e:
                     logger.warning(f"Failed to reset page, discarding: {e}")
@@ -227,11 +230,12 @@ async def render(request: RenderRequest) -> Response:
                     await page.route(pattern, create_handler(local_path))
             timings["asset_routes"] = (time.perf_counter() - t0) * 1000
 
-            # 2. Set viewport size
+            # 2. Set viewport size (pooled pages keep their last viewport, so
+            # the resize round-trip is skipped when the size is unchanged)
             t0 = time.perf_counter()
-            await page.set_viewport_size(
-                {"width": request.width, "height": request.height}
-            )
+            viewport = {"width": request.width, "height": request.height}
+            if page.viewport_size != viewport:
+                await page.set_viewport_size(viewport)
             timings["set_viewport"] = (time.perf_counter() - t0) * 1000
 
             # 3. Load content
@@ -256,6 +260,12 @@ async def render(request: RenderRequest) -> Response:
             if request.type == "png":
                 buffer = await page.screenshot(full_page=True, omit_background=True)
                 content_type = "image/png"
+            elif request.type == "jpeg":
+                # Cheap lossy encoding for preview frames (no alpha channel)
+                buffer = await page.screenshot(
+                    full_page=True, type="jpeg", quality=request.quality
+                )
+                content_type = "image/jpeg"
             elif request.type == "pdf":
                 buffer = await page.pdf(
                     width=f"{request.width}px",
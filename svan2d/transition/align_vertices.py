@@ -178,7 +178,5 @@ def _create_zero_hole(hole: VertexLoop) -> VertexLoop:
 
     Used for hole creation/destruction animations.
     """
-    centroid = hole.centroid()
     # Create a degenerate hole with all vertices at the centroid
-    zero_vertices = [centroid for _ in hole.vertices]
-    return VertexLoop(zero_vertices, closed=True)
+    return VertexLoop.constant(hole.centroid(), len(hole), closed=True)
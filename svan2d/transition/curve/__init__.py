@@ -4,16 +4,27 @@ Path functions define spatial trajectories between two points,
 enabling non-linear motion paths like bezier curves and arcs.
 """
 
-from .arc import arc, arc_clockwise, arc_counterclockwise
+from .arc import (
+    arc,
+    arc_batch,
+    arc_clockwise,
+    arc_columns,
+    arc_counterclockwise,
+)
 from .bezier import bezier, bezier_cubic, bezier_quadratic
-from .linear import linear
+from .linear import linear, linear_batch
+from .sampling import sample_segment
 
 __all__ = [
     "linear",
+    "linear_batch",
     "bezier",
     "bezier_quadratic",
     "bezier_cubic",
     "arc",
     "arc_clockwise",
     "arc_counterclockwise",
+    "arc_batch",
+    "arc_columns",
+    "sample_segment",
 ]
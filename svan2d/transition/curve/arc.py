@@ -1,48 +1,90 @@
 """Circular arc path interpolation."""
 
+from __future__ import annotations
+
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from svan2d.core.point2d import Point2D
 
+_TWO_PI = 2.0 * math.pi
 
-def _make_arc_path(
-    radius: float | None,
-    clockwise: bool,
-) -> Callable[[Point2D, Point2D, float], Point2D]:
-    """Create an arc path function with the given direction.
+
+class ArcPath:
+    """Circular arc path function with a fixed radius and direction.
+
+    Called as path_fn(p1, p2, t) like any path function; radius and
+    clockwise are exposed so columnar samplers can evaluate the same arc
+    without creating points.
 
     Args:
         radius: Arc radius. If None, uses distance between points (semicircle).
         clockwise: If True, arc curves right; if False, curves left.
     """
-    # The center calculation flag is inverted relative to the visual direction
-    center_clockwise = not clockwise
 
-    def arc_path(p1: Point2D, p2: Point2D, t: float) -> Point2D:
-        distance = p1.distance_to(p2)
-        if distance == 0:
-            return p1
+    __slots__ = ("radius", "clockwise", "_side", "_cache")
+
+    def __init__(self, radius: float | None, clockwise: bool):
+        self.radius = radius
+        self.clockwise = clockwise
+        self._side = _center_side(clockwise)
+        # Only t changes between the samples of one segment, so the geometry
+        # of the last (p1, p2) pair is kept: (p1, p2, cx, cy, r, start_angle,
+        # angle_diff), or a 3-tuple (p1, p2, p1) for coincident points. It is
+        # replaced as one tuple so a concurrent caller never sees a partial
+        # entry.
+        self._cache: tuple = (None, None)
+
+    def __call__(self, p1: Point2D, p2: Point2D, t: float) -> Point2D:
+        entry = self._cache
+        if not (
+            (entry[0] is p1 or entry[0] == p1) and (entry[1] is p2 or entry[1] == p2)
+        ):
+            entry = self._cache = _arc_geometry(p1, p2, self.radius, self._side)
+
+        if len(entry) == 3:
+            return entry[2]
+
+        _, _, cx, cy, r, start_angle, angle_diff = entry
+        angle = start_angle + angle_diff * t
+        return Point2D(cx + r * math.cos(angle), cy + r * math.sin(angle))
+
 
-        r = radius if radius is not None else distance
-        if r < distance / 2:
-            r = distance / 2
+def _center_side(clockwise: bool) -> float:
+    """Sign selecting the side of p1->p2 the arc center lies on
 
-        center, start_angle, end_angle = _calculate_arc_center(
-            p1, p2, r, clockwise=center_clockwise
-        )
+    The center sits opposite to the visual bulge of the arc, so a clockwise
+    arc (curving right) has its center on the positive perpendicular.
+    """
+    return 1.0 if clockwise else -1.0
 
-        angle_diff = end_angle - start_angle
-        if angle_diff < 0:
-            angle_diff += 2 * math.pi
 
-        angle = start_angle + angle_diff * t
-        return Point2D(
-            center.x + r * math.cos(angle),
-            center.y + r * math.sin(angle),
-        )
+def _arc_geometry(
+    p1: Point2D, p2: Point2D, radius: float | None, side: float
+) -> tuple:
+    """Arc geometry for one (p1, p2) pair, as cached by arc path functions"""
+    dx = p2.x - p1.x
+    dy = p2.y - p1.y
+    distance_sq = dx * dx + dy * dy
+    if distance_sq == 0.0:
+        return (p1, p2, p1)
+    distance = math.sqrt(distance_sq)
 
-    return arc_path
+    # Radius resolution happens here, once per cached (p1, p2) pair
+    half_distance = distance * 0.5
+    r = radius if radius is not None else distance
+    if r < half_distance:
+        r = half_distance
+
+    center, start_angle, end_angle = _calculate_arc_center(
+        p1, p2, dx, dy, distance, r, side
+    )
+
+    angle_diff = end_angle - start_angle
+    if angle_diff < 0:
+        angle_diff += _TWO_PI
+
+    return (p1, p2, center.x, center.y, r, start_angle, angle_diff)
 
 
 def arc(radius: float | None = None) -> Callable[[Point2D, Point2D, float], Point2D]:
@@ -51,7 +93,7 @@ def arc(radius: float | None = None) -> Callable[[Point2D, Point2D, float], Poin
     Args:
         radius: Arc radius. If None, uses distance between points (semicircle).
     """
-    return _make_arc_path(radius, clockwise=False)
+    return ArcPath(radius, clockwise=False)
 
 
 def arc_counterclockwise(
@@ -64,7 +106,7 @@ def arc_counterclockwise(
     Args:
         radius: Arc radius. If None, uses distance between points (semicircle).
     """
-    return _make_arc_path(radius, clockwise=False)
+    return ArcPath(radius, clockwise=False)
 
 
 def arc_clockwise(
@@ -77,28 +119,98 @@ def arc_clockwise(
     Args:
         radius: Arc radius. If None, uses distance between points (semicircle).
     """
-    return _make_arc_path(radius, clockwise=True)
+    return ArcPath(radius, clockwise=True)
+
+
+def arc_batch(
+    p1: Point2D,
+    p2: Point2D,
+    ts: Iterable[float],
+    radius: float | None = None,
+    clockwise: bool = False,
+) -> list[Point2D]:
+    """Sample a circular arc between two points at many t values in one call
+
+    Equivalent to calling the path function of arc_clockwise(radius) or
+    arc_counterclockwise(radius) once per t, with the arc geometry
+    computed once for the whole batch.
+
+    Args:
+        p1: Start point.
+        p2: End point.
+        ts: Interpolation parameters (already eased).
+        radius: Arc radius. If None, uses distance between points (semicircle).
+        clockwise: If True, arc curves right; if False, curves left.
+    """
+    entry = _arc_geometry(p1, p2, radius, _center_side(clockwise))
+    if len(entry) == 3:
+        return [p1 for _ in ts]
+
+    _, _, cx, cy, r, start_angle, angle_diff = entry
+    cos = math.cos
+    sin = math.sin
+    points = []
+    for t in ts:
+        angle = start_angle + angle_diff * t
+        points.append(Point2D(cx + r * cos(angle), cy + r * sin(angle)))
+    return points
+
+
+def arc_columns(
+    p1: Point2D,
+    p2: Point2D,
+    ts: Iterable[float],
+    radius: float | None = None,
+    clockwise: bool = False,
+) -> tuple[list[float], list[float]]:
+    """Sample a circular arc as separate x and y coordinate lists
+
+    Same samples as arc_batch, without allocating a Point2D per sample.
+
+    Args:
+        p1: Start point.
+        p2: End point.
+        ts: Interpolation parameters (already eased).
+        radius: Arc radius. If None, uses distance between points (semicircle).
+        clockwise: If True, arc curves right; if False, curves left.
+
+    Returns:
+        Tuple of (xs, ys)
+    """
+    entry = _arc_geometry(p1, p2, radius, _center_side(clockwise))
+    if len(entry) == 3:
+        count = len(ts) if isinstance(ts, (list, tuple)) else sum(1 for _ in ts)
+        return [p1.x] * count, [p1.y] * count
+
+    _, _, cx, cy, r, start_angle, angle_diff = entry
+    angles = [start_angle + angle_diff * t for t in ts]
+    cos = math.cos
+    sin = math.sin
+    return [cx + r * cos(a) for a in angles], [cy + r * sin(a) for a in angles]
 
 
 def _calculate_arc_center(
-    p1: Point2D, p2: Point2D, radius: float, clockwise: bool
+    p1: Point2D,
+    p2: Point2D,
+    dx: float,
+    dy: float,
+    distance: float,
+    radius: float,
+    side: float,
 ) -> tuple[Point2D, float, float]:
     """Calculate center and angles for circular arc
 
     Args:
         p1: Start point
         p2: End point
+        dx, dy: Offset from p1 to p2, as already computed by the caller
+        distance: Distance between p1 and p2, as already computed by the caller
         radius: Arc radius
-        clockwise: Direction of arc
+        side: Which side of p1->p2 the center lies on, +1.0 or -1.0
 
     Returns:
         Tuple of (center, start_angle, end_angle)
     """
-    # Distance between points
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-    distance = math.sqrt(dx * dx + dy * dy)
-
     # Handle edge cases
     if distance == 0:
         # Points are the same
@@ -113,20 +225,14 @@ def _calculate_arc_center(
     mid_y = (p1.y + p2.y) / 2
 
     # Perpendicular distance from midpoint to center
-    h = math.sqrt(radius * radius - (distance / 2) ** 2)
-
-    # Perpendicular direction (normalized)
-    perp_x = -dy / distance
-    perp_y = dx / distance
+    h = math.sqrt(radius * radius - distance * distance * 0.25)
 
-    # Flip direction for clockwise
-    if clockwise:
-        perp_x = -perp_x
-        perp_y = -perp_y
+    # Perpendicular direction (normalized), on the requested side
+    scale = side * h / distance
 
     # Center of arc
-    center_x = mid_x + h * perp_x
-    center_y = mid_y + h * perp_y
+    center_x = mid_x - dy * scale
+    center_y = mid_y + dx * scale
     center = Point2D(center_x, center_y)
 
     # Calculate start and end angles
@@ -1,5 +1,7 @@
 """Bezier curve path interpolation"""
 
+from __future__ import annotations
+
 import math
 from collections.abc import Callable
 
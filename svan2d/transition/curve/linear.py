@@ -1,5 +1,9 @@
 """Linear path interpolation"""
 
+from __future__ import annotations
+
+from collections.abc import Iterable
+
 from svan2d.core.point2d import Point2D
 
 
@@ -18,4 +22,24 @@ def linear(p1: Point2D, p2: Point2D, t: float) -> Point2D:
         linear(Point2D(0, 0), Point2D(100, 100), 0.5)
         Point2D(50.0, 50.0)
     """
-    return Point2D(x=p1.x + (p2.x - p1.x) * t, y=p1.y + (p2.y - p1.y) * t)
+    x = p1.x
+    y = p1.y
+    return Point2D(x + (p2.x - x) * t, y + (p2.y - y) * t)
+
+
+def linear_batch(p1: Point2D, p2: Point2D, ts: Iterable[float]) -> list[Point2D]:
+    """Sample the linear path at many t values in one call
+
+    Equivalent to ``[linear(p1, p2, t) for t in ts]`` with the endpoint
+    deltas computed once.
+
+    Args:
+        p1: Start point
+        p2: End point
+        ts: Interpolation parameters (already eased)
+    """
+    x1 = p1.x
+    y1 = p1.y
+    dx = p2.x - x1
+    dy = p2.y - y1
+    return [Point2D(x1 + dx * t, y1 + dy * t) for t in ts]
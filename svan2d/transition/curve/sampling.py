@@ -0,0 +1,55 @@
+"""Columnar sampling of path functions"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from svan2d.core.point2d import Point2D
+
+from .arc import ArcPath, arc_columns
+from .linear import linear
+
+
+def sample_segment(
+    p1: Point2D,
+    p2: Point2D,
+    ts: Iterable[float],
+    path_fn: Callable[[Point2D, Point2D, float], Point2D] = linear,
+    easing_fn: Callable[[float], float] | None = None,
+) -> tuple[list[float], list[float]]:
+    """Sample a path between two points as separate x and y coordinate lists
+
+    Applies easing_fn to every t, evaluates path_fn at the eased values and
+    returns the coordinates column-wise, ready for consumers that work on
+    flat coordinate lists. Linear paths and the arc path functions are
+    evaluated directly on the coordinates without creating intermediate
+    points.
+
+    Args:
+        p1: Start point
+        p2: End point
+        ts: Interpolation parameters (0.0 to 1.0, not yet eased)
+        path_fn: Path function, linear by default
+        easing_fn: Optional easing applied to each t before path_fn
+
+    Returns:
+        Tuple of (xs, ys)
+
+    Example:
+        xs, ys = sample_segment(Point2D(0, 0), Point2D(100, 50), [0.0, 0.5, 1.0])
+        xs == [0.0, 50.0, 100.0]
+    """
+    eased = list(ts) if easing_fn is None else list(map(easing_fn, ts))
+
+    if path_fn is linear:
+        x1 = p1.x
+        y1 = p1.y
+        dx = p2.x - x1
+        dy = p2.y - y1
+        return [x1 + dx * t for t in eased], [y1 + dy * t for t in eased]
+
+    if isinstance(path_fn, ArcPath):
+        return arc_columns(p1, p2, eased, path_fn.radius, path_fn.clockwise)
+
+    points = [path_fn(p1, p2, t) for t in eased]
+    return [p.x for p in points], [p.y for p in points]
@@ -12,44 +12,52 @@ Available functions:
 - easing2D: Create 2D easing with independent x/y control
 """
 
-from collections.abc import Callable
-
-from .in_back import in_back
-from .in_bounce import in_bounce
-from .in_circ import in_circ
-from .in_cubic import in_cubic
-from .in_elastic import in_elastic
-from .in_expo import in_expo
-from .in_out import in_out
-from .in_out_back import in_out_back
-from .in_out_bounce import in_out_bounce
-from .in_out_circ import in_out_circ
-from .in_out_cubic import in_out_cubic
-from .in_out_elastic import in_out_elastic
-from .in_out_expo import in_out_expo
-from .in_out_quad import in_out_quad
-from .in_out_quart import in_out_quart
-from .in_out_quint import in_out_quint
-from .in_out_sine import in_out_sine
-from .in_quad import in_quad
-from .in_quart import in_quart
-from .in_quint import in_quint
-from .in_sine import in_sine
-from .linear import linear
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
 
-# Individual easing functions
-from .none import none
-from .out_back import out_back
+# linear is the default easing everywhere, so it is always loaded; the other
+# curves are imported from their submodules on first access (PEP 562).
+# out_bounce is loaded eagerly too: in_bounce and in_out_bounce import its
+# submodule, which would otherwise rebind easing.out_bounce to the module.
+from .linear import linear
 from .out_bounce import out_bounce
-from .out_circ import out_circ
-from .out_cubic import out_cubic
-from .out_elastic import out_elastic
-from .out_expo import out_expo
-from .out_quad import out_quad
-from .out_quart import out_quart
-from .out_quint import out_quint
-from .out_sine import out_sine
-from .step import step
+
+if TYPE_CHECKING:
+    from .in_back import in_back
+    from .in_bounce import in_bounce
+    from .in_circ import in_circ
+    from .in_cubic import in_cubic
+    from .in_elastic import in_elastic
+    from .in_expo import in_expo
+    from .in_out import in_out
+    from .in_out_back import in_out_back
+    from .in_out_bounce import in_out_bounce
+    from .in_out_circ import in_out_circ
+    from .in_out_cubic import in_out_cubic
+    from .in_out_elastic import in_out_elastic
+    from .in_out_expo import in_out_expo
+    from .in_out_quad import in_out_quad
+    from .in_out_quart import in_out_quart
+    from .in_out_quint import in_out_quint
+    from .in_out_sine import in_out_sine
+    from .in_quad import in_quad
+    from .in_quart import in_quart
+    from .in_quint import in_quint
+    from .in_sine import in_sine
+    from .none import none
+    from .out_back import out_back
+    from .out_circ import out_circ
+    from .out_cubic import out_cubic
+    from .out_elastic import out_elastic
+    from .out_expo import out_expo
+    from .out_quad import out_quad
+    from .out_quart import out_quart
+    from .out_quint import out_quint
+    from .out_sine import out_sine
+    from .step import step
 
 
 def easing2D(
@@ -61,6 +69,9 @@ def easing2D(
     Returns an easing function that applies different easing functions to x and y,
     enabling independent control over horizontal and vertical motion timing.
 
+    Passing the same function for both axes is allowed; it is then evaluated
+    once per sample and the value reused for y.
+
     Args:
         easing_x: Easing function for x dimension.
         easing_y: Easing function for y dimension.
@@ -74,6 +85,13 @@ def easing2D(
         ...     attribute_easing={"pos": pos_easing}
         ... )
     """
+    if easing_x is easing_y:
+
+        def uniform(t: float) -> tuple[float, float]:
+            value = easing_x(t)
+            return (value, value)
+
+        return uniform
 
     def combined(t: float) -> tuple[float, float]:
         return (easing_x(t), easing_y(t))
@@ -81,6 +99,39 @@ def easing2D(
     return combined
 
 
+def easing2D_batch(
+    easing_x: Callable[[float], float],
+    easing_y: Callable[[float], float],
+) -> Callable[[Iterable[float]], tuple[list[float], list[float]]]:
+    """Create a batched 2D easing function for many samples at once.
+
+    Like easing2D, but the returned function takes a sequence of t values and
+    returns the eased x and y values as two lists, so per-sample tuples are
+    never built. A shared easing is evaluated once per sample.
+
+    Args:
+        easing_x: Easing function for x dimension.
+        easing_y: Easing function for y dimension.
+
+    Example:
+        pos_easing = easing2D_batch(in_quad, out_bounce)
+        xs, ys = pos_easing([0.0, 0.25, 0.5, 0.75, 1.0])
+    """
+    if easing_x is easing_y:
+
+        def uniform_batch(ts: Iterable[float]) -> tuple[list[float], list[float]]:
+            values = list(map(easing_x, ts))
+            return values, values[:]
+
+        return uniform_batch
+
+    def combined_batch(ts: Iterable[float]) -> tuple[list[float], list[float]]:
+        ts = ts if isinstance(ts, (list, tuple)) else list(ts)
+        return list(map(easing_x, ts)), list(map(easing_y, ts))
+
+    return combined_batch
+
+
 __all__ = [
     "none",
     "step",
@@ -117,4 +168,24 @@ __all__ = [
     "out_bounce",
     "in_out_bounce",
     "easing2D",
+    "easing2D_batch",
 ]
+
+_LAZY_EASINGS = frozenset(__all__) - {
+    "linear",
+    "out_bounce",
+    "easing2D",
+    "easing2D_batch",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EASINGS:
+        value = getattr(importlib.import_module(f".{name}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
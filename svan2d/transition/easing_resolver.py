@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Callable
 
 from svan2d.transition import easing
@@ -9,6 +10,8 @@ from svan2d.transition import easing
 # Easing function can return float (1D) or tuple[float, float] (2D for Point2D)
 EasingFunction = Callable[[float], float | tuple[float, float]]
 
+_linear = easing.linear
+
 
 class EasingResolver:
     """
@@ -39,16 +42,56 @@ class EasingResolver:
         if segment_easing is not None:
             return segment_easing
 
-        if field_name in self.attribute_easing:
-            return self.attribute_easing[field_name]
+        return self.attribute_easing.get(field_name, _linear)
 
-        return easing.linear
+    def build_field_table(
+        self,
+        field_names: Iterable[str] = (),
+        segment_easing_overrides: dict[str, EasingFunction] | None = None,
+        segment_easing: EasingFunction | None = None,
+    ) -> FieldEasingTable:
+        """Resolve the easing of every field of one segment up front
+
+        The resolution only depends on the segment configuration, so callers
+        that evaluate the same segment for many frames can build this table
+        once and index it per field instead of calling get_easing_for_field.
+        Fields not listed are resolved on first access.
+        """
+        table = FieldEasingTable(self, segment_easing_overrides, segment_easing)
+        for field_name in field_names:
+            table[field_name]
+        return table
 
     def get_easing_for_field_timeline(
         self,
         field_name: str,
     ) -> EasingFunction:
-        if field_name in self.attribute_easing:
-            return self.attribute_easing[field_name]
+        return self.attribute_easing.get(field_name, _linear)
+
+
+class FieldEasingTable(dict):
+    """Field name -> easing mapping for one segment, built by EasingResolver
+
+    Missing fields are resolved through the resolver and stored, so lookups
+    never fail and every field is resolved at most once.
+    """
+
+    __slots__ = ("_resolver", "_segment_easing_overrides", "_segment_easing")
+
+    def __init__(
+        self,
+        resolver: EasingResolver,
+        segment_easing_overrides: dict[str, EasingFunction] | None,
+        segment_easing: EasingFunction | None,
+    ):
+        super().__init__()
+        self._resolver = resolver
+        self._segment_easing_overrides = segment_easing_overrides
+        self._segment_easing = segment_easing
 
-        return easing.linear
+    def __missing__(self, field_name: str) -> EasingFunction:
+        easing_func = self._resolver.get_easing_for_field(
+            field_name, self._segment_easing_overrides, self._segment_easing
+        )
+        self[field_name] = easing_func
+        return easing_func
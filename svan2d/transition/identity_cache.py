@@ -0,0 +1,56 @@
+"""Bounded cache keyed by the identity of the objects a result depends on"""
+
+from typing import Any, Hashable
+
+# Entries kept by an IdentityCache unless it is given another size. Entries
+# are per segment (keystate pair, path pair, easing configuration), so this
+# comfortably covers every segment active in one frame.
+DEFAULT_MAXSIZE = 256
+
+
+class IdentityCache:
+    """Cache for per-segment work, keyed by id() of its input objects.
+
+    Keystates, paths and segment configurations are reused object for object
+    on every frame of a segment but are unhashable or costly to compare, so
+    work derived from them is cached by identity instead of by value.
+
+    Lifecycle of an entry:
+    - It holds strong references to its key objects, so their ids cannot be
+      reused by other objects while it is cached, and a lookup only hits when
+      every stored object ``is`` the requested one.
+    - When the cache is full the oldest entry is dropped (FIFO), releasing
+      the objects it kept alive.
+    - Key objects are never inspected: they must not be mutated in place
+      while they are in use, as is already the contract for frozen states
+      and keystate configuration.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: dict[tuple, tuple[tuple, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, refs: tuple, extra: Hashable = None, default: Any = None) -> Any:
+        """Value cached for refs (compared by identity) and extra, or default"""
+        entry = self._entries.get((tuple(map(id, refs)), extra))
+        if entry is None:
+            return default
+        cached_refs = entry[0]
+        for cached, ref in zip(cached_refs, refs):
+            if cached is not ref:
+                return default
+        return entry[1]
+
+    def put(self, refs: tuple, value: Any, extra: Hashable = None) -> Any:
+        """Cache value for refs and extra; returns value"""
+        if len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order, so the first entry is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[(tuple(map(id, refs)), extra)] = (refs, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
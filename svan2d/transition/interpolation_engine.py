@@ -1,22 +1,28 @@
 """State and value interpolation engine"""
 
 import logging
-from dataclasses import fields, replace
-from typing import Any, Callable, Iterator
+from dataclasses import fields
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
 
 from svan2d.primitive.effect.filter.base import Filter
 from svan2d.primitive.effect.gradient.base import Gradient
 from svan2d.primitive.effect.pattern.base import Pattern
-from svan2d.primitive.state.base import State
+from svan2d.primitive.state.base import State, replace_state
 from svan2d.primitive.vertex.vertex_contours import VertexContours
 from svan2d.core.color import Color
 from svan2d.core.point2d import Point2D
 from svan2d.core.scalar_functions import lerp
 from svan2d.path import SVGPath
+from svan2d.transition.easing_resolver import FieldEasingTable
+from svan2d.transition.identity_cache import IdentityCache
 from svan2d.transition.interpolators import (
     NestedStateInterpolator,
     VertexContoursInterpolator,
 )
+from svan2d.transition.interpolators.vertex_contours_interpolator import (
+    _warn_vertex_buffer_deprecated,
+)
 from svan2d.transition.path_morpher import PathMorpher
 from svan2d.transition.state_list_interpolator import (
     StateListInterpolator,
@@ -33,29 +39,82 @@ EasedT = float | tuple[float, float]
 # Sentinel for "this helper didn't handle the value"
 _NOT_HANDLED = object()
 
+# Sentinel for "the end state has no such attribute"
+_MISSING = object()
+
+# Maximum number of interpolated states kept when t_precision is set
+_STATE_CACHE_SIZE = 2048
+
+# Effect types, interpolated by _interpolate_effect
+_EFFECT_TYPES = (Gradient, Pattern, Filter)
+
+# Value types that interpolate_value always handles itself
+_DISPATCHED_TYPES = (list, State, SVGPath, Gradient, Pattern, Filter)
+
+# State class -> dataclass field names, in declaration order
+_FIELD_NAMES_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(state: State) -> tuple[str, ...]:
+    """Dataclass field names of a state, resolved once per state class."""
+    cls = type(state)
+    names = _FIELD_NAMES_CACHE.get(cls)
+    if names is None:
+        names = _FIELD_NAMES_CACHE[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def _maps_zero_to_zero(easing_func: Callable | None) -> bool:
+    """Whether an easing (1D or 2D, None for identity) yields 0 at t=0"""
+    if easing_func is None:
+        return True
+    eased = easing_func(0.0)
+    if type(eased) is tuple:
+        return eased[0] == 0.0 and eased[1] == 0.0
+    return eased == 0.0
+
+
+def _easing_items(easings: dict[str, Callable] | None) -> tuple:
+    """Hashable snapshot of a field -> easing dict, for cache keys"""
+    return tuple(easings.items()) if easings else ()
 
-def _scalar_t(eased_t: EasedT) -> float:
-    """Extract scalar t value from EasedT.
 
-    For 2D easing (tuple), uses the average of both components.
-    For scalar easing, returns the value directly.
+def _eased_once(
+    eased_by_easing: dict[Callable | None, EasedT],
+    easing_func: Callable | None,
+    t: float,
+) -> EasedT:
+    """easing_func(t), evaluated once per frame and memoized in eased_by_easing.
+
+    Fields usually share a few easings, so a frame keeps one dict of eased
+    values keyed by easing function (None for identity).
     """
-    if isinstance(eased_t, tuple):
-        return (eased_t[0] + eased_t[1]) / 2
-    return eased_t
+    try:
+        return eased_by_easing[easing_func]
+    except KeyError:
+        eased_t = eased_by_easing[easing_func] = easing_func(t) if easing_func else t
+        return eased_t
 
 
 class InterpolationEngine:
     """Handles interpolation of states and individual values."""
 
-    def __init__(self, easing_resolver):
+    def __init__(self, easing_resolver, t_precision: int | None = None):
         """
         Initialize the interpolation engine.
 
         Args:
             easing_resolver: EasingResolver instance for determining easing functions
+            t_precision: Optional number of binary digits t is rounded to
+                (t_precision=10 rounds to 1/1024). When set, interpolated
+                states are cached per keystate pair and rounded t, so frames
+                that land on the same rounded t (paused or scrubbed
+                timelines) are not recomputed. None (default) disables both
+                the rounding and the cache.
         """
         self.easing_resolver = easing_resolver
+        self.t_precision = t_precision
+        self._state_cache = IdentityCache(_STATE_CACHE_SIZE)
 
         # Specialized interpolators
         self._shape_list_interpolator = StateListInterpolator(self)
@@ -64,11 +123,26 @@ class InterpolationEngine:
         self._path_morpher = PathMorpher()
         self._type_interpolators = TypeInterpolators()
 
+        # (state type, field name, start type, end type, exact_rotation) ->
+        # leaf interpolator, or None when interpolate_value must dispatch
+        self._leaf_dispatch: dict[tuple, Callable | None] = {}
+
+        # Per-segment frame plans, see _frame_plan
+        self._frame_plans = IdentityCache()
+
+        # Contents of (segment_easing_overrides, segment_easing, attribute
+        # easings) -> field easing table; keyed on contents, not identity,
+        # because these dicts are mutable
+        self._easing_tables = IdentityCache()
+
+        # Same key -> whether every easing of the segment maps 0 to 0
+        self._zero_starts = IdentityCache()
+
     @staticmethod
     def compute_changed_fields(
         start_state: State,
         end_state: State,
-        attribute_keystates_fields: set,
+        attribute_keystates_fields: set | frozenset,
     ) -> tuple[set, dict[str, tuple[Any, Any]]]:
         """Pre-compute which fields differ between two states.
 
@@ -78,10 +152,12 @@ class InterpolationEngine:
         changed = set()
         field_values = {}
         non_interp = start_state.NON_INTERPOLATABLE_FIELDS
+        # Dataclass fields live in the instance __dict__; plain dict lookups
+        # avoid attribute access machinery for every field
+        start_values = start_state.__dict__
+        end_values = end_state.__dict__
 
-        for field in fields(start_state):
-            field_name = field.name
-
+        for field_name in _field_names(start_state):
             # Skip class-level constants (not real instance fields)
             if field_name == "NON_INTERPOLATABLE_FIELDS":
                 continue
@@ -97,21 +173,20 @@ class InterpolationEngine:
 
             # Non-interpolatable fields always need processing (step function)
             if field_name in non_interp:
-                start_val = getattr(start_state, field_name)
-                end_val = getattr(end_state, field_name, start_val)
-                if start_val != end_val:
+                start_val = start_values[field_name]
+                end_val = end_values.get(field_name, start_val)
+                if start_val is not end_val and start_val != end_val:
                     changed.add(field_name)
                     field_values[field_name] = (start_val, end_val)
                 continue
 
-            start_val = getattr(start_state, field_name)
-            if not hasattr(end_state, field_name):
+            start_val = start_values[field_name]
+            end_val = end_values.get(field_name, _MISSING)
+            if end_val is _MISSING:
                 continue
 
-            end_val = getattr(end_state, field_name)
-
             # Only track fields that actually differ
-            if start_val != end_val:
+            if start_val is not end_val and start_val != end_val:
                 changed.add(field_name)
                 field_values[field_name] = (start_val, end_val)
 
@@ -134,7 +209,7 @@ class InterpolationEngine:
     def _iter_fields_to_interpolate(
         start_state: State,
         end_state: State,
-        attribute_keystates_fields: set,
+        attribute_keystates_fields: set | frozenset,
         segment_interpolation_config: dict[str, Callable] | None,
         changed_fields: tuple[set, dict[str, tuple[Any, Any]]] | None,
     ) -> Iterator[tuple[str, Any, Any]]:
@@ -147,27 +222,27 @@ class InterpolationEngine:
             # Fast path: only process changed fields + custom interpolation fields
             changed_names, field_values = changed_fields
 
-            fields_to_process = set(changed_names)
+            fields_to_process = changed_names
             if segment_interpolation_config is not None:
-                fields_to_process |= set(segment_interpolation_config.keys())
+                fields_to_process = changed_names | segment_interpolation_config.keys()
 
             for field_name in fields_to_process:
                 if field_name in field_values:
                     start_value, end_value = field_values[field_name]
                 else:
                     # Field has custom interpolation function but equal values
-                    start_value = getattr(start_state, field_name)
-                    if not hasattr(end_state, field_name):
+                    start_value = start_state.__dict__[field_name]
+                    end_value = end_state.__dict__.get(field_name, _MISSING)
+                    if end_value is _MISSING:
                         continue
-                    end_value = getattr(end_state, field_name)
 
                 yield field_name, start_value, end_value
         else:
             # Fallback: iterate all fields
             non_interp = start_state.NON_INTERPOLATABLE_FIELDS
-            for field in fields(start_state):
-                field_name = field.name
-
+            start_values = start_state.__dict__
+            end_values = end_state.__dict__
+            for field_name in _field_names(start_state):
                 # Cache marker — handled in create_eased_state, never interpolated.
                 if field_name == "is_final":
                     continue
@@ -175,19 +250,18 @@ class InterpolationEngine:
                 if field_name in attribute_keystates_fields:
                     continue
 
-                start_value = getattr(start_state, field_name)
+                start_value = start_values[field_name]
 
-                # Non-interpolatable fields use getattr with default (safe if end_state lacks field)
+                # Non-interpolatable fields default to the start value (safe if end_state lacks field)
                 if field_name in non_interp:
-                    end_value = getattr(end_state, field_name, start_value)
+                    end_value = end_values.get(field_name, start_value)
                     yield field_name, start_value, end_value
                     continue
 
-                if not hasattr(end_state, field_name):
+                end_value = end_values.get(field_name, _MISSING)
+                if end_value is _MISSING:
                     continue
 
-                end_value = getattr(end_state, field_name)
-
                 yield field_name, start_value, end_value
 
     def create_eased_state(
@@ -196,7 +270,7 @@ class InterpolationEngine:
         end_state: State,
         t: float,
         segment_easing_overrides: dict[str, Callable[[float], float]] | None,
-        attribute_keystates_fields: set,
+        attribute_keystates_fields: set | frozenset,
         segment_easing: Callable[[float], float] | None = None,
         vertex_buffer: tuple[list, list[list]] | None = None,
         segment_interpolation_config: dict[str, Callable] | None = None,
@@ -204,6 +278,7 @@ class InterpolationEngine:
         changed_fields: tuple[set, dict[str, tuple[Any, Any]]] | None = None,
         exact_rotation: bool = False,
         state_interpolation: Callable | None = None,
+        easing_table: FieldEasingTable | None = None,
     ) -> State:
         """
         Create an interpolated state between two keystates.
@@ -215,22 +290,186 @@ class InterpolationEngine:
             segment_easing_overrides: Per-field segment easing overrides
             attribute_keystates_fields: Attributes managed by field keystates
             segment_easing: Blanket easing function for all fields in this segment
-            vertex_buffer: Optional reusable buffer for vertex interpolation
+            vertex_buffer: Deprecated and ignored
             segment_interpolation_config: Optional per-field path config dict {field_name: path_func}
             morphing_config: Optional morphing configuration (Morphing or MorphingConfig)
             changed_fields: Optional pre-computed (changed_field_names, field_values) tuple
             exact_rotation: If True, rotation uses linear interpolation (no angle wrapping)
             state_interpolation: Optional callable (start, end, t) -> State that bypasses all field interpolation
+            easing_table: Optional per-segment field easing table from
+                EasingResolver.build_field_table; must have been built for the
+                same segment_easing_overrides and segment_easing
+        """
+        if vertex_buffer is not None:
+            _warn_vertex_buffer_deprecated()
+        args = (
+            segment_easing_overrides,
+            attribute_keystates_fields,
+            segment_easing,
+            segment_interpolation_config,
+            morphing_config,
+            changed_fields,
+            exact_rotation,
+            state_interpolation,
+            easing_table,
+        )
+        if self.t_precision is None:
+            return self._create_eased_state(start_state, end_state, t, *args)
+
+        scale = 1 << self.t_precision
+        t_steps = round(t * scale)
+        # Everything the result depends on besides t
+        refs = (
+            start_state,
+            end_state,
+            segment_easing_overrides,
+            segment_easing,
+            segment_interpolation_config,
+            morphing_config,
+            state_interpolation,
+        )
+        extra = (t_steps, frozenset(attribute_keystates_fields), exact_rotation)
+        state = self._state_cache.get(refs, extra)
+        if state is None:
+            state = self._state_cache.put(
+                refs,
+                self._create_eased_state(
+                    start_state, end_state, t_steps / scale, *args
+                ),
+                extra,
+            )
+        return state
+
+    def create_eased_states(
+        self,
+        start_state: State,
+        end_state: State,
+        ts: Iterable[float],
+        segment_easing_overrides: dict[str, Callable[[float], float]] | None,
+        attribute_keystates_fields: set | frozenset,
+        **kwargs: Any,
+    ) -> list[State]:
+        """Interpolated states for many t values of one segment.
+
+        Equivalent to calling create_eased_state for each t (keyword arguments
+        are passed through), for callers that evaluate a segment at many
+        times in a row such as previews and exports. When changed_fields and
+        easing_table are given, the segment's frame plan is resolved once
+        for all ts.
         """
+        changed_fields = kwargs.get("changed_fields")
+        easing_table = kwargs.get("easing_table")
+        segment_interpolation_config = kwargs.get("segment_interpolation_config")
+        if (
+            self.t_precision is not None
+            or changed_fields is None
+            or easing_table is None
+            or kwargs.get("state_interpolation") is not None
+            or (start_state is end_state and segment_interpolation_config is None)
+        ):
+            return [
+                self.create_eased_state(
+                    start_state,
+                    end_state,
+                    t,
+                    segment_easing_overrides,
+                    attribute_keystates_fields,
+                    **kwargs,
+                )
+                for t in ts
+            ]
+
+        if kwargs.get("vertex_buffer") is not None:
+            _warn_vertex_buffer_deprecated()
+        exact_rotation = kwargs.get("exact_rotation", False)
+        plan = self._frame_plan(
+            start_state,
+            end_state,
+            segment_interpolation_config,
+            changed_fields,
+            exact_rotation,
+            easing_table,
+            kwargs.get("morphing_config"),
+        )
+        return [
+            self._eased_state_from_plan(
+                plan,
+                start_state,
+                end_state,
+                t,
+                segment_interpolation_config,
+                exact_rotation,
+            )
+            for t in ts
+        ]
+
+    def _create_eased_state(
+        self,
+        start_state: State,
+        end_state: State,
+        t: float,
+        segment_easing_overrides: dict[str, Callable[[float], float]] | None,
+        attribute_keystates_fields: set | frozenset,
+        segment_easing: Callable[[float], float] | None,
+        segment_interpolation_config: dict[str, Callable] | None,
+        morphing_config: Any | None,
+        changed_fields: tuple[set, dict[str, tuple[Any, Any]]] | None,
+        exact_rotation: bool,
+        state_interpolation: Callable | None,
+        easing_table: FieldEasingTable | None,
+    ) -> State:
+        """Uncached body of create_eased_state (same arguments)."""
         if state_interpolation is not None:
             eased_t = segment_easing(t) if segment_easing else t
             return state_interpolation(start_state, end_state, eased_t)
 
-        if start_state is end_state and segment_interpolation_config is None:
+        if segment_interpolation_config is None and (
+            start_state is end_state
+            or (
+                t == 0.0
+                and not start_state.is_final
+                and self._starts_at_zero(segment_easing_overrides, segment_easing)
+            )
+        ):
+            # When every easing maps 0 to 0, the segment start is the start
+            # state. There is no such shortcut at t=1: easing.none stays at 0.
             return start_state
 
+        if (
+            changed_fields is not None
+            and not changed_fields[0]
+            and not segment_interpolation_config
+        ):
+            # No field differs: the frame would be a copy of its base state
+            base = start_state if t < 0.5 else end_state
+            if not base.is_final:
+                return base
+
+        if easing_table is None:
+            easing_table = self._easing_table(segment_easing_overrides, segment_easing)
+
+        if changed_fields is not None:
+            return self._eased_state_from_plan(
+                self._frame_plan(
+                    start_state,
+                    end_state,
+                    segment_interpolation_config,
+                    changed_fields,
+                    exact_rotation,
+                    easing_table,
+                    morphing_config,
+                ),
+                start_state,
+                end_state,
+                t,
+                segment_interpolation_config,
+                exact_rotation,
+            )
+
         interpolated_values = {}
+        eased_by_easing: dict[Callable | None, EasedT] = {}
         mapper, vertex_aligner = self._extract_morphing_config(morphing_config)
+        non_interp = start_state.NON_INTERPOLATABLE_FIELDS
 
         for field_name, start_value, end_value in self._iter_fields_to_interpolate(
             start_state,
@@ -240,26 +479,22 @@ class InterpolationEngine:
             changed_fields,
         ):
             # Non-interpolatable: step function
-            if field_name in start_state.NON_INTERPOLATABLE_FIELDS:
+            if field_name in non_interp:
                 interpolated_values[field_name] = (
                     start_value if t < 0.5 else end_value
                 )
                 continue
 
             # Skip identical values unless a custom interpolation function exists
-            if start_value == end_value and (
+            if (start_value is end_value or start_value == end_value) and (
                 segment_interpolation_config is None
                 or field_name not in segment_interpolation_config
             ):
                 interpolated_values[field_name] = start_value
                 continue
 
-            # Get easing function for this field
-            easing_func = self.easing_resolver.get_easing_for_field(
-                field_name, segment_easing_overrides,
-                segment_easing=segment_easing,
-            )
-            eased_t = easing_func(t) if easing_func else t
+            easing_func = easing_table[field_name]
+            eased_t = _eased_once(eased_by_easing, easing_func, t)
 
             # Interpolate the value
             interpolated_values[field_name] = self.interpolate_value(
@@ -269,8 +504,7 @@ class InterpolationEngine:
                 start_value,
                 end_value,
                 eased_t,
-                vertex_buffer,
-                segment_interpolation_config,
+                segment_interpolation_config=segment_interpolation_config,
                 mapper=mapper,
                 vertex_aligner=vertex_aligner,
                 exact_rotation=exact_rotation,
@@ -281,9 +515,321 @@ class InterpolationEngine:
         interpolated_values["is_final"] = False
 
         if t < 0.5:
-            return replace(start_state, **interpolated_values)
+            return replace_state(start_state, interpolated_values)
         else:
-            return replace(end_state, **interpolated_values)
+            return replace_state(end_state, interpolated_values)
+
+    def _starts_at_zero(
+        self,
+        segment_easing_overrides: dict[str, Callable[[float], float]] | None,
+        segment_easing: Callable[[float], float] | None,
+    ) -> bool:
+        """Whether every easing a segment can use maps 0 to 0
+
+        Checked once per segment configuration, since custom easings need not
+        start at 0. Keyed on the contents of the easing dicts, which callers
+        may mutate between frames.
+        """
+        attribute_easing = self.easing_resolver.attribute_easing
+        key = (
+            _easing_items(segment_easing_overrides),
+            segment_easing,
+            _easing_items(attribute_easing),
+        )
+        starts_at_zero = self._zero_starts.get((), key)
+        if starts_at_zero is None:
+            easings = list((segment_easing_overrides or {}).values())
+            # A blanket segment easing replaces the attribute easings
+            if segment_easing is not None:
+                easings.append(segment_easing)
+            else:
+                easings.extend(attribute_easing.values())
+            starts_at_zero = self._zero_starts.put(
+                (), all(map(_maps_zero_to_zero, easings)), key
+            )
+        return starts_at_zero
+
+    def _easing_table(
+        self,
+        segment_easing_overrides: dict[str, Callable[[float], float]] | None,
+        segment_easing: Callable[[float], float] | None,
+    ) -> FieldEasingTable:
+        """Field easing table for a segment configuration, cached by contents
+
+        Field easings only depend on the segment's easing overrides, blanket
+        easing and the resolver's attribute easings, so callers that do not
+        pass an easing_table resolve each field once per configuration
+        instead of once per frame. The table resolves fields lazily, so it is
+        built from a copy of the overrides the key was taken from.
+        """
+        key = (
+            _easing_items(segment_easing_overrides),
+            segment_easing,
+            _easing_items(self.easing_resolver.attribute_easing),
+        )
+        table = self._easing_tables.get((), key)
+        if table is None:
+            table = self._easing_tables.put(
+                (),
+                self.easing_resolver.build_field_table(
+                    (),
+                    dict(segment_easing_overrides)
+                    if segment_easing_overrides is not None
+                    else None,
+                    segment_easing,
+                ),
+                key,
+            )
+        return table
+
+    def _frame_plan(
+        self,
+        start_state: State,
+        end_state: State,
+        segment_interpolation_config: dict[str, Callable] | None,
+        changed_fields: tuple[set, dict[str, tuple[Any, Any]]],
+        exact_rotation: bool,
+        easing_table: FieldEasingTable,
+        morphing_config: Any | None,
+    ) -> tuple:
+        """Per-field work of _create_eased_state that does not depend on t
+
+        Resolved once per segment and cached by identity of its inputs.
+        Returns (low_values, high_values, numeric_steps, steps, morphing):
+        - low_values, high_values: field values that are fixed for t < 0.5
+          and t >= 0.5 (step fields, equal values and the is_final marker)
+        - numeric_steps: (field_name, start_value, delta, easing_func) for
+          plain numeric fields, lerped inline
+        - steps: (field_name, start_value, end_value, easing_func,
+          leaf_interpolator) for every other field that changes with t; a
+          leaf_interpolator of None defers to interpolate_value
+        - morphing: the (mapper, vertex_aligner) pair of morphing_config
+        """
+        refs = (
+            start_state,
+            end_state,
+            segment_interpolation_config,
+            changed_fields,
+            easing_table,
+            morphing_config,
+        )
+        plan = self._frame_plans.get(refs, exact_rotation)
+        if plan is not None:
+            return plan
+
+        low_values: dict[str, Any] = {}
+        high_values: dict[str, Any] = {}
+        numeric_steps = []
+        steps = []
+        non_interp = start_state.NON_INTERPOLATABLE_FIELDS
+        interpolate_numeric = self._type_interpolators.interpolate_numeric
+        mapper, vertex_aligner = morphing = self._extract_morphing_config(
+            morphing_config
+        )
+        for field_name, start_value, end_value in self._iter_fields_to_interpolate(
+            start_state,
+            end_state,
+            set(),
+            segment_interpolation_config,
+            changed_fields,
+        ):
+            if field_name in non_interp:
+                low_values[field_name] = start_value
+                high_values[field_name] = end_value
+                continue
+
+            has_custom = (
+                segment_interpolation_config is not None
+                and field_name in segment_interpolation_config
+            )
+            if (start_value is end_value or start_value == end_value) and (
+                not has_custom
+            ):
+                low_values[field_name] = high_values[field_name] = start_value
+                continue
+
+            # List[State] fields are validated once here, not every frame.
+            # The lists are copied so the plan is unaffected by later edits.
+            if isinstance(start_value, list) or isinstance(end_value, list):
+                start_list = _normalize_to_state_list(start_value)
+                end_list = _normalize_to_state_list(end_value)
+                if start_list is not None and end_list is not None:
+                    steps.append(
+                        (
+                            field_name,
+                            list(start_list),
+                            list(end_list),
+                            easing_table[field_name],
+                            partial(
+                                self._interpolate_state_lists,
+                                mapper=mapper,
+                                vertex_aligner=vertex_aligner,
+                            ),
+                        )
+                    )
+                    continue
+
+            leaf_interpolator = None
+            if not has_custom:
+                leaf_interpolator = self._leaf_interpolator(
+                    start_state, field_name, start_value, end_value, exact_rotation
+                )
+            if leaf_interpolator == interpolate_numeric:
+                numeric_steps.append(
+                    (
+                        field_name,
+                        start_value,
+                        end_value - start_value,
+                        easing_table[field_name],
+                    )
+                )
+                continue
+            steps.append(
+                (
+                    field_name,
+                    start_value,
+                    end_value,
+                    easing_table[field_name],
+                    leaf_interpolator,
+                )
+            )
+
+        # Mid-segment frames are still changing (see _create_eased_state)
+        low_values["is_final"] = high_values["is_final"] = False
+        plan = (
+            low_values,
+            high_values,
+            tuple(numeric_steps),
+            tuple(steps),
+            morphing,
+        )
+        return self._frame_plans.put(refs, plan, exact_rotation)
+
+    def _interpolate_state_lists(
+        self,
+        start_list: list[State],
+        end_list: list[State],
+        eased_t: EasedT,
+        mapper: Any | None,
+        vertex_aligner: Any | None,
+    ) -> list[State]:
+        """List[State] step of a frame plan (lists already normalized)"""
+        if type(eased_t) is tuple:
+            eased_t = (eased_t[0] + eased_t[1]) / 2
+        return self._shape_list_interpolator.interpolate_state_list(
+            start_list,
+            end_list,
+            eased_t,
+            mapper=mapper,
+            vertex_aligner=vertex_aligner,
+        )
+
+    def _eased_state_from_plan(
+        self,
+        plan: tuple,
+        start_state: State,
+        end_state: State,
+        t: float,
+        segment_interpolation_config: dict[str, Callable] | None,
+        exact_rotation: bool,
+    ) -> State:
+        """Interpolated state at t from a plan built by _frame_plan"""
+        low_values, high_values, numeric_steps, steps, morphing = plan
+        base = start_state if t < 0.5 else end_state
+        interpolated_values = dict(low_values if t < 0.5 else high_values)
+        eased_by_easing: dict[Callable | None, EasedT] = {}
+        mapper, vertex_aligner = morphing
+
+        for field_name, start_value, delta, easing_func in numeric_steps:
+            eased_t = _eased_once(eased_by_easing, easing_func, t)
+            if type(eased_t) is tuple:
+                eased_t = (eased_t[0] + eased_t[1]) / 2
+            interpolated_values[field_name] = start_value + delta * eased_t
+
+        for field_name, start_value, end_value, easing_func, leaf in steps:
+            eased_t = _eased_once(eased_by_easing, easing_func, t)
+            if leaf is not None:
+                interpolated_values[field_name] = leaf(start_value, end_value, eased_t)
+            else:
+                interpolated_values[field_name] = self.interpolate_value(
+                    start_state,
+                    end_state,
+                    field_name,
+                    start_value,
+                    end_value,
+                    eased_t,
+                    segment_interpolation_config=segment_interpolation_config,
+                    mapper=mapper,
+                    vertex_aligner=vertex_aligner,
+                    exact_rotation=exact_rotation,
+                )
+
+        return replace_state(base, interpolated_values)
+
+    def _leaf_interpolator(
+        self,
+        start_state: State,
+        field_name: str,
+        start_value: Any,
+        end_value: Any,
+        exact_rotation: bool,
+    ) -> Callable[[Any, Any, EasedT], Any] | None:
+        """_resolve_leaf_interpolator, memoized in the leaf dispatch table"""
+        key = (
+            type(start_state),
+            field_name,
+            type(start_value),
+            type(end_value),
+            exact_rotation,
+        )
+        try:
+            return self._leaf_dispatch[key]
+        except KeyError:
+            leaf_interpolator = self._leaf_dispatch[key] = (
+                self._resolve_leaf_interpolator(
+                    start_state, field_name, start_value, end_value, exact_rotation
+                )
+            )
+            return leaf_interpolator
+
+    def _resolve_leaf_interpolator(
+        self,
+        start_state: State,
+        field_name: str,
+        start_value: Any,
+        end_value: Any,
+        exact_rotation: bool,
+    ) -> Callable[[Any, Any, EasedT], Any] | None:
+        """Pick the interpolate_value branch for plain leaf values.
+
+        Mirrors the dispatch order of interpolate_value for values whose
+        handling depends only on their types, the state type, the field name
+        and exact_rotation. Returns None for lists, states, effects, None,
+        contours and paths, which interpolate_value handles itself.
+        """
+        if (
+            field_name == "_aligned_contours"
+            or start_value is None
+            or end_value is None
+            or isinstance(start_value, _DISPATCHED_TYPES)
+            or isinstance(end_value, _DISPATCHED_TYPES)
+        ):
+            return None
+
+        type_interpolators = self._type_interpolators
+        if isinstance(start_value, Point2D) and isinstance(end_value, Point2D):
+            return type_interpolators.interpolate_point2d
+        if isinstance(start_value, Color) and isinstance(end_value, Color):
+            return type_interpolators.interpolate_color
+        if isinstance(start_value, (int, float)) and isinstance(
+            end_value, (int, float)
+        ):
+            if not exact_rotation and type_interpolators.is_angle_field(
+                start_state, field_name
+            ):
+                return type_interpolators.interpolate_angle
+            return type_interpolators.interpolate_numeric
+        return type_interpolators.interpolate_step
 
     def _interpolate_effect(
         self, start_value: Any, end_value: Any, scalar_t: float
@@ -298,7 +844,7 @@ class InterpolationEngine:
             return start_value.interpolate(end_value, scalar_t)  # type: ignore[union-attr]
         if isinstance(start_value, Filter) and isinstance(end_value, Filter):
             return start_value.interpolate(end_value, scalar_t)  # type: ignore[union-attr]
-        if isinstance(start_value, (Gradient, Pattern, Filter)):
+        if isinstance(start_value, _EFFECT_TYPES):
             return start_value  # Can't interpolate between different effect types
         return _NOT_HANDLED
 
@@ -313,10 +859,14 @@ class InterpolationEngine:
             start_opacity = (
                 start_value.opacity if start_value.opacity is not None else 1.0
             )
-            return replace(start_value, opacity=lerp(start_opacity, 0.0, scalar_t))
+            return replace_state(
+                start_value, {"opacity": lerp(start_opacity, 0.0, scalar_t)}
+            )
         if start_value is None and isinstance(end_value, State):
             end_opacity = end_value.opacity if end_value.opacity is not None else 1.0
-            return replace(end_value, opacity=lerp(0.0, end_opacity, scalar_t))
+            return replace_state(
+                end_value, {"opacity": lerp(0.0, end_opacity, scalar_t)}
+            )
         return _NOT_HANDLED
 
     def interpolate_value(
@@ -345,8 +895,30 @@ class InterpolationEngine:
         - Custom rotation before standard angle: overrides wraparound behavior
         - Angle before numeric: needs shortest-path wrapping
         - Numeric and step: fallback for remaining types
+
+        Plain leaf values (points, colors, numbers and other step values)
+        skip the ladder: their branch depends only on types, so it is
+        resolved once and looked up in the leaf dispatch table.
+
+        vertex_buffer is deprecated and ignored.
         """
-        scalar_t = _scalar_t(eased_t)
+        if vertex_buffer is not None:
+            _warn_vertex_buffer_deprecated()
+        if (
+            segment_interpolation_config is None
+            or field_name not in segment_interpolation_config
+        ):
+            leaf_interpolator = self._leaf_interpolator(
+                start_state, field_name, start_value, end_value, exact_rotation
+            )
+            if leaf_interpolator is not None:
+                return leaf_interpolator(start_value, end_value, eased_t)
+
+        # Scalar t for handlers without 2D easing: a 2D tuple is averaged
+        if type(eased_t) is tuple:
+            scalar_t = (eased_t[0] + eased_t[1]) / 2
+        else:
+            scalar_t = eased_t
 
         # List[State] interpolation (clip_states, mask_states, etc.)
         is_list_field = isinstance(start_value, list) or isinstance(end_value, list)
@@ -374,7 +946,6 @@ class InterpolationEngine:
                 start_value,
                 end_value,
                 scalar_t,
-                vertex_buffer,
             )
 
         # State interpolation (for clip_state, mask_state, and recursive calls)
@@ -396,18 +967,20 @@ class InterpolationEngine:
             return custom_func(
                 start_value,
                 end_value,
-                self._type_interpolators._extract_scalar_t(eased_t),
+                scalar_t,
             )
 
         # Effect interpolation (Gradient, Pattern, Filter)
-        result = self._interpolate_effect(start_value, end_value, scalar_t)
-        if result is not _NOT_HANDLED:
-            return result
+        if isinstance(start_value, _EFFECT_TYPES):
+            result = self._interpolate_effect(start_value, end_value, scalar_t)
+            if result is not _NOT_HANDLED:
+                return result
 
         # State ↔ None transitions (fade in/out)
-        result = self._interpolate_state_fade(start_value, end_value, scalar_t)
-        if result is not _NOT_HANDLED:
-            return result
+        if start_value is None or end_value is None:
+            result = self._interpolate_state_fade(start_value, end_value, scalar_t)
+            if result is not _NOT_HANDLED:
+                return result
 
         # Point2D interpolation (can use full eased_t for 2D easing)
         if isinstance(start_value, Point2D) and isinstance(end_value, Point2D):
@@ -426,7 +999,7 @@ class InterpolationEngine:
         # Color interpolation
         if isinstance(start_value, Color) and isinstance(end_value, Color):
             return self._type_interpolators.interpolate_color(
-                start_value, end_value, eased_t
+                start_value, end_value, scalar_t
             )
 
         # Angle interpolation (with wraparound handling)
@@ -437,7 +1010,7 @@ class InterpolationEngine:
         ):
             if not exact_rotation:
                 return self._type_interpolators.interpolate_angle(
-                    start_value, end_value, eased_t
+                    start_value, end_value, scalar_t
                 )
 
         # Numeric interpolation
@@ -445,10 +1018,10 @@ class InterpolationEngine:
             end_value, (int, float)
         ):
             return self._type_interpolators.interpolate_numeric(
-                start_value, end_value, eased_t
+                start_value, end_value, scalar_t
             )
 
         # Non-numeric values: step function at t=0.5
         return self._type_interpolators.interpolate_step(
-            start_value, end_value, eased_t
+            start_value, end_value, scalar_t
         )
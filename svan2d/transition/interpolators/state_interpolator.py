@@ -4,6 +4,9 @@ from dataclasses import replace
 from typing import Any
 
 from svan2d.primitive.state.base import State
+from svan2d.primitive.state.base_vertex import VertexState
+from svan2d.transition.align_vertices import get_aligned_vertices
+from svan2d.velement.morphing import MorphingConfig
 
 
 class NestedStateInterpolator:
@@ -40,8 +43,6 @@ class NestedStateInterpolator:
             vertex_aligner: Optional vertex aligner for shape morphing.
         """
         # Check if this is a morph between different VertexState types
-        from svan2d.primitive.state.base_vertex import VertexState
-
         start_state = start_value
         end_state = end_value
 
@@ -51,8 +52,6 @@ class NestedStateInterpolator:
             and start_value.need_morph(end_value)
         ):
             # Need to align vertices for morphing
-            from svan2d.transition.align_vertices import get_aligned_vertices
-
             contours1_aligned, contours2_aligned = get_aligned_vertices(
                 start_value,
                 end_value,
@@ -66,8 +65,6 @@ class NestedStateInterpolator:
         # Re-wrap mapper/aligner for recursive call
         morphing_config = None
         if mapper is not None or vertex_aligner is not None:
-            from svan2d.velement.morphing import MorphingConfig
-
             morphing_config = MorphingConfig(
                 mapper=mapper, vertex_aligner=vertex_aligner
             )
@@ -79,7 +76,6 @@ class NestedStateInterpolator:
             eased_t,
             segment_easing_overrides=None,
             attribute_keystates_fields=set(),
-            vertex_buffer=None,
             segment_interpolation_config=None,
             morphing_config=morphing_config,
         )
@@ -1,18 +1,30 @@
 """Interpolator for VertexContours (aligned vertices for morphing)."""
 
 import logging
+import warnings
 
 from svan2d.primitive.state.base import State
 from svan2d.primitive.vertex.vertex_contours import VertexContours
 from svan2d.primitive.vertex.vertex_loop import VertexLoop
-from svan2d.core.point2d import Points2D
+from svan2d.core.point2d import Point2D, Points2D
+from svan2d.transition.identity_cache import IdentityCache
 
 logger = logging.getLogger(__name__)
 
+# Cache miss marker: a cached table may itself be None
+_MISSING = object()
+
 
 class VertexContoursInterpolator:
     """Handles interpolation of VertexContours (outer contour + holes)."""
 
+    def __init__(self) -> None:
+        # (start, end), outer_closed -> lerp table for VertexContours pairs.
+        # Aligned contours are reused for every frame of a segment, so the
+        # start coordinates and deltas of the outer loop and all holes are
+        # concatenated once and interpolated in a single pass per frame.
+        self._contour_tables = IdentityCache()
+
     def interpolate(
         self,
         start_state: State,
@@ -31,11 +43,13 @@ class VertexContoursInterpolator:
             start_value: Starting VertexContours
             end_value: Ending VertexContours
             eased_t: Eased interpolation parameter (0.0 to 1.0)
-            vertex_buffer: Optional reusable buffer (outer_buffer, hole_buffers)
+            vertex_buffer: Deprecated and ignored
 
         Returns:
             Interpolated VertexContours
         """
+        if vertex_buffer is not None:
+            _warn_vertex_buffer_deprecated()
         # Handle empty contours - use step interpolation at midpoint
         if not start_value or not end_value:
             logger.warning(
@@ -55,15 +69,19 @@ class VertexContoursInterpolator:
         start_closed = getattr(start_state, "closed", True)
         end_closed = getattr(end_state, "closed", True)
 
+        table = self._contour_table(
+            start_value, end_value, start_closed and end_closed
+        )
+        if table is not None:
+            return self._interpolate_table(table, eased_t)
+
         # Interpolate outer vertices
         # NOTE: Path functions are NOT applied to vertices during morphing
         # They only apply to top-level Point2D fields like "pos"
-        outer_buffer = vertex_buffer[0] if vertex_buffer else None
         interpolated_vertices = self._interpolate_vertex_list(
-            start_value.outer.vertices,
-            end_value.outer.vertices,
+            start_value.outer,
+            end_value.outer,
             eased_t,
-            buffer=outer_buffer,
             ensure_closure=(start_closed and end_closed),
         )
 
@@ -72,12 +90,11 @@ class VertexContoursInterpolator:
             start_value.holes,
             end_value.holes,
             eased_t,
-            vertex_buffer,
         )
 
         # Return a VertexContours object with interpolated outer and vertex_loops
         return VertexContours(
-            outer=VertexLoop(
+            outer=VertexLoop.from_points(
                 interpolated_vertices, closed=start_closed and end_closed
             ),
             holes=interpolated_vertex_loops if interpolated_vertex_loops else None,
@@ -88,7 +105,6 @@ class VertexContoursInterpolator:
         start_holes: list[VertexLoop] | None,
         end_holes: list[VertexLoop] | None,
         eased_t: float,
-        vertex_buffer: tuple[list, list[list]] | None = None,
     ) -> list[VertexLoop]:
         """Interpolate hole vertex loops."""
         interpolated_vertex_loops = []
@@ -108,49 +124,40 @@ class VertexContoursInterpolator:
         for hole_idx, (hole1, hole2) in enumerate(
             zip(start_vertex_loops, end_vertex_loops)
         ):
-            if len(hole1.vertices) != len(hole2.vertices):
+            if len(hole1) != len(hole2):
                 logger.warning(
-                    f"Hole {hole_idx} vertex count mismatch: {len(hole1.vertices)} != {len(hole2.vertices)}. "
+                    f"Hole {hole_idx} vertex count mismatch: {len(hole1)} != {len(hole2)}. "
                     f"This should not happen if hole alignment was performed correctly. "
                     f"Using step interpolation at t=0.5 as fallback."
                 )
                 interpolated_vertex_loops.append(hole1 if eased_t < 0.5 else hole2)
             else:
                 # Interpolate hole vertices
-                hole_buffers = vertex_buffer[1] if vertex_buffer else []
-                hole_buffer = (
-                    hole_buffers[hole_idx]
-                    if (vertex_buffer and hole_idx < len(hole_buffers))
-                    else None
-                )
                 interp_hole_verts = self._interpolate_vertex_list(
-                    hole1.vertices,
-                    hole2.vertices,
+                    hole1,
+                    hole2,
                     eased_t,
-                    buffer=hole_buffer,
                     ensure_closure=True,  # Holes always closed
                 )
                 interpolated_vertex_loops.append(
-                    VertexLoop(interp_hole_verts, closed=True)
+                    VertexLoop.from_points(interp_hole_verts, closed=True)
                 )
 
         return interpolated_vertex_loops
 
     def _interpolate_vertex_list(
         self,
-        vertices1: Points2D,
-        vertices2: Points2D,
+        vertices1: Points2D | VertexLoop,
+        vertices2: Points2D | VertexLoop,
         eased_t: float,
-        buffer: Points2D | None = None,
         ensure_closure: bool = False,
     ) -> Points2D:
-        """Interpolate between two vertex lists with optional buffer optimization.
+        """Interpolate between two vertex lists or loops.
 
         Args:
-            vertices1: Start vertices
+            vertices1: Start vertices (loops are read without copying)
             vertices2: End vertices (must match length)
             eased_t: Interpolation parameter
-            buffer: Optional pre-allocated buffer for in-place operations
             ensure_closure: If True, force last vertex to equal first
 
         Returns:
@@ -161,29 +168,113 @@ class VertexContoursInterpolator:
                 f"Vertex lists must have same length: {len(vertices1)} != {len(vertices2)}"
             )
 
-        if buffer:
-            # Optimized path: Use pre-allocated buffer with in-place operations
-            num_verts = len(vertices1)
+        interpolated_vertices = _lerp_points(
+            *_lerp_columns(vertices1, vertices2), eased_t
+        )
 
-            # Resize buffer if needed (grow only, never shrink)
-            if len(buffer) < num_verts:
-                from svan2d.core.point2d import Point2D
+        # Ensure closure if requested
+        if ensure_closure and len(interpolated_vertices) > 1:
+            interpolated_vertices[-1] = interpolated_vertices[0]
+
+        return interpolated_vertices
 
-                buffer.extend(Point2D(0.0, 0.0) for _ in range(num_verts - len(buffer)))
+    def _contour_table(
+        self,
+        start_value: VertexContours,
+        end_value: VertexContours,
+        outer_closed: bool,
+    ) -> tuple | None:
+        """Concatenated lerp columns for a contour pair, cached by identity
 
-            # Interpolation
-            for i, (v1, v2) in enumerate(zip(vertices1, vertices2)):
-                buffer[i] = v1.lerp(v2, eased_t)
+        Returns (xs, ys, dxs, dys, loop_bounds, outer_closed), or None when
+        the holes of the two contours do not pair up (handled by the per-loop
+        fallback).
+        Closure is baked into the columns: the last entry of every closed
+        loop repeats its first, so each frame yields closed loops directly.
+        """
+        refs = (start_value, end_value)
+        table = self._contour_tables.get(refs, outer_closed, _MISSING)
+        if table is not _MISSING:
+            return table
 
-            interpolated_vertices = buffer[:num_verts]
+        start_holes = start_value.holes
+        end_holes = end_value.holes
+        if len(start_holes) != len(end_holes) or any(
+            len(h1) != len(h2) for h1, h2 in zip(start_holes, end_holes)
+        ):
+            table = None
         else:
-            # Fallback: Original behavior
-            interpolated_vertices = [
-                v1.lerp(v2, eased_t) for v1, v2 in zip(vertices1, vertices2)
-            ]
+            start_vertices = list(start_value.outer)
+            end_vertices = list(end_value.outer)
+            loop_bounds = [(0, len(start_vertices))]
+            for h1, h2 in zip(start_holes, end_holes):
+                start_vertices.extend(h1)
+                end_vertices.extend(h2)
+                loop_bounds.append((loop_bounds[-1][1], len(start_vertices)))
+            xs, ys, dxs, dys = _lerp_columns(start_vertices, end_vertices)
+            # Outer loop closes only if both states are closed; holes always do
+            closed_bounds = loop_bounds if outer_closed else loop_bounds[1:]
+            for lo, hi in closed_bounds:
+                if hi - lo > 1:
+                    xs[hi - 1] = xs[lo]
+                    ys[hi - 1] = ys[lo]
+                    dxs[hi - 1] = dxs[lo]
+                    dys[hi - 1] = dys[lo]
+            table = (xs, ys, dxs, dys, loop_bounds, outer_closed)
 
-        # Ensure closure if requested
-        if ensure_closure and len(interpolated_vertices) > 1:
-            interpolated_vertices[-1] = interpolated_vertices[0]
+        return self._contour_tables.put(refs, table, outer_closed)
 
-        return interpolated_vertices
+    def _interpolate_table(
+        self,
+        table: tuple,
+        eased_t: float,
+    ) -> VertexContours:
+        """Interpolate the outer loop and all holes from one contour table"""
+        xs, ys, dxs, dys, loop_bounds, outer_closed = table
+        points = _lerp_points(xs, ys, dxs, dys, eased_t)
+
+        # Holes are always closed
+        loops = [
+            VertexLoop.from_points(points[lo:hi], closed=outer_closed or i > 0)
+            for i, (lo, hi) in enumerate(loop_bounds)
+        ]
+
+        return VertexContours(outer=loops[0], holes=loops[1:] or None)
+
+
+def _warn_vertex_buffer_deprecated() -> None:
+    """Warn the caller of a public method that passed a vertex buffer"""
+    warnings.warn(
+        "vertex_buffer is deprecated and ignored: interpolated vertices are "
+        "returned in new VertexLoops, never written to a buffer",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def _lerp_columns(
+    vertices1: Points2D | VertexLoop, vertices2: Points2D | VertexLoop
+) -> tuple[list[float], list[float], list[float], list[float]]:
+    """Start coordinates and deltas of two equally long vertex lists"""
+    xs = [v.x for v in vertices1]
+    ys = [v.y for v in vertices1]
+    dxs = [v2.x - x for v2, x in zip(vertices2, xs)]
+    dys = [v2.y - y for v2, y in zip(vertices2, ys)]
+    return xs, ys, dxs, dys
+
+
+def _lerp_points(
+    xs: list[float],
+    ys: list[float],
+    dxs: list[float],
+    dys: list[float],
+    t: float,
+) -> Points2D:
+    """Points at parameter t from lerp columns"""
+    return list(
+        map(
+            Point2D,
+            [x + dx * t for x, dx in zip(xs, dxs)],
+            [y + dy * t for y, dy in zip(ys, dys)],
+        )
+    )
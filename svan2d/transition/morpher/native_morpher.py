@@ -1,5 +1,6 @@
 from typing import Any
 
+from svan2d.path.morphing import PathMorphTable
 from svan2d.path.svg_path import SVGPath
 
 from .base_morpher import BaseMorpher  # Assumed parent class location
@@ -25,6 +26,8 @@ class NativeMorpher(BaseMorpher):
     def __init__(self, path1: SVGPath, path2: SVGPath, **kwargs):
         # Initializes self.path1, self.path2, and self._cache
         super().__init__(path1, path2, **kwargs)
+        # Conversion and normalization are independent of t: do them once
+        self._table = PathMorphTable(path1, path2)
 
     def __call__(self, t: float) -> SVGPath:
         """
@@ -32,12 +35,9 @@ class NativeMorpher(BaseMorpher):
         t-value cache helper.
         """
 
-        # 1. Define the unique core logic for native interpolation
-        def core_interpolation(t_val):
-            return SVGPath.interpolate(self.path1, self.path2, t_val)
-
-        # 2. Use the shared caching logic from the parent class
-        return self._interpolate_with_caching(t, core_interpolation)
+        # Use the shared caching logic from the parent class around the
+        # precomputed table's per-frame interpolation
+        return self._interpolate_with_caching(t, self._table.interpolate)
 
     def close(self):
         """Clears the result cache via the parent class."""
@@ -3,12 +3,27 @@
 from svan2d.primitive.state.base import State
 from svan2d.primitive.state.path import MorphMethod
 from svan2d.path import SVGPath
+from svan2d.path.commands import ClosePath
+from svan2d.transition.identity_cache import IdentityCache
 from svan2d.transition.morpher import FlubberMorpher, NativeMorpher
 
+# Path pairs whose morphers are kept across frames, and the t-value cache of
+# each native morpher. Every frame of a segment asks for a new t, so the
+# t-cache only serves repeats within a frame; together the two bound the
+# interpolated paths kept alive to 64 * 4.
+_MORPHER_CACHE_SIZE = 64
+_NATIVE_T_CACHE_SIZE = 4
+
 
 class PathMorpher:
     """Handles SVG path interpolation with automatic morph method selection."""
 
+    def __init__(self) -> None:
+        # (start, end), shape? -> morpher. Keyframe paths are reused for every
+        # frame of a segment, so the morpher (and its alignment or
+        # triangulation) is built once per pair, not per frame.
+        self._morphers = IdentityCache(_MORPHER_CACHE_SIZE)
+
     def interpolate(
         self,
         state: State,
@@ -34,19 +49,32 @@ class PathMorpher:
         """
         morph_method = getattr(state, "morph_method", None)
 
-        # Explicit shape morph
         if morph_method == MorphMethod.SHAPE or morph_method == "shape":
-            return FlubberMorpher.for_paths(start_path, end_path)(eased_t)
+            # Explicit shape morph
+            shape = True
+        elif morph_method == MorphMethod.STROKE or morph_method == "stroke":
+            # Explicit stroke morph
+            shape = False
+        else:
+            # Auto-detect: use shape morph for closed paths, stroke for open
+            shape = self._is_closed(start_path)
+
+        return self._morpher(start_path, end_path, shape)(eased_t)
 
-        # Explicit stroke morph
-        if morph_method == MorphMethod.STROKE or morph_method == "stroke":
-            return NativeMorpher.for_paths(start_path, end_path)(eased_t)
+    def _morpher(self, start_path: SVGPath, end_path: SVGPath, shape: bool):
+        """Morpher for a path pair, cached by identity of the paths"""
+        refs = (start_path, end_path)
+        morpher = self._morphers.get(refs, shape)
+        if morpher is not None and not getattr(morpher, "_is_closed", False):
+            return morpher
 
-        # Auto-detect: use shape morph for closed paths, stroke for open
-        if self._is_closed(start_path):
-            return FlubberMorpher.for_paths(start_path, end_path)(eased_t)
+        if shape:
+            morpher = FlubberMorpher.for_paths(start_path, end_path)
         else:
-            return NativeMorpher.for_paths(start_path, end_path)(eased_t)
+            morpher = NativeMorpher.for_paths(
+                start_path, end_path, max_cache_size=_NATIVE_T_CACHE_SIZE
+            )
+        return self._morphers.put(refs, morpher, shape)
 
     def _is_closed(self, path: SVGPath, tolerance: float = 0.01) -> bool:
         """
@@ -64,8 +92,8 @@ class PathMorpher:
             True if path is closed
         """
         # Check for explicit 'Z' close command
-        path_str = path.to_string().strip().upper()
-        if path_str.endswith("Z"):
+        commands = path.commands
+        if commands and isinstance(commands[-1], ClosePath):
             return True
 
         # Check if start and end points are close enough
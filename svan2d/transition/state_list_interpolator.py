@@ -6,14 +6,11 @@ Used for StateCollectionState and general List[State] attributes.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-if TYPE_CHECKING:
-    from svan2d.primitive.state.base import State
-
 import logging
 from dataclasses import replace
+from typing import Any
 
+from svan2d.primitive.state.base import State
 from svan2d.transition.mapping import GreedyMapper, Mapper, Match
 
 logger = logging.getLogger(__name__)
@@ -27,8 +24,6 @@ def _normalize_to_state_list(value: Any) -> list[State] | None:
     - List[State] → List[State]
     - Other → None (not a state field)
     """
-    from svan2d.primitive.state.base import State
-
     if value is None:
         return []
     elif isinstance(value, State):
@@ -192,7 +187,6 @@ class StateListInterpolator:
             start_value=s1_clean,
             end_value=s2_clean,
             eased_t=eased_t,
-            vertex_buffer=None,
             mapper=mapper,
             vertex_aligner=vertex_aligner,
         )
@@ -201,7 +195,7 @@ class StateListInterpolator:
 
     def _clean_state(self, state: State) -> State:
         """Clean state for final output (remove _aligned_contours)"""
-        if hasattr(state, "_aligned_contours") and getattr(state, "_aligned_contours") is not None:
+        if getattr(state, "_aligned_contours", None) is not None:
             return replace(state, _aligned_contours=None)
         return state
 
@@ -214,10 +208,12 @@ class StateListInterpolator:
         assert state.opacity is not None
         updates = {"opacity": state.opacity * opacity_factor}
 
-        if hasattr(state, "fill_opacity") and getattr(state, "fill_opacity") is not None:
-            updates["fill_opacity"] = getattr(state, "fill_opacity") * opacity_factor
+        fill_opacity = getattr(state, "fill_opacity", None)
+        if fill_opacity is not None:
+            updates["fill_opacity"] = fill_opacity * opacity_factor
 
-        if hasattr(state, "stroke_opacity") and getattr(state, "stroke_opacity") is not None:
-            updates["stroke_opacity"] = getattr(state, "stroke_opacity") * opacity_factor
+        stroke_opacity = getattr(state, "stroke_opacity", None)
+        if stroke_opacity is not None:
+            updates["stroke_opacity"] = stroke_opacity * opacity_factor
 
         return replace(state, **updates)
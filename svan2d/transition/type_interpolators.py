@@ -11,6 +11,9 @@ from svan2d.core.scalar_functions import angle, lerp, step
 # Type alias for easing result - can be scalar (normal) or tuple (2D easing)
 EasedT = float | tuple[float, float]
 
+# State class -> names of its fields marked as angles by is_angle()
+_ANGLE_FIELD_CACHE: dict[type, frozenset[str]] = {}
+
 
 class TypeInterpolators:
     """Handles interpolation of primitive and common value types."""
@@ -18,9 +21,9 @@ class TypeInterpolators:
     @staticmethod
     def _extract_scalar_t(eased_t: EasedT) -> float:
         """Convert 2D easing tuple to scalar by averaging."""
-        if isinstance(eased_t, (int, float)):
-            return eased_t
-        return (eased_t[0] + eased_t[1]) / 2
+        if type(eased_t) is tuple:
+            return (eased_t[0] + eased_t[1]) / 2
+        return eased_t
 
     def interpolate_point2d(
         self,
@@ -73,7 +76,8 @@ class TypeInterpolators:
         Returns:
             Interpolated Color
         """
-        return start_value.interpolate(end_value, self._extract_scalar_t(eased_t))
+        eased_t = self._extract_scalar_t(eased_t)
+        return start_value.interpolate(end_value, eased_t)
 
     def interpolate_angle(
         self,
@@ -92,8 +96,8 @@ class TypeInterpolators:
         Returns:
             Interpolated angle
         """
-        scalar_t = self._extract_scalar_t(eased_t)
-        return angle(start_value, end_value, scalar_t)
+        eased_t = self._extract_scalar_t(eased_t)
+        return angle(start_value, end_value, eased_t)
 
     def interpolate_numeric(
         self,
@@ -112,8 +116,9 @@ class TypeInterpolators:
         Returns:
             Interpolated number
         """
-        scalar_t = self._extract_scalar_t(eased_t)
-        return lerp(start_value, end_value, scalar_t)
+        eased_t = self._extract_scalar_t(eased_t)
+        # lerp(), inlined: this runs for every numeric field of every frame
+        return start_value + (end_value - start_value) * eased_t
 
     def interpolate_step(
         self,
@@ -134,13 +139,16 @@ class TypeInterpolators:
         Returns:
             start_value if t < 0.5, else end_value
         """
-        scalar_t = self._extract_scalar_t(eased_t)
-        return step(start_value, end_value, scalar_t)
+        eased_t = self._extract_scalar_t(eased_t)
+        return step(start_value, end_value, eased_t)
 
     def is_angle_field(self, state: State, field_name: str) -> bool:
         """
         Check if a field represents an angle value.
 
+        is_angle() is evaluated once per state class; the resulting set of
+        angle field names is cached.
+
         Args:
             state: State object
             field_name: Name of the field to check
@@ -148,11 +156,14 @@ class TypeInterpolators:
         Returns:
             True if field represents an angle
         """
-        if not hasattr(state, "is_angle"):
-            return False
-
-        field_obj = next((f for f in fields(state) if f.name == field_name), None)
-        if field_obj:
-            return state.is_angle(field_obj)
-
-        return False
+        cls = type(state)
+        angle_fields = _ANGLE_FIELD_CACHE.get(cls)
+        if angle_fields is None:
+            if hasattr(state, "is_angle"):
+                angle_fields = frozenset(
+                    f.name for f in fields(state) if state.is_angle(f)
+                )
+            else:
+                angle_fields = frozenset()
+            _ANGLE_FIELD_CACHE[cls] = angle_fields
+        return field_name in angle_fields
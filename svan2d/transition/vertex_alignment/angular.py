@@ -155,7 +155,22 @@ class AngularAligner(VertexAligner):
         angles2 = [angle_from_centroid(v, c2) for v in verts2_work]
 
         # Find rotation offset that minimizes total angular distance (using specified norm)
-        n = len(verts2)
+        if self._distance_fn == self._l1_distance:
+            best_offset = _l1_best_offset(angles1, angles2)
+        else:
+            best_offset = self._best_offset(angles1, angles2)
+
+        # Apply best offset to original vertices using in-place rotation
+        if best_offset == 0:
+            verts2_aligned = verts2
+        else:
+            verts2_aligned = rotate_list(verts2, best_offset)
+
+        return verts1, verts2_aligned
+
+    def _best_offset(self, angles1: list[float], angles2: list[float]) -> int:
+        """Try every offset with the configured distance function"""
+        n = len(angles2)
         best_offset = 0
         min_distance = float("inf")
 
@@ -167,10 +182,33 @@ class AngularAligner(VertexAligner):
                 min_distance = total_dist
                 best_offset = offset
 
-        # Apply best offset to original vertices using in-place rotation
-        if best_offset == 0:
-            verts2_aligned = verts2
+        return best_offset
+
+
+def _l1_best_offset(angles1: list[float], angles2: list[float]) -> int:
+    """Offset minimizing the L1 angular distance
+
+    Same result as scanning with AngularAligner._l1_distance, but walks a
+    doubled copy of angles2 instead of indexing modulo n, inlines the angular
+    distance, and abandons an offset as soon as its running sum can no longer
+    beat the best one found so far.
+    """
+    tau = 2 * math.pi
+    pi = math.pi
+    n = len(angles2)
+    doubled = angles2 + angles2
+    best_offset = 0
+    min_distance = float("inf")
+
+    for offset in range(n):
+        total = 0
+        for a1, a2 in zip(angles1, doubled[offset : offset + n]):
+            diff = (a2 - a1) % tau
+            total += tau - diff if diff > pi else diff
+            if total >= min_distance:
+                break
         else:
-            verts2_aligned = rotate_list(verts2, best_offset)
+            min_distance = total
+            best_offset = offset
 
-        return verts1, verts2_aligned
+    return best_offset
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+import warnings
 from dataclasses import replace
 from typing import TYPE_CHECKING, Callable
 
-from svan2d.primitive import State, VertexState
+from svan2d.primitive import State
 from svan2d.velement.attribute_timeline import AttributeTimelineResolver
 from svan2d.velement.vertex_alignment import VertexAligner
 
 if TYPE_CHECKING:
-    from svan2d.core.point2d import Point2D, Points2D
-    from svan2d.transition.easing_resolver import EasingResolver
+    from svan2d.core.point2d import Points2D
+    from svan2d.transition.easing_resolver import EasingResolver, FieldEasingTable
     from svan2d.transition.interpolation_engine import InterpolationEngine
     from svan2d.velement.keystate import KeyStates
 
@@ -48,24 +49,36 @@ class StateInterpolator:
             easing_resolver: Easing resolver for field easing
             interpolation_engine: Interpolation engine for state interpolation
             vertex_aligner: Optional vertex aligner for shape morphing (VElement only)
-            get_vertex_buffer: Optional vertex buffer getter for optimized interpolation
+            get_vertex_buffer: Deprecated and ignored
         """
+        if get_vertex_buffer is not None:
+            warnings.warn(
+                "get_vertex_buffer is deprecated and ignored: interpolated "
+                "vertices are never written to a buffer",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.keystates = keystates
         self.attribute_timelines = attribute_timelines
         self.easing_resolver = easing_resolver
         self.interpolation_engine = interpolation_engine
         self.vertex_aligner = vertex_aligner
-        self._get_vertex_buffer = get_vertex_buffer
 
         # Create timeline resolver
         self.timeline_resolver = AttributeTimelineResolver(
             attribute_timelines, keystates, easing_resolver, interpolation_engine
         )
 
+        # Fields driven by attribute timelines; excluded from keystate interpolation
+        self._attribute_fields = frozenset(attribute_timelines)
+
         # Cache for pre-computed changed fields per segment
         # Key: segment_idx, Value: (changed_field_names, field_values)
         self._changed_fields_cache: dict[int, tuple] = {}
 
+        # Per-segment field easing tables, resolved once per segment
+        self._easing_table_cache: dict[int, FieldEasingTable] = {}
+
         # Per-segment "endpoints are equal" flag. When True, interpolation is a
         # no-op and we can return the endpoint state directly (after field
         # timelines), skipping the heavy create_eased_state path.
@@ -267,30 +280,8 @@ class StateInterpolator:
                         state1, state2, segment_t
                     )
 
-                # Get vertex buffer for optimized interpolation (if available)
-                vertex_buffer = None
-                if (
-                    isinstance(state1, VertexState)
-                    and isinstance(state2, VertexState)
-                    and self._get_vertex_buffer is not None
-                ):
-                    num_verts = (
-                        len(state1._aligned_contours.outer.vertices)
-                        if state1._aligned_contours
-                        else 0
-                    )
-                    num_vertex_loops = (
-                        len(state1._aligned_contours.holes)
-                        if (state1._aligned_contours and state1._aligned_contours.holes)
-                        else 0
-                    )
-                    if num_verts > 0:
-                        vertex_buffer = self._get_vertex_buffer(
-                            num_verts, num_vertex_loops
-                        )
-
                 # Get or compute changed fields for this segment (lazy field interpolation)
-                attr_fields = set(self.attribute_timelines.keys())
+                attr_fields = self._attribute_fields
                 if i not in self._changed_fields_cache:
                     from svan2d.transition.interpolation_engine import (
                         InterpolationEngine,
@@ -303,6 +294,17 @@ class StateInterpolator:
                     )
                 changed_fields = self._changed_fields_cache[i]
 
+                easing_table = self._easing_table_cache.get(i)
+                if easing_table is None:
+                    tc = ks1.transition_config
+                    easing_table = self._easing_table_cache[i] = (
+                        self.easing_resolver.build_field_table(
+                            changed_fields[0],
+                            tc.easing_dict if tc else None,
+                            tc.easing if tc else None,
+                        )
+                    )
+
                 interpolated_state = self.interpolation_engine.create_eased_state(
                     state1,
                     state2,
@@ -318,7 +320,6 @@ class StateInterpolator:
                         if ks1.transition_config
                         else None
                     ),
-                    vertex_buffer=vertex_buffer,
                     segment_interpolation_config=(
                         ks1.transition_config.interpolation_dict
                         if ks1.transition_config
@@ -340,6 +341,7 @@ class StateInterpolator:
                         if ks1.transition_config
                         else None
                     ),
+                    easing_table=easing_table,
                 )
 
                 return self.timeline_resolver.apply_field_timelines(interpolated_state, t)
@@ -12,7 +12,7 @@ from svan2d.primitive import (
     State,
     get_renderer_instance_for_state,
 )
-from svan2d.core.point2d import Point2D, Points2D
+from svan2d.core.point2d import Point2D
 from svan2d.velement.base_velement import _UNSET, BaseVElement, _Unset
 from svan2d.velement.builder import BuilderState, KeystateTuple, KeystateBuilder
 from svan2d.velement.keystate import KeyState
@@ -83,7 +83,6 @@ class VElement(BaseVElement, KeystateBuilder):
         "_skia_renderer",
         "mask_element",
         "clip_elements",
-        "_vertex_buffer_cache",
         "_shape_list_cache",
         "_builder",
         "_attribute_easing",
@@ -123,11 +122,6 @@ class VElement(BaseVElement, KeystateBuilder):
             _clip_elements if _clip_elements is not None else []
         )
 
-        # Vertex buffer cache for optimized interpolation
-        self._vertex_buffer_cache: dict[
-            tuple[int, int], tuple[Points2D, list[Points2D]]
-        ] = {}
-
         # Shape list matching cache for multi-shape morphing
         self._shape_list_cache: dict[
             tuple[str, int], tuple[list[State], list[State]]
@@ -191,7 +185,6 @@ class VElement(BaseVElement, KeystateBuilder):
         new.clip_elements = (
             clip_elements if clip_elements is not None else self.clip_elements.copy()
         )
-        new._vertex_buffer_cache = {}
         new._shape_list_cache = {}
         new._builder = builder if builder is not None else self._builder
         new._attribute_easing = (
@@ -261,7 +254,6 @@ class VElement(BaseVElement, KeystateBuilder):
             easing_resolver=easing_resolver,
             interpolation_engine=interpolation_engine,
             vertex_aligner=VertexAligner(),
-            get_vertex_buffer=self._get_vertex_buffer,
         )
 
     # =========================================================================
@@ -441,21 +433,6 @@ class VElement(BaseVElement, KeystateBuilder):
             clip_states=clip_states_at_t if clip_states_at_t is not None else state.clip_states,
         )
 
-    def _get_vertex_buffer(
-        self, num_verts: int, num_vertex_loops: int
-    ) -> tuple[Points2D, list[Points2D]]:
-        """Get or create reusable vertex buffer, keyed by (vertex_count, hole_count) to avoid per-frame allocation."""
-        key = (num_verts, num_vertex_loops)
-        if key not in self._vertex_buffer_cache:
-            outer_buffer = [Point2D(0.0, 0.0) for _ in range(num_verts)]
-            hole_buffers = [
-                [Point2D(0.0, 0.0) for _ in range(num_verts)]
-                for _ in range(num_vertex_loops)
-            ]
-            self._vertex_buffer_cache[key] = (outer_buffer, hole_buffers)
-
-        return self._vertex_buffer_cache[key]
-
     def _ensure_shapes_matched(
         self,
         field_name: str,
@@ -209,7 +209,6 @@ class VElementGroup(BaseVElement, KeystateBuilder):
             easing_resolver=easing_resolver,
             interpolation_engine=interpolation_engine,
             # No vertex_aligner - groups don't morph shapes
-            # No get_vertex_buffer - groups don't have vertices
         )
 
     # =========================================================================
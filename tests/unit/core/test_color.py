@@ -340,6 +340,13 @@ class TestColorSpaceConversions:
         assert rgb[1] == pytest.approx(64, abs=2)
         assert rgb[2] == pytest.approx(192, abs=2)
 
+    def test_lab_interpolation_stable_beyond_cache_size(self):
+        """A palette larger than the LAB cache interpolates the same twice"""
+        palette = [Color(i % 256, (i // 256) % 256, 128) for i in range(5000)]
+        first = [c.interpolate(WHITE, 0.5) for c in palette]
+        assert [c.interpolate(WHITE, 0.5) for c in palette] == first
+        assert first[12 + 17 * 256] == Color(12, 17, 128).interpolate(WHITE, 0.5)
+
 
 @pytest.mark.unit
 class TestColorInterpolationFunctions:
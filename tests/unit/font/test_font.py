@@ -70,6 +70,37 @@ class TestBezierSampler:
         assert len(result) > 0
 
 
+@pytest.mark.unit
+class TestBezierSamplerFunctions:
+    """Tests for the polynomial-form bezier sampling functions."""
+
+    def test_cubic_samples_match_bernstein_form(self):
+        from svan2d.core.point2d import Point2D
+        from svan2d.font.bezier_sampler import sample_cubic_bezier
+
+        p0, p1, p2, p3 = Point2D(0, 0), Point2D(25, 100), Point2D(75, 100), Point2D(100, 0)
+        result = sample_cubic_bezier(p0, p1, p2, p3, 8)
+
+        assert len(result) == 8
+        assert result[0] == p0
+        for i, point in enumerate(result):
+            t = i / 8
+            mt = 1 - t
+            x = mt**3 * p0.x + 3 * mt**2 * t * p1.x + 3 * mt * t**2 * p2.x + t**3 * p3.x
+            y = mt**3 * p0.y + 3 * mt**2 * t * p1.y + 3 * mt * t**2 * p2.y + t**3 * p3.y
+            assert point.x == pytest.approx(x)
+            assert point.y == pytest.approx(y)
+
+    def test_quadratic_arc_length_of_straight_curve(self):
+        from svan2d.core.point2d import Point2D
+        from svan2d.font.bezier_sampler import estimate_quadratic_arc_length
+
+        length = estimate_quadratic_arc_length(
+            Point2D(0, 0), Point2D(50, 0), Point2D(100, 0)
+        )
+        assert length == pytest.approx(100)
+
+
 @pytest.mark.unit
 class TestContourClassifier:
     """Tests for ContourClassifier class."""
@@ -121,3 +152,58 @@ class TestFontGlyphs:
             assert FontGlyphs is not None
         except ImportError:
             pytest.skip("fonttools not installed")
+
+
+@pytest.mark.unit
+class TestGlyphToSVGPath:
+    """Tests for glyph outline to SVG path conversion."""
+
+    def _contour(self, segments):
+        from svan2d.core.point2d import Point2D
+        from svan2d.font.glyph_extractor import BezierSegment, GlyphContour
+
+        return GlyphContour(
+            [BezierSegment(t, [Point2D(x, y) for x, y in pts]) for t, pts in segments]
+        )
+
+    def test_all_segment_types(self):
+        from svan2d.font.glyph_to_svg_path import _contour_to_svg_path
+
+        contour = self._contour(
+            [
+                ("line", [(10, 0)]),
+                ("qcurve", [(15, 5), (20, 10)]),
+                ("qcurve", [(20, 20)]),
+                ("qcurve", [(25, 25), (30, 30), (35, 35), (40, 40)]),
+                ("curve", [(1, 2), (3, 4), (0, 0)]),
+                ("curve", [(5, 5), (0, 0)]),
+            ]
+        )
+        result = _contour_to_svg_path(contour, 1.0, 0.0, 0.0, False)
+        assert result == (
+            "M 0.000 0.000 L 10.000 0.000 Q 15.000 5.000 20.000 10.000 "
+            "L 20.000 20.000 Q 25.000 25.000 30.000 30.000 "
+            "Q 35.000 35.000 40.000 40.000 "
+            "C 1.000 2.000 3.000 4.000 0.000 0.000 L 0.000 0.000 Z"
+        )
+
+    def test_scale_offset_and_flip(self):
+        from svan2d.font.glyph_to_svg_path import _contour_to_svg_path
+
+        contour = self._contour([("line", [(10, 10)]), ("line", [(0, 0)])])
+        result = _contour_to_svg_path(contour, 2.0, 1.0, 5.0, True)
+        assert result == "M 1.000 5.000 L 21.000 -15.000 L 1.000 5.000 Z"
+
+    def test_line_only_contour_matches_general_path(self):
+        from svan2d.font.glyph_to_svg_path import (
+            _contour_to_svg_path,
+            _line_contour_to_svg_path,
+            _segment_contour_to_svg_path,
+        )
+
+        pts = [(0.1234, 5.5), (100.0005, -3.25), (42, 7), (-0.0004, 0.0006)]
+        contour = self._contour([("line", [p]) for p in pts])
+        for args in ((1.5, 2.0, -3.0, True), (1.0, 0.0, 0.0, False)):
+            fast = _contour_to_svg_path(contour, *args)
+            assert fast == _line_contour_to_svg_path(contour.segments, *args)
+            assert fast == _segment_contour_to_svg_path(contour.segments, *args)
@@ -48,6 +48,67 @@ class TestCircleLayout:
         assert positioned[0].x == pytest.approx(0, abs=1.0)
         assert positioned[0].y == pytest.approx(100, abs=1.0)
 
+    def test_circle_layout_matches_replace(self):
+        """Cloned states equal replace()-built ones and leave inputs untouched"""
+        from dataclasses import replace
+
+        states = [CircleState(radius=10, rotation=15) for _ in range(4)]
+        positioned = layout.circle(
+            states, radius=100, alignment=layout.ElementAlignment.LAYOUT
+        )
+
+        for i, (src, out) in enumerate(zip(states, positioned)):
+            angle = i * 90
+            expected = replace(
+                src,
+                pos=Point2D(
+                    100 * math.cos(math.radians(angle)),
+                    100 * math.sin(math.radians(angle)),
+                ),
+                rotation=angle - 90,
+            )
+            assert out == expected
+            assert out is not src
+            assert src.pos == Point2D(0, 0)
+            assert src.rotation == 15
+
+    def test_circle_layout_mixed_state_classes(self):
+        """Each state class keeps its own cloning behavior"""
+        from dataclasses import dataclass
+
+        from svan2d.primitive.state.base import State
+
+        @dataclass(frozen=True)
+        class PlainState(State):
+            pass
+
+        states = [PlainState(), CircleState(radius=10), PlainState()]
+        positioned = layout.circle(states, radius=100)
+
+        assert [type(s) for s in positioned] == [PlainState, CircleState, PlainState]
+        assert positioned[1].radius == 10
+        for i, out in enumerate(positioned):
+            angle = math.radians(i * 120)
+            assert out.x == pytest.approx(100 * math.cos(angle))
+            assert out.y == pytest.approx(100 * math.sin(angle))
+
+    def test_circle_layout_runs_custom_post_init(self):
+        """States with their own __post_init__ are rebuilt via replace()"""
+        from dataclasses import dataclass
+
+        @dataclass(frozen=True)
+        class TrackedState(CircleState):
+            distance: float = 0.0
+
+            def __post_init__(self):
+                super().__post_init__()
+                object.__setattr__(self, "distance", abs(self.pos.x))
+
+        positioned = layout.circle([TrackedState(), TrackedState()], radius=100)
+
+        assert positioned[0].distance == pytest.approx(100)
+        assert positioned[1].distance == pytest.approx(100)
+
 
 @pytest.mark.unit
 class TestEllipseLayout:
@@ -0,0 +1,60 @@
+"""Tests for svan2d.path.builders module."""
+
+import pytest
+
+from svan2d.core.point2d import Point2D
+from svan2d.path.builders import (
+    circle_as_beziers,
+    circle_as_beziers_array,
+    rectangle,
+    rectangle_array,
+    rectangles,
+)
+from svan2d.path.commands import CubicBezier, LineTo, MoveTo
+
+
+@pytest.mark.unit
+class TestRectangles:
+    """Tests for the bulk rectangle builder."""
+
+    def test_matches_single_rectangle(self):
+        xs, ys, ws, hs = [0, 10, -5], [0, 20, 3], [1, 2, 3], [4, 5, 6]
+        paths = rectangles(xs, ys, ws, hs)
+        expected = [
+            rectangle(Point2D(x, y), w, h) for x, y, w, h in zip(xs, ys, ws, hs)
+        ]
+        assert paths == expected
+
+    def test_empty_columns(self):
+        assert rectangles([], [], [], []) == []
+
+    def test_mismatched_lengths_raises(self):
+        with pytest.raises(ValueError):
+            rectangles([0, 1], [0], [1, 1], [1, 1])
+
+
+@pytest.mark.unit
+class TestPackedBuilders:
+    """Tests for the packed-coordinate builders."""
+
+    def test_rectangle_array_matches_rectangle_corners(self):
+        pos = Point2D(3, 4)
+        buf = rectangle_array(pos, 10, 20)
+        path = rectangle(pos, 10, 20)
+        corners = [
+            cmd.pos for cmd in path.commands if isinstance(cmd, (MoveTo, LineTo))
+        ]
+        assert list(buf) == [c for p in corners for c in (p.x, p.y)]
+
+    def test_circle_array_matches_circle_points(self):
+        center = Point2D(5, -5)
+        buf = circle_as_beziers_array(center, 50)
+        path = circle_as_beziers(center, 50)
+
+        points = [path.commands[0].pos]
+        for cmd in path.commands[1:]:
+            if isinstance(cmd, CubicBezier):
+                points.extend([cmd.center1, cmd.center2, cmd.pos])
+
+        assert len(buf) == 26
+        assert list(buf) == [c for p in points for c in (p.x, p.y)]
@@ -0,0 +1,85 @@
+"""Tests for svan2d.path.commands module."""
+
+import pytest
+
+from svan2d.core.point2d import Point2D
+from svan2d.path.commands import Arc, CubicBezier, LineTo
+
+
+@pytest.mark.unit
+class TestCommandInterpolation:
+    """Tests for per-command interpolation."""
+
+    def test_cubic_interpolate(self):
+        a = CubicBezier(Point2D(0, 0), Point2D(10, 0), Point2D(10, 10))
+        b = CubicBezier(Point2D(10, 10), Point2D(20, 10), Point2D(30, 30))
+        mid = a.interpolate(b, 0.5)
+        assert mid == CubicBezier(Point2D(5, 5), Point2D(15, 5), Point2D(20, 20))
+
+    def test_arc_interpolate_rounds_flags(self):
+        a = Arc(10, 20, 0, 0, 1, Point2D(0, 0))
+        b = Arc(30, 40, 90, 1, 0, Point2D(100, 50))
+        mid = a.interpolate(b, 0.75)
+        assert mid == Arc(25, 35, 67.5, 1, 0, Point2D(75, 37.5), True)
+
+    def test_interpolate_type_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            LineTo(Point2D(0, 0)).interpolate(
+                CubicBezier(Point2D(), Point2D(), Point2D()), 0.5
+            )
+
+
+@pytest.mark.unit
+class TestCommandToString:
+    """Tests for command serialization."""
+
+    def test_round_trip_all_commands(self):
+        from svan2d.path.svg_path import SVGPath
+
+        d = (
+            "M 1.5,2.0 l 3.0,4.0 H 5.0 h 6.0 V 7.0 v 8.0 Q 1.0,2.0 3.0,4.0 "
+            "c 1.0,2.0 3.0,4.0 5.0,6.0 T 1.0,2.0 s 1.0,2.0 3.0,4.0 "
+            "A 10.0,20.0 30.0 1,0 40.0,50.0 Z"
+        )
+        path = SVGPath.from_string(d)
+        assert " ".join(cmd.to_string() for cmd in path.commands) == d
+
+    def test_cubic_format_keeps_exact_coordinates(self):
+        ints = CubicBezier(Point2D(1, 2), Point2D(3, 4), Point2D(5, 6))
+        floats = CubicBezier(Point2D(1.0, 2.0), Point2D(3.0, 4.0), Point2D(5.0, 6.0))
+        unsigned = CubicBezier(Point2D(0.0, 0.0), Point2D(0.0, 1.0), Point2D(0.0, 0.0))
+        signed = CubicBezier(Point2D(0.0, 0.0), Point2D(-0.0, 1.0), Point2D(0.0, 0.0))
+        assert ints.to_string() == "C 1,2 3,4 5,6"
+        assert floats.to_string() == "C 1.0,2.0 3.0,4.0 5.0,6.0"
+        assert unsigned.to_string() == "C 0.0,0.0 0.0,1.0 0.0,0.0"
+        assert signed.to_string() == "C 0.0,0.0 -0.0,1.0 0.0,0.0"
+
+
+@pytest.mark.unit
+class TestCommandLayout:
+    """Tests for the fixed-layout command classes."""
+
+    def test_commands_have_no_instance_dict(self):
+        from svan2d.path.commands import ClosePath, MoveTo
+
+        for cmd in (
+            MoveTo(Point2D()),
+            LineTo(Point2D()),
+            CubicBezier(Point2D(), Point2D(), Point2D()),
+            Arc(1, 1, 0, 0, 0, Point2D()),
+            ClosePath(),
+        ):
+            assert not hasattr(cmd, "__dict__")
+
+    def test_incomplete_command_cannot_be_instantiated(self):
+        from dataclasses import dataclass
+
+        from svan2d.path.commands import PathCommand
+
+        @dataclass(slots=True)
+        class Incomplete(PathCommand):
+            def to_string(self) -> str:
+                return ""
+
+        with pytest.raises(TypeError):
+            Incomplete()
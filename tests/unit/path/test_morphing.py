@@ -0,0 +1,77 @@
+"""Tests for svan2d.path.morphing module."""
+
+import pytest
+
+from svan2d.core.point2d import Point2D
+from svan2d.path.morphing import (
+    PathMorphTable,
+    convert_to_poly_bezier,
+    interpolate_poly_beziers,
+    normalize_poly_bezier_start,
+)
+from svan2d.path.svg_path import SVGPath
+
+
+def _reference(path1, path2, t):
+    """Per-frame polymorph pipeline without the precomputed table"""
+    origin = Point2D(0, 0)
+    poly1 = normalize_poly_bezier_start(convert_to_poly_bezier(path1), origin)
+    poly2 = normalize_poly_bezier_start(convert_to_poly_bezier(path2), origin)
+    return interpolate_poly_beziers(poly1, poly2, t).to_svg_path()
+
+
+@pytest.mark.unit
+class TestPathMorphTable:
+    """Tests for the precomputed morph table."""
+
+    @pytest.mark.parametrize("t", [0.0, 0.25, 0.5, 1.0])
+    def test_matches_per_frame_pipeline_same_length(self, t):
+        path1 = SVGPath.from_string("M 10,10 L 50,10 L 50,50 Z")
+        path2 = SVGPath.from_string("M 20,0 Q 60,20 40,60 L 0,40 Z")
+        table = PathMorphTable(path1, path2)
+        assert table.interpolate(t) == _reference(path1, path2, t)
+
+    @pytest.mark.parametrize("t", [0.0, 0.3, 1.0])
+    def test_matches_per_frame_pipeline_different_length(self, t):
+        path1 = SVGPath.from_string("M 0,0 L 10,0 L 10,10 L 0,10 L 5,5 Z")
+        path2 = SVGPath.from_string("M 0,0 C 5,5 10,5 20,0")
+        table = PathMorphTable(path1, path2)
+        assert table.interpolate(t) == _reference(path1, path2, t)
+        assert len(table) == len(table.interpolate_points(t))
+
+    def test_svg_path_interpolate_uses_same_result(self):
+        path1 = SVGPath.from_string("M 0,0 L 100,0")
+        path2 = SVGPath.from_string("M 0,100 L 100,100")
+        result = SVGPath.interpolate(path1, path2, 0.5)
+        assert result == PathMorphTable(path1, path2).interpolate(0.5)
+
+    def test_horizontal_vertical_lines_morph_like_lineto(self):
+        hv = SVGPath.from_string("M 0,0 H 10 V 10 h -10 Z")
+        lines = SVGPath.from_string("M 0,0 L 10,0 L 10,10 L 0,10 Z")
+        target = SVGPath.from_string("M 5,5 L 20,5 L 20,20 L 5,20 Z")
+        assert (
+            PathMorphTable(hv, target).interpolate(0.5)
+            == PathMorphTable(lines, target).interpolate(0.5)
+        )
+
+    def test_smooth_curves_morph_like_explicit_curves(self):
+        smooth = SVGPath.from_string("M 0,0 C 10,0 20,10 20,20 S 30,40 40,40")
+        explicit = SVGPath.from_string(
+            "M 0,0 C 10,0 20,10 20,20 C 20,30 30,40 40,40"
+        )
+        target = SVGPath.from_string("M 0,10 C 5,5 10,5 15,10 C 20,15 25,15 30,10")
+        assert (
+            PathMorphTable(smooth, target).interpolate(0.5)
+            == PathMorphTable(explicit, target).interpolate(0.5)
+        )
+
+    def test_render_matches_interpolated_path_string(self):
+        import io
+
+        path1 = SVGPath.from_string("M 0,0 L 100,0 L 100,100 Z")
+        path2 = SVGPath.from_string("M 10,10 Q 50,-20 90,10 T 90,90")
+        table = PathMorphTable(path1, path2)
+        for t in (0.0, 0.3, 1.0):
+            out = io.StringIO()
+            table.render(t, out)
+            assert out.getvalue() == table.interpolate(t).to_string()
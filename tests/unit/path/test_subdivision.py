@@ -0,0 +1,34 @@
+"""Tests for svan2d.path.subdivision module."""
+
+import pytest
+
+from svan2d.path.commands import CubicBezier
+from svan2d.path.subdivision import analyze_path_curves, subdivide_path_to_count
+from svan2d.path.svg_path import SVGPath
+
+
+@pytest.mark.unit
+class TestSubdividePathToCount:
+    """Tests for subdividing a path to a target curve count."""
+
+    def test_reaches_target_count(self):
+        path = SVGPath.from_string("M 0,0 L 100,0 Q 150,50 100,100 Z")
+        result = subdivide_path_to_count(path.commands, 7)
+        assert len(analyze_path_curves(result)) == 7
+
+    def test_splits_longest_curve_first(self):
+        path = SVGPath.from_string("M 0,0 L 10,0 L 110,0")
+        result = subdivide_path_to_count(path.commands, 3)
+        assert result[1] == path.commands[1]
+        assert isinstance(result[2], CubicBezier)
+        assert result[2].pos.x == pytest.approx(60)
+        assert result[3].pos.x == 110
+
+    def test_no_change_when_already_at_target(self):
+        path = SVGPath.from_string("M 0,0 L 10,0 L 20,0")
+        assert subdivide_path_to_count(path.commands, 2) == path.commands
+
+    def test_unsplittable_curves_do_not_loop(self):
+        path = SVGPath.from_string("M 0,0 A 10,10 0 0 1 20,0")
+        result = subdivide_path_to_count(path.commands, 4)
+        assert len(result) == 2
@@ -122,6 +122,66 @@ class TestSVGPathToAbsolute:
         except (AttributeError, TypeError):
             pytest.skip("to_absolute implementation differs")
 
+    def test_to_absolute_returns_independent_paths(self):
+        path = SVGPath.from_string("m 10,10 l 5,5 h 3")
+        abs_path = path.to_absolute()
+        assert abs_path.to_string() == "M 10.0,10.0 L 15.0,15.0 L 18.0,15.0"
+
+        abs_path.commands.pop()
+        assert len(path.to_absolute().commands) == 3
+
+    def test_already_absolute_path_is_copied(self):
+        path = SVGPath.from_string("M 0,0 L 10,10 C 1,2 3,4 5,6 Z")
+        abs_path = path.to_absolute()
+        assert abs_path is not path
+        assert abs_path.commands == path.commands
+
+        abs_path.commands.clear()
+        assert len(path.commands) == 4
+
+    def test_changed_commands_are_converted_again(self):
+        path = SVGPath.from_string("m 10,10 l 5,5")
+        first_length = path.length()
+        assert len(path.to_absolute().commands) == 2
+
+        path.commands.append(LineTo(Point2D(0, 5), absolute=False))
+        assert path.to_absolute().commands[-1] == LineTo(Point2D(15, 20))
+        assert path.length() == pytest.approx(first_length + 5)
+
+        path.commands = [MoveTo(Point2D(1, 2))]
+        assert path.to_absolute().commands == [MoveTo(Point2D(1, 2))]
+
+    def test_absolute_horizontal_line_still_expanded(self):
+        path = SVGPath.from_string("M 0,5 H 10")
+        abs_path = path.to_absolute()
+        assert abs_path is not path
+        assert abs_path.to_string() == "M 0.0,5.0 L 10.0,5.0"
+
+
+@pytest.mark.unit
+class TestSVGPathUnshort:
+    """Tests for SVGPath.unshort method."""
+
+    def test_smooth_cubic_reflects_previous_control(self):
+        path = SVGPath.from_string("M 0,0 C 10,0 20,10 20,20 S 30,40 40,40")
+        cmd = path.unshort().commands[2]
+        assert cmd == CubicBezier(Point2D(20, 30), Point2D(30, 40), Point2D(40, 40))
+
+    def test_smooth_quadratic_chain(self):
+        path = SVGPath.from_string("M 0,0 Q 10,10 20,0 t 20,0")
+        cmd = path.unshort().commands[2]
+        assert cmd == QuadraticBezier(Point2D(30, -10), Point2D(40, 0))
+
+    def test_smooth_without_matching_predecessor_uses_current_point(self):
+        path = SVGPath.from_string("M 5,5 L 10,10 T 20,20")
+        cmd = path.unshort().commands[2]
+        assert cmd == QuadraticBezier(Point2D(10, 10), Point2D(20, 20))
+
+    def test_no_smooth_commands_returns_absolute_form(self):
+        path = SVGPath.from_string("m 0,0 l 10,10")
+        assert path.unshort() == path.to_absolute()
+        assert path.unshort() is not path
+
 
 @pytest.mark.unit
 class TestSVGPathCompatibility:
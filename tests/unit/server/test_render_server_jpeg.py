@@ -0,0 +1,59 @@
+"""Tests for JPEG rendering in the Playwright render server."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Both are optional dependencies; render_server imports playwright at module load.
+pytest.importorskip("fastapi", reason="fastapi not installed (optional dependency)")
+pytest.importorskip("playwright", reason="playwright not installed (optional dependency)")
+
+from pydantic import ValidationError
+
+from svan2d.server.playwright import render_server
+from svan2d.server.playwright.render_server import RenderRequest
+
+
+class FakePool:
+    """Stands in for the module's BrowserPool, handing out one mock page."""
+
+    def __init__(self, page: MagicMock):
+        self.page = page
+
+    @asynccontextmanager
+    async def acquire_page(self):
+        yield self.page
+
+
+def make_page() -> MagicMock:
+    page = MagicMock(name="Page")
+    page.viewport_size = {"width": 20, "height": 10}
+    page.set_content = AsyncMock()
+    page.wait_for_load_state = AsyncMock()
+    page.screenshot = AsyncMock(return_value=b"jpeg-bytes")
+    return page
+
+
+def test_jpeg_request_uses_requested_quality(monkeypatch):
+    page = make_page()
+    monkeypatch.setattr(render_server, "browser_pool", FakePool(page))
+    request = RenderRequest(svg="<svg/>", type="jpeg", width=20, height=10, quality=60)
+
+    response = asyncio.run(render_server.render(request))
+
+    page.screenshot.assert_awaited_once_with(full_page=True, type="jpeg", quality=60)
+    assert response.media_type == "image/jpeg"
+    assert response.body == b"jpeg-bytes"
+
+
+def test_quality_defaults_to_85():
+    request = RenderRequest(svg="<svg/>", type="jpeg", width=20, height=10)
+    assert request.quality == 85
+
+
+@pytest.mark.parametrize("quality", [-1, 101])
+def test_quality_outside_0_to_100_is_rejected(quality):
+    with pytest.raises(ValidationError):
+        RenderRequest(svg="<svg/>", type="jpeg", width=20, height=10, quality=quality)
@@ -96,8 +96,10 @@ def test_acquire_page_relaunches_after_browser_death():
     # A fresh browser was launched and a page created on it.
     playwright.chromium.launch.assert_awaited_once()
     assert pool._browser.is_connected() is True
-    # Page reset and returned to the pool for reuse.
+    # Routes cleared and page returned to the pool; the DOM is not reset
+    # since the next render replaces it anyway.
     page.unroute.assert_awaited_once()
+    page.set_content.assert_not_awaited()
     assert pool._pages_created == 1
     assert pool._page_pool.qsize() == 1
 
@@ -128,7 +130,7 @@ def test_acquire_page_closes_page_when_reset_fails():
     pool._browser = live
 
     bad_page = make_page()
-    bad_page.set_content = AsyncMock(side_effect=RuntimeError("page gone"))
+    bad_page.unroute = AsyncMock(side_effect=RuntimeError("page gone"))
     live.new_page = AsyncMock(return_value=bad_page)
     pool._pages_created = 0
 
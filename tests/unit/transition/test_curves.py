@@ -3,9 +3,17 @@
 import pytest
 
 from svan2d.core.point2d import Point2D
-from svan2d.transition.curve.arc import arc, arc_clockwise, arc_counterclockwise
+from svan2d.transition.curve.arc import (
+    arc,
+    arc_batch,
+    arc_clockwise,
+    arc_columns,
+    arc_counterclockwise,
+)
 from svan2d.transition.curve.bezier import bezier, bezier_quadratic, bezier_cubic
-from svan2d.transition.curve.linear import linear
+from svan2d.transition.curve.linear import linear, linear_batch
+from svan2d.transition.curve.sampling import sample_segment
+from svan2d.transition.easing import in_quad
 
 
 class TestLinearCurve:
@@ -36,6 +44,14 @@ class TestLinearCurve:
         assert result.y == pytest.approx(50.0)
 
 
+    def test_linear_batch_matches_scalar(self):
+        """Batch sampling matches per-t calls."""
+        p1 = Point2D(3, -4)
+        p2 = Point2D(10, 20)
+        ts = [0.0, 0.25, 0.5, 1.0]
+        assert linear_batch(p1, p2, ts) == [linear(p1, p2, t) for t in ts]
+
+
 class TestBezierCurve:
     """Tests for bezier path interpolation."""
 
@@ -227,3 +243,76 @@ class TestArcCurve:
 
         # The y values should be different (different arc paths)
         assert cw_mid.y != pytest.approx(ccw_mid.y, abs=1.0)
+
+    def test_arc_reused_across_point_pairs(self):
+        """Cached geometry is refreshed when the endpoints change."""
+        path_func = arc_counterclockwise()
+
+        first = path_func(Point2D(0, 0), Point2D(100, 0), 0.5)
+        other = path_func(Point2D(0, 0), Point2D(0, 50), 0.5)
+        again = path_func(Point2D(0, 0), Point2D(100, 0), 0.5)
+
+        fresh = arc_counterclockwise()(Point2D(0, 0), Point2D(0, 50), 0.5)
+        assert other == fresh
+        assert again == first
+        assert path_func(Point2D(0, 0), Point2D(100, 0), 1.0).x == pytest.approx(100)
+
+    def test_arc_batch_matches_scalar(self):
+        """Batch sampling matches the path function for both directions."""
+        p1 = Point2D(0, 0)
+        p2 = Point2D(100, 30)
+        ts = [0.0, 0.1, 0.5, 0.9, 1.0]
+        for clockwise, factory in ((False, arc_counterclockwise), (True, arc_clockwise)):
+            path_func = factory(80)
+            expected = [path_func(p1, p2, t) for t in ts]
+            assert arc_batch(p1, p2, ts, radius=80, clockwise=clockwise) == expected
+
+    def test_arc_batch_same_point(self):
+        """Coincident endpoints yield the start point for every t."""
+        p = Point2D(5, 5)
+        assert arc_batch(p, p, [0.0, 0.5, 1.0]) == [p, p, p]
+
+    def test_arc_columns_match_batch(self):
+        """Columnar arc sampling yields the coordinates of arc_batch."""
+        p1 = Point2D(0, 0)
+        p2 = Point2D(100, 30)
+        ts = [0.0, 0.25, 0.5, 1.0]
+        points = arc_batch(p1, p2, ts, radius=70, clockwise=True)
+        xs, ys = arc_columns(p1, p2, ts, radius=70, clockwise=True)
+        assert xs == [p.x for p in points]
+        assert ys == [p.y for p in points]
+
+
+class TestSampleSegment:
+    """Test columnar segment sampling."""
+
+    def test_linear_with_easing(self):
+        """Linear sampling matches the scalar path on eased parameters."""
+        p1 = Point2D(-10, 5)
+        p2 = Point2D(90, -15)
+        ts = [0.0, 0.3, 0.7, 1.0]
+        xs, ys = sample_segment(p1, p2, iter(ts), easing_fn=in_quad)
+        expected = [linear(p1, p2, in_quad(t)) for t in ts]
+        assert list(zip(xs, ys)) == [(p.x, p.y) for p in expected]
+
+    def test_custom_path_function(self):
+        """Other path functions are evaluated per sample and split into columns."""
+        p1 = Point2D(0, 0)
+        p2 = Point2D(100, 0)
+        path_func = bezier_cubic(Point2D(25, 50), Point2D(75, 50))
+        xs, ys = sample_segment(p1, p2, [0.0, 0.5, 1.0], path_fn=path_func)
+        points = [path_func(p1, p2, t) for t in (0.0, 0.5, 1.0)]
+        assert xs == [p.x for p in points]
+        assert ys == [p.y for p in points]
+
+    def test_arc_path_function_sampled_by_columns(self):
+        """Arc path functions are sampled through the columnar arc kernel."""
+        p1 = Point2D(0, 0)
+        p2 = Point2D(100, 0)
+        ts = [0.0, 0.5, 1.0]
+        path_func = arc_clockwise(60)
+        assert (path_func.radius, path_func.clockwise) == (60, True)
+        xs, ys = sample_segment(p1, p2, ts, path_fn=path_func)
+        assert (xs, ys) == arc_columns(p1, p2, ts, radius=60, clockwise=True)
+        points = [path_func(p1, p2, t) for t in ts]
+        assert xs == [p.x for p in points]
@@ -191,6 +191,24 @@ class TestBounce:
         assert easing.in_out_bounce(0.0) == 0.0
         assert easing.in_out_bounce(1.0) == 1.0
 
+    def test_out_bounce_callable_after_in_bounce(self):
+        """Calling in_bounce must not rebind easing.out_bounce to its module."""
+        import subprocess
+        import sys
+
+        # Fresh interpreter: other tests may have loaded out_bounce already
+        code = (
+            "from svan2d.transition import easing\n"
+            "easing.in_bounce(0.3)\n"
+            "easing.in_out_bounce(0.3)\n"
+            "print(easing.out_bounce(0.5))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert float(result.stdout) == pytest.approx(0.765625)
+
 
 class TestBack:
     """Tests for back easing functions (overshoot)."""
@@ -271,3 +289,54 @@ class TestSpecialEasings:
         # Should work like in_out_quad or similar
         assert easing.in_out(0.0) == 0.0
         assert easing.in_out(1.0) == 1.0
+
+
+class TestEasing2D:
+    """Tests for per-axis easing composition."""
+
+    def test_independent_axes(self):
+        combined = easing.easing2D(easing.in_quad, easing.out_quad)
+        assert combined(0.3) == (easing.in_quad(0.3), easing.out_quad(0.3))
+
+    def test_same_easing_evaluated_once(self):
+        calls = []
+
+        def counting(t):
+            calls.append(t)
+            return t * t
+
+        assert easing.easing2D(counting, counting)(0.5) == (0.25, 0.25)
+        assert calls == [0.5]
+
+    def test_batch_matches_scalar(self):
+        ts = [0.0, 0.2, 0.5, 0.9, 1.0]
+        combined = easing.easing2D(easing.in_quad, easing.out_bounce)
+        xs, ys = easing.easing2D_batch(easing.in_quad, easing.out_bounce)(iter(ts))
+        assert list(zip(xs, ys)) == [combined(t) for t in ts]
+
+    def test_batch_shared_easing_returns_separate_lists(self):
+        xs, ys = easing.easing2D_batch(easing.in_sine, easing.in_sine)([0.25, 0.75])
+        assert xs == ys == [easing.in_sine(0.25), easing.in_sine(0.75)]
+        assert xs is not ys
+
+
+class TestEasingResolverFieldTable:
+    """Tests for per-segment easing tables."""
+
+    def test_table_matches_per_field_resolution(self):
+        from svan2d.transition.easing_resolver import EasingResolver
+
+        resolver = EasingResolver({"opacity": easing.in_quad, "x": easing.out_quad})
+        overrides = {"x": easing.in_cubic}
+        table = resolver.build_field_table(["x", "opacity"], overrides)
+
+        for name in ("x", "opacity", "y"):
+            assert table[name] is resolver.get_easing_for_field(name, overrides)
+
+    def test_unlisted_fields_resolved_on_access(self):
+        from svan2d.transition.easing_resolver import EasingResolver
+
+        table = EasingResolver().build_field_table(segment_easing=easing.out_sine)
+        assert "scale" not in table
+        assert table["scale"] is easing.out_sine
+        assert "scale" in table
@@ -0,0 +1,49 @@
+"""Tests for IdentityCache"""
+
+import pytest
+
+from svan2d.transition.identity_cache import IdentityCache
+
+
+@pytest.mark.unit
+class TestIdentityCache:
+    """Test identity-keyed lookup and eviction"""
+
+    def test_hit_requires_same_objects(self):
+        cache = IdentityCache()
+        start, end = [1], [2]
+        cache.put((start, end), "value")
+
+        assert cache.get((start, end)) == "value"
+        assert cache.get(([1], end)) is None
+        assert cache.get((end, start)) is None
+
+    def test_extra_key_separates_entries(self):
+        cache = IdentityCache()
+        refs = (object(),)
+        cache.put(refs, "closed", True)
+        cache.put(refs, "open", False)
+
+        assert cache.get(refs, True) == "closed"
+        assert cache.get(refs, False) == "open"
+        assert cache.get(refs) is None
+
+    def test_default_distinguishes_cached_none(self):
+        cache = IdentityCache()
+        missing = object()
+        refs = (object(),)
+
+        assert cache.get(refs, default=missing) is missing
+        cache.put(refs, None)
+        assert cache.get(refs, default=missing) is None
+
+    def test_oldest_entry_evicted_when_full(self):
+        cache = IdentityCache(maxsize=2)
+        keys = [(object(),) for _ in range(3)]
+        for i, refs in enumerate(keys):
+            cache.put(refs, i)
+
+        assert len(cache) == 2
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == 1
+        assert cache.get(keys[2]) == 2
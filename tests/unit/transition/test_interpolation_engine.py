@@ -103,6 +103,24 @@ class TestStateInterpolation:
 
         assert result.rotation == 90
 
+    def test_repeated_frames_keep_angle_and_exact_rotation(
+        self, interpolation_engine
+    ):
+        """Cached per-field dispatch still honours angle wrapping and exact_rotation"""
+        state1 = RectangleState(Point2D(), width=100, height=50, rotation=350)
+        state2 = RectangleState(Point2D(10, 0), width=100, height=50, rotation=10)
+
+        for _ in range(2):
+            wrapped = interpolation_engine.create_eased_state(
+                state1, state2, 0.5, None, set()
+            )
+            exact = interpolation_engine.create_eased_state(
+                state1, state2, 0.5, None, set(), exact_rotation=True
+            )
+            assert wrapped.rotation % 360 == 0
+            assert exact.rotation == 180
+            assert wrapped.pos == exact.pos == Point2D(5, 0)
+
     def test_interpolate_opacity(self, interpolation_engine):
         """Test interpolating opacity"""
         state1 = CircleState(Point2D(), radius=50, opacity=0.0)
@@ -134,6 +152,222 @@ class TestStateInterpolation:
         assert result.scale == 1.5
 
 
+@pytest.mark.unit
+class TestFrameStateConstruction:
+    """Test how interpolated frame states are built"""
+
+    def test_frame_equals_replace_result(self, interpolation_engine):
+        """Attribute-copied frames match dataclasses.replace"""
+        from dataclasses import replace
+
+        state1 = RectangleState(Point2D(), width=100, height=50, opacity=0.0)
+        state2 = RectangleState(Point2D(10, 0), width=200, height=50, opacity=1.0)
+
+        result = interpolation_engine.create_eased_state(
+            state1, state2, 0.25, None, set()
+        )
+
+        expected = replace(
+            state1, pos=Point2D(2.5, 0), width=125, opacity=0.25, is_final=False
+        )
+        assert type(result) is RectangleState
+        assert result == expected
+        assert result.is_final is False
+
+    def test_segment_plan_matches_generic_path(self, interpolation_engine):
+        """Frames built from a cached segment plan match the generic loop"""
+        state1 = RectangleState(
+            Point2D(), width=100, height=50, rotation=350, fill_color=Color(0, 0, 0)
+        )
+        state2 = RectangleState(
+            Point2D(10, 0),
+            width=200,
+            height=50,
+            rotation=10,
+            fill_color=Color(255, 0, 0),
+            y_up=True,
+        )
+        changed = InterpolationEngine.compute_changed_fields(state1, state2, set())
+        table = interpolation_engine.easing_resolver.build_field_table(
+            changed[0], {"width": in_out}, None
+        )
+        config = {"height": lambda a, b, t: a + 7}
+
+        for t in (0.0, 0.25, 0.5, 0.75):
+            planned = interpolation_engine.create_eased_state(
+                state1,
+                state2,
+                t,
+                {"width": in_out},
+                set(),
+                segment_interpolation_config=config,
+                changed_fields=changed,
+                easing_table=table,
+            )
+            generic = interpolation_engine.create_eased_state(
+                state1,
+                state2,
+                t,
+                {"width": in_out},
+                set(),
+                segment_interpolation_config=config,
+            )
+            assert planned == generic
+            assert planned.height == 57
+            assert planned.y_up is (t >= 0.5)
+        assert len(interpolation_engine._frame_plans) == 1
+
+    def test_batch_matches_single_frames(self, interpolation_engine):
+        """create_eased_states returns one create_eased_state result per t"""
+        state1 = RectangleState(Point2D(), width=100, height=50, opacity=0.0)
+        state2 = RectangleState(Point2D(10, 0), width=200, height=50, opacity=1.0)
+        changed = InterpolationEngine.compute_changed_fields(state1, state2, set())
+        table = interpolation_engine.easing_resolver.build_field_table(
+            changed[0], None, in_out
+        )
+        ts = [0.0, 0.1, 0.5, 0.9]
+
+        for kwargs in ({}, {"changed_fields": changed, "easing_table": table}):
+            batch = interpolation_engine.create_eased_states(
+                state1, state2, ts, None, set(), segment_easing=in_out, **kwargs
+            )
+            assert batch == [
+                interpolation_engine.create_eased_state(
+                    state1, state2, t, None, set(), segment_easing=in_out
+                )
+                for t in ts
+            ]
+
+    def test_custom_function_overrides_cached_leaf(self, interpolation_engine):
+        """A per-field custom function wins over the cached leaf interpolator"""
+        state = RectangleState()
+        args = (state, state, "width", 10.0, 20.0, 0.5)
+
+        assert interpolation_engine.interpolate_value(*args) == 15.0
+        assert interpolation_engine.interpolate_value(
+            *args, segment_interpolation_config={"width": lambda a, b, t: -1.0}
+        ) == -1.0
+        assert interpolation_engine.interpolate_value(*args) == 15.0
+
+    def test_easing_table_reused_without_caller_table(self, interpolation_engine):
+        """Field easings resolve once per segment configuration"""
+        state1 = RectangleState(Point2D(), width=100, opacity=0.0)
+        state2 = RectangleState(Point2D(10, 0), width=200, opacity=1.0)
+        overrides = {"width": in_out}
+
+        for t in (0.25, 0.75):
+            result = interpolation_engine.create_eased_state(
+                state1, state2, t, overrides, set()
+            )
+            assert result.width == pytest.approx(100 + 100 * in_out(t))
+            assert result.opacity == pytest.approx(t)
+
+        assert len(interpolation_engine._easing_tables) == 1
+
+    def test_easing_caches_follow_mutated_overrides(self, interpolation_engine):
+        """Mutating an overrides dict in place is picked up on the next frame"""
+        state1 = RectangleState(Point2D(), width=100)
+        state2 = RectangleState(Point2D(10, 0), width=200)
+        overrides = {"width": in_out}
+
+        first = interpolation_engine.create_eased_state(
+            state1, state2, 0.25, overrides, set()
+        )
+        assert first.width == pytest.approx(100 + 100 * in_out(0.25))
+
+        overrides["width"] = linear
+        assert interpolation_engine.create_eased_state(
+            state1, state2, 0.25, overrides, set()
+        ).width == pytest.approx(125)
+
+        # An easing that does not start at 0 must still be applied at t=0
+        overrides["width"] = lambda t: 0.5 + t / 2
+        assert interpolation_engine.create_eased_state(
+            state1, state2, 0.0, overrides, set()
+        ).width == pytest.approx(150)
+
+    def test_segment_start_returns_start_state(self, interpolation_engine):
+        """t=0 returns the start state itself; t=1 still interpolates"""
+        from svan2d.transition.easing import none
+
+        state1 = RectangleState(Point2D(), width=100, fill_color=Color(10, 20, 30))
+        state2 = RectangleState(Point2D(10, 0), width=200, fill_color=Color(0, 0, 0))
+
+        assert (
+            interpolation_engine.create_eased_state(state1, state2, 0.0, None, set())
+            is state1
+        )
+        held = interpolation_engine.create_eased_state(
+            state1, state2, 1.0, None, set(), segment_easing=none
+        )
+        assert held.width == 100
+
+    def test_segment_start_applies_offset_easing(self, interpolation_engine):
+        """An easing with f(0) != 0 is still applied at t=0"""
+        state1 = RectangleState(Point2D(), width=100)
+        state2 = RectangleState(Point2D(10, 0), width=200)
+
+        def offset(t):
+            return 0.5 + t / 2
+
+        blanket = interpolation_engine.create_eased_state(
+            state1, state2, 0.0, None, set(), segment_easing=offset
+        )
+        assert blanket.width == pytest.approx(150)
+        assert blanket.pos == Point2D(5, 0)
+
+        per_field = interpolation_engine.create_eased_state(
+            state1, state2, 0.0, {"width": offset}, set()
+        )
+        assert per_field.width == pytest.approx(150)
+        assert per_field.pos == Point2D(0, 0)
+
+    def test_unchanged_segment_returns_base_state(self, interpolation_engine):
+        """Keystates without changed fields are returned as the frame"""
+        state1 = RectangleState(Point2D(), width=100)
+        state2 = RectangleState(Point2D(), width=100)
+        changed = InterpolationEngine.compute_changed_fields(state1, state2, set())
+
+        for t, expected in ((0.25, state1), (0.75, state2)):
+            result = interpolation_engine.create_eased_state(
+                state1, state2, t, None, set(), changed_fields=changed
+            )
+            assert result is expected
+
+    def test_replace_state_runs_custom_post_init(self):
+        """Only states using State.__post_init__ skip __init__ when cloned"""
+        from dataclasses import dataclass
+
+        from svan2d.primitive.state.base import State, replace_state
+
+        calls = []
+
+        class CountingMixin:
+            def __post_init__(self):
+                calls.append(type(self))
+                super().__post_init__()
+
+        @dataclass(frozen=True)
+        class PlainState(State):
+            pass
+
+        @dataclass(frozen=True)
+        class MixedState(CountingMixin, State):
+            pass
+
+        plain = replace_state(PlainState(), {"opacity": 0.5})
+        assert type(plain) is PlainState and plain.opacity == 0.5
+
+        mixed = MixedState()
+        calls.clear()
+        replaced = replace_state(mixed, {"opacity": 0.5})
+        assert replaced.opacity == 0.5
+        assert calls == [MixedState]
+
+        circle = CircleState(radius=10)
+        assert replace_state(circle, {"radius": 20}) == CircleState(radius=20)
+
+
 @pytest.mark.unit
 class TestVertexInterpolation:
     """Test vertex-based interpolation"""
@@ -210,6 +444,80 @@ class TestVertexInterpolation:
             )
 
 
+    def test_interpolate_contours_with_holes(self, interpolation_engine):
+        """Outer loop and holes are interpolated loop by loop"""
+
+        def square(x, y, size):
+            return [
+                Point2D(x, y),
+                Point2D(x + size, y),
+                Point2D(x + size, y + size),
+                Point2D(x, y + size),
+                Point2D(x, y),
+            ]
+
+        contours1 = VertexContours(
+            outer=VertexLoop(square(0, 0, 100)),
+            holes=[VertexLoop(square(10, 10, 20)), VertexLoop(square(60, 60, 20))],
+        )
+        contours2 = VertexContours(
+            outer=VertexLoop(square(50, 0, 200)),
+            holes=[VertexLoop(square(70, 20, 40)), VertexLoop(square(150, 90, 30))],
+        )
+
+        for t in (0.25, 0.75):
+            result = interpolation_engine.interpolate_value(
+                start_state=CircleState(Point2D(), radius=50),
+                end_state=CircleState(Point2D(), radius=50),
+                field_name="_aligned_contours",
+                start_value=contours1,
+                end_value=contours2,
+                eased_t=t,
+            )
+
+            pairs = [(contours1.outer, contours2.outer)] + list(
+                zip(contours1.holes, contours2.holes)
+            )
+            loops = [result.outer] + result.holes
+            assert len(loops) == 3
+            for loop, (loop1, loop2) in zip(loops, pairs):
+                expected = [
+                    a.lerp(b, t) for a, b in zip(loop1.vertices, loop2.vertices)
+                ]
+                expected[-1] = expected[0]
+                assert loop.vertices == expected
+                assert loop.closed
+
+    def test_closure_follows_state_closed_flag(self, interpolation_engine):
+        """The outer loop is closed only when both states are closed"""
+        from svan2d.primitive.state.line import LineState
+
+        start = [Point2D(0, 0), Point2D(100, 0), Point2D(100, 100), Point2D(0, 90)]
+        end = [Point2D(0, 0), Point2D(200, 0), Point2D(200, 200), Point2D(0, 190)]
+        contours1 = VertexContours(outer=VertexLoop(start, closed=False))
+        contours2 = VertexContours(outer=VertexLoop(end, closed=False))
+        expected = [a.lerp(b, 0.5) for a, b in zip(start, end)]
+
+        def interpolate(state):
+            return interpolation_engine.interpolate_value(
+                start_state=state,
+                end_state=state,
+                field_name="_aligned_contours",
+                start_value=contours1,
+                end_value=contours2,
+                eased_t=0.5,
+                vertex_buffer=None,
+            )
+
+        open_result = interpolate(LineState())
+        assert open_result.outer.vertices == expected
+        assert not open_result.outer.closed
+
+        closed_result = interpolate(CircleState())
+        assert closed_result.outer.vertices == expected[:-1] + [expected[0]]
+        assert closed_result.outer.closed
+
+
 @pytest.mark.unit
 class TestEdgeCases:
     """Test edge cases in state interpolation"""
@@ -297,10 +605,10 @@ class TestEdgeCases:
 
 @pytest.mark.unit
 class TestVertexBufferOptimization:
-    """Test vertex buffer caching optimization"""
+    """Test the deprecated vertex_buffer parameter"""
 
     def test_interpolate_with_vertex_buffer(self, interpolation_engine):
-        """Test interpolation using pre-allocated vertex buffer"""
+        """A passed vertex buffer warns and is left untouched"""
         # Create vertex contours
         vertices1 = [
             Point2D(0, 0),
@@ -328,27 +636,27 @@ class TestVertexBufferOptimization:
         hole_buffers = []
         vertex_buffer = (outer_buffer, hole_buffers)
 
-        result = interpolation_engine.interpolate_value(
-            start_state=CircleState(Point2D(), radius=50),
-            end_state=CircleState(Point2D(), radius=50),
-            field_name="_aligned_contours",
-            start_value=contours1,
-            end_value=contours2,
-            eased_t=0.5,
-            vertex_buffer=vertex_buffer,
-        )
+        with pytest.warns(DeprecationWarning):
+            result = interpolation_engine.interpolate_value(
+                start_state=CircleState(Point2D(), radius=50),
+                end_state=CircleState(Point2D(), radius=50),
+                field_name="_aligned_contours",
+                start_value=contours1,
+                end_value=contours2,
+                eased_t=0.5,
+                vertex_buffer=vertex_buffer,
+            )
 
-        # Check that buffer was used (vertices should be from buffer)
         assert isinstance(result, VertexContours)
         assert result.outer.vertices[0].x == 25
         assert result.outer.vertices[0].y == 25
 
-        # Buffer should have been modified in place
-        assert outer_buffer[0].x == 25
-        assert outer_buffer[0].y == 25
+        # The buffer is ignored
+        assert outer_buffer[0].x == 0
+        assert outer_buffer[0].y == 0
 
     def test_vertex_buffer_grows_if_needed(self, interpolation_engine):
-        """Test that vertex buffer grows if it's too small"""
+        """A too small vertex buffer is no longer grown"""
         vertices1 = [
             Point2D(0, 0),
             Point2D(100, 0),
@@ -375,16 +683,204 @@ class TestVertexBufferOptimization:
         hole_buffers = []
         vertex_buffer = (outer_buffer, hole_buffers)
 
+        with pytest.warns(DeprecationWarning):
+            result = interpolation_engine.interpolate_value(
+                start_state=CircleState(Point2D(), radius=50),
+                end_state=CircleState(Point2D(), radius=50),
+                field_name="_aligned_contours",
+                start_value=contours1,
+                end_value=contours2,
+                eased_t=0.5,
+                vertex_buffer=vertex_buffer,
+            )
+
+        assert len(outer_buffer) == 2
+        assert isinstance(result, VertexContours)
+
+    def test_deprecated_buffer_arguments_warn(self, interpolation_engine):
+        """create_eased_state and StateInterpolator accept but ignore buffers"""
+        from svan2d.velement.state_interpolator import StateInterpolator
+
+        state1 = CircleState(Point2D(), radius=50)
+        state2 = CircleState(Point2D(), radius=100)
+        with pytest.warns(DeprecationWarning):
+            result = interpolation_engine.create_eased_state(
+                state1, state2, 0.5, None, set(), vertex_buffer=([], [])
+            )
+        assert result.radius == 75
+
+        with pytest.warns(DeprecationWarning):
+            StateInterpolator(
+                [],
+                {},
+                interpolation_engine.easing_resolver,
+                interpolation_engine,
+                get_vertex_buffer=lambda n, h: ([], []),
+            )
+
+    def test_repeated_frames_match_point_lerp(self, interpolation_engine):
+        """Frames of one vertex segment match per-point lerp"""
+        vertices1 = [Point2D(0, 0), Point2D(10, 3), Point2D(-4, 7), Point2D(0, 0)]
+        vertices2 = [Point2D(5, 1), Point2D(2, 9), Point2D(8, -6), Point2D(5, 1)]
+        contours1 = VertexContours(outer=VertexLoop(vertices1, closed=True))
+        contours2 = VertexContours(outer=VertexLoop(vertices2, closed=True))
+
+        for t in (0.0, 0.3, 0.7, 1.0):
+            result = interpolation_engine.interpolate_value(
+                start_state=CircleState(Point2D(), radius=50),
+                end_state=CircleState(Point2D(), radius=50),
+                field_name="_aligned_contours",
+                start_value=contours1,
+                end_value=contours2,
+                eased_t=t,
+            )
+            expected = [
+                a.lerp(b, t)
+                for a, b in zip(contours1.outer.vertices, contours2.outer.vertices)
+            ]
+            expected[-1] = expected[0]
+            assert result.outer.vertices == expected
+
+    def test_unpaired_holes_interpolate_outer_loop(self, interpolation_engine):
+        """Without a contour table the outer loop is still lerped per point"""
+        square = [Point2D(0, 0), Point2D(4, 0), Point2D(4, 4), Point2D(0, 0)]
+        moved = [Point2D(2, 2), Point2D(8, 2), Point2D(8, 8), Point2D(2, 2)]
+        hole = VertexLoop([Point2D(1, 1), Point2D(2, 1), Point2D(1, 1)])
+        contours1 = VertexContours(outer=VertexLoop(square), holes=[hole])
+        contours2 = VertexContours(outer=VertexLoop(moved), holes=[])
+
         result = interpolation_engine.interpolate_value(
-            start_state=CircleState(Point2D(), radius=50),
-            end_state=CircleState(Point2D(), radius=50),
+            start_state=CircleState(),
+            end_state=CircleState(),
             field_name="_aligned_contours",
             start_value=contours1,
             end_value=contours2,
             eased_t=0.5,
-            vertex_buffer=vertex_buffer,
         )
 
-        # Buffer should have grown
-        assert len(outer_buffer) >= 5
-        assert isinstance(result, VertexContours)
+        assert result.outer.vertices == [a.lerp(b, 0.5) for a, b in zip(square, moved)]
+        assert result.holes == []
+
+
+@pytest.mark.unit
+class TestEasingEvaluation:
+    """Test easing evaluation during state interpolation"""
+
+    def test_shared_easing_evaluated_once_per_frame(self):
+        """Fields sharing an easing function evaluate it once per frame"""
+        calls = []
+
+        def counting(t):
+            calls.append(t)
+            return t
+
+        engine = InterpolationEngine(EasingResolver())
+        state1 = CircleState(Point2D(), radius=50, opacity=0.0, scale=1.0)
+        state2 = CircleState(Point2D(10, 10), radius=60, opacity=1.0, scale=2.0)
+
+        result = engine.create_eased_state(
+            state1, state2, 0.5, None, set(), segment_easing=counting
+        )
+
+        assert calls == [0.5]
+        assert result.opacity == 0.5
+        assert result.radius == 55
+
+
+@pytest.mark.unit
+class TestQuantizedStateCache:
+    """Test the optional t-quantized interpolated state cache"""
+
+    def test_disabled_by_default(self, interpolation_engine):
+        """Without t_precision results are exact and not cached"""
+        state1 = CircleState(Point2D(), radius=50, opacity=0.0)
+        state2 = CircleState(Point2D(), radius=50, opacity=1.0)
+
+        result = interpolation_engine.create_eased_state(
+            state1, state2, 0.3, None, set()
+        )
+
+        assert result.opacity == pytest.approx(0.3)
+        assert len(interpolation_engine._state_cache) == 0
+
+    def test_same_rounded_t_reuses_state(self):
+        """Frames rounding to the same t return the cached state"""
+        engine = InterpolationEngine(EasingResolver(), t_precision=4)
+        state1 = CircleState(Point2D(), radius=50, opacity=0.0)
+        state2 = CircleState(Point2D(), radius=50, opacity=1.0)
+
+        first = engine.create_eased_state(state1, state2, 0.5, None, set())
+        second = engine.create_eased_state(state1, state2, 0.51, None, set())
+        other = engine.create_eased_state(state1, state2, 0.75, None, set())
+
+        assert second is first
+        assert first.opacity == 0.5
+        assert other.opacity == 0.75
+
+
+@pytest.mark.unit
+class TestAngleFieldDetection:
+    """Test per-class angle field detection"""
+
+    def test_custom_is_angle_override(self):
+        """Fields marked by a subclass is_angle() are detected per class"""
+        from dataclasses import dataclass
+
+        from svan2d.transition.type_interpolators import TypeInterpolators
+
+        @dataclass(frozen=True)
+        class SweepState(CircleState):
+            sweep: float = 0.0
+
+            def is_angle(self, field):
+                return field.name in ("rotation", "sweep")
+
+        interpolators = TypeInterpolators()
+        assert interpolators.is_angle_field(SweepState(), "sweep")
+        assert interpolators.is_angle_field(SweepState(), "rotation")
+        assert not interpolators.is_angle_field(SweepState(), "radius")
+        assert not interpolators.is_angle_field(CircleState(), "sweep")
+        assert interpolators.is_angle_field(CircleState(), "rotation")
+
+
+@pytest.mark.unit
+class TestStateListNormalization:
+    """Test List[State] field normalization"""
+
+    def test_list_is_revalidated_after_item_replacement(self):
+        """Replacing an item keeps the length but is still validated"""
+        from svan2d.transition.state_list_interpolator import (
+            _normalize_to_state_list,
+        )
+
+        states = [CircleState(), RectangleState()]
+        assert _normalize_to_state_list(states) is states
+
+        states[1] = 42
+        assert _normalize_to_state_list(states) is None
+
+    def test_segment_plan_snapshots_state_lists(self, interpolation_engine):
+        """Planned list fields are unaffected by later edits to the lists"""
+        clips1 = [CircleState(radius=10)]
+        clips2 = [CircleState(radius=30)]
+        state1 = CircleState(radius=50, clip_states=clips1)
+        state2 = CircleState(radius=50, clip_states=clips2)
+        changed = InterpolationEngine.compute_changed_fields(state1, state2, set())
+        table = interpolation_engine.easing_resolver.build_field_table(
+            changed[0], None, None
+        )
+
+        def frame(t):
+            return interpolation_engine.create_eased_state(
+                state1,
+                state2,
+                t,
+                None,
+                set(),
+                changed_fields=changed,
+                easing_table=table,
+            )
+
+        assert frame(0.5).clip_states[0].radius == 20
+        clips2[0] = 42
+        assert frame(0.5).clip_states[0].radius == 20
@@ -0,0 +1,69 @@
+"""Tests for PathMorpher morph method selection."""
+
+import pytest
+
+from svan2d.path import SVGPath
+from svan2d.transition.path_morpher import PathMorpher
+
+
+@pytest.mark.unit
+class TestPathMorpherClosedDetection:
+    """Test closed-path detection used for automatic morph selection"""
+
+    def test_close_command_marks_path_closed(self):
+        morpher = PathMorpher()
+        assert morpher._is_closed(SVGPath.from_string("M 0 0 L 10 0 L 10 10 Z"))
+        assert morpher._is_closed(SVGPath.from_string("m 0 0 l 10 0 l 0 10 z"))
+
+    def test_open_and_empty_paths(self):
+        morpher = PathMorpher()
+        assert not morpher._is_closed(SVGPath.from_string("M 0 0 L 10 0 L 10 10"))
+        assert not morpher._is_closed(SVGPath([]))
+
+
+@pytest.mark.unit
+class TestPathMorpherReuse:
+    """Test that morphers are built once per path pair"""
+
+    def test_native_morpher_reused_across_frames(self):
+        morpher = PathMorpher()
+        start = SVGPath.from_string("M 0 0 L 10 0")
+        end = SVGPath.from_string("M 0 10 L 20 10")
+
+        frames = [
+            morpher.interpolate(object(), start, end, t) for t in (0.0, 0.5, 1.0)
+        ]
+
+        assert len(morpher._morphers) == 1
+        assert frames[1].to_string() == "M 0.0,5.0 C 5.0,5.0 10.0,5.0 15.0,5.0"
+
+    def test_distinct_pairs_get_distinct_morphers(self):
+        morpher = PathMorpher()
+        start = SVGPath.from_string("M 0 0 L 10 0")
+        end1 = SVGPath.from_string("M 0 10 L 20 10")
+        end2 = SVGPath.from_string("M 0 20 L 20 20")
+
+        morpher.interpolate(object(), start, end1, 0.5)
+        morpher.interpolate(object(), start, end2, 0.5)
+
+        assert len(morpher._morphers) == 2
+
+    def test_retained_paths_are_bounded(self):
+        from svan2d.transition.path_morpher import (
+            _MORPHER_CACHE_SIZE,
+            _NATIVE_T_CACHE_SIZE,
+        )
+
+        morpher = PathMorpher()
+        start = SVGPath.from_string("M 0 0 L 10 0")
+        end = SVGPath.from_string("M 0 10 L 20 10")
+
+        for i in range(100):
+            morpher.interpolate(object(), start, end, i / 100)
+        native = morpher._morpher(start, end, False)
+        assert len(native._cache) == _NATIVE_T_CACHE_SIZE
+
+        for i in range(_MORPHER_CACHE_SIZE + 10):
+            other = SVGPath.from_string(f"M 0 {i} L 20 {i}")
+            morpher.interpolate(object(), start, other, 0.5)
+        assert len(morpher._morphers) == _MORPHER_CACHE_SIZE
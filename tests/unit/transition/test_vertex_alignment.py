@@ -10,6 +10,7 @@ from svan2d.transition.vertex_alignment import (
     SequentialAligner,
     get_aligner,
 )
+from svan2d.transition.vertex_alignment.angular import _l1_best_offset
 
 
 @pytest.fixture
@@ -162,6 +163,20 @@ class TestAngularAligner:
         assert verts1_out == []
         assert verts2_out == []
 
+    def test_l1_fast_path_matches_exhaustive_scan(self):
+        """Test the pruned L1 offset search agrees with the full scan"""
+        import random
+
+        rng = random.Random(7)
+        aligner = AngularAligner()
+        for n in (3, 8, 17):
+            angles1 = [rng.uniform(-3.2, 3.2) for _ in range(n)]
+            angles2 = [rng.uniform(-3.2, 3.2) for _ in range(n)]
+            expected = min(
+                range(n), key=lambda k: aligner._l1_distance(angles1, angles2, k)
+            )
+            assert _l1_best_offset(angles1, angles2) == expected
+
 
 @pytest.mark.unit
 class TestEuclideanAligner:
@@ -417,3 +432,38 @@ class TestAlignmentEdgeCases:
         for i, v in enumerate(verts2_out):
             assert v.x == verts2[i].x
             assert v.y == verts2[i].y
+
+
+@pytest.mark.unit
+class TestZeroHole:
+    """Tests for zero-hole creation used by hole appear/disappear morphs"""
+
+    def test_zero_hole_collapses_to_centroid(self):
+        from svan2d.primitive.vertex import VertexLoop
+        from svan2d.transition.align_vertices import _create_zero_hole
+
+        hole = VertexLoop(
+            [Point2D(0, 0), Point2D(10, 0), Point2D(10, 10), Point2D(0, 10)]
+        )
+        zero = _create_zero_hole(hole)
+
+        assert len(zero) == 4
+        assert zero.closed
+        assert all(v == hole.centroid() for v in zero.vertices)
+
+    def test_constant_loop_rejects_empty(self):
+        from svan2d.primitive.vertex import VertexLoop
+
+        with pytest.raises(ValueError):
+            VertexLoop.constant(Point2D(0, 0), 0)
+
+    def test_from_points_takes_list_as_is(self):
+        from svan2d.primitive.vertex import VertexLoop
+
+        points = [Point2D(0, 0), Point2D(1, 0), Point2D(0, 1)]
+        loop = VertexLoop.from_points(points, closed=False)
+
+        assert loop.vertices == points
+        assert not loop.closed
+        with pytest.raises(ValueError):
+            VertexLoop.from_points([])